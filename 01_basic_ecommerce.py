@@ -11,7 +11,6 @@ Now includes robust error handling, geographic awareness, and fallback sites.
 
 import os
 import sys
-import time
 from typing import Dict, Any, List
 from nova_act import NovaAct
 
@@ -23,6 +22,8 @@ from demo_framework.multi_selector import SelectorBuilder
 class BasicEcommerceDemo(BaseDemo):
     """Enhanced e-commerce demo with error handling and geographic awareness."""
     
+    category = "ecommerce"
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.steps_total = 6  # Total number of steps in the demo
@@ -116,10 +117,8 @@ class BasicEcommerceDemo(BaseDemo):
             self.logger.info(f"Searching for: {search_term}")
             
             # Use natural language - Nova Act will handle the specifics
-            nova.act(f"search for {search_term}")
-            
-            # Wait a moment for results to load
-            time.sleep(2)
+            self.act(nova, f"search for {search_term}")
+            self.wait_for_page_load(nova)
             
             self.logger.log_step(1, "Product Search", "completed", f"Searched for {search_term}")
             return {"search_term": search_term, "search_completed": True}
@@ -134,10 +133,8 @@ class BasicEcommerceDemo(BaseDemo):
         
         try:
             # Select first result
-            nova.act("click on the first product in the search results")
-            
-            # Wait for product page to load
-            time.sleep(3)
+            self.act(nova, "click on the first product in the search results")
+            self.wait_for_page_load(nova)
             
             self.logger.log_step(2, "Product Selection", "completed")
             return {"product_selected": True}
@@ -146,7 +143,7 @@ class BasicEcommerceDemo(BaseDemo):
             self.logger.log_step(2, "Product Selection", "failed", str(e))
             # Try alternative selection methods
             try:
-                nova.act("select the first result")
+                self.act(nova, "select the first result")
                 return {"product_selected": True, "selection_method": "alternative"}
             except:
                 raise e
@@ -161,7 +158,7 @@ class BasicEcommerceDemo(BaseDemo):
             
             # Get product title
             try:
-                nova.act("scroll to the top of the page to see the product title")
+                self.act(nova, "scroll to the top of the page to see the product title")
                 # Note: In a real implementation, we'd extract the actual text
                 # For demo purposes, we'll simulate data extraction
                 product_data["title_visible"] = True
@@ -170,14 +167,14 @@ class BasicEcommerceDemo(BaseDemo):
             
             # Get price information
             try:
-                nova.act("look for the product price")
+                self.act(nova, "look for the product price")
                 product_data["price_visible"] = True
             except:
                 product_data["price_visible"] = False
             
             # Get product description
             try:
-                nova.act("scroll down to see product description and details")
+                self.act(nova, "scroll down to see product description and details")
                 product_data["description_visible"] = True
             except:
                 product_data["description_visible"] = False
@@ -197,10 +194,8 @@ class BasicEcommerceDemo(BaseDemo):
         
         try:
             # Try to add to cart
-            nova.act("scroll down or up until you see 'add to cart' button and then click it")
-            
-            # Wait for cart action to complete
-            time.sleep(2)
+            self.act(nova, "scroll down or up until you see 'add to cart' button and then click it")
+            self.wait_for_page_load(nova)
             
             # Check if we were successful (in a real implementation)
             cart_result = {"added_to_cart": True, "method": "primary"}
@@ -213,7 +208,7 @@ class BasicEcommerceDemo(BaseDemo):
             
             # Try alternative methods
             try:
-                nova.act("find and click the add to cart button")
+                self.act(nova, "find and click the add to cart button")
                 cart_result = {"added_to_cart": True, "method": "alternative"}
                 return {"cart_action": cart_result}
             except:
@@ -227,10 +222,8 @@ class BasicEcommerceDemo(BaseDemo):
         
         try:
             # Try to view cart
-            nova.act("click on the shopping cart icon to view the cart")
-            
-            # Wait for cart page to load
-            time.sleep(2)
+            self.act(nova, "click on the shopping cart icon to view the cart")
+            self.wait_for_page_load(nova)
             
             cart_data = {"cart_viewed": True}
             
@@ -14,7 +14,7 @@ from pydantic import BaseModel
 from nova_act import NovaAct, BOOL_SCHEMA
 
 # Import our new framework
-from demo_framework import BaseDemo, DemoResult
+from demo_framework import BaseDemo, DemoResult, StepGraph
 
 
 # Define data models for extraction
@@ -47,6 +47,8 @@ class ProductInfo(BaseModel):
 class InformationExtractionDemo(BaseDemo):
     """Enhanced information extraction demo with error handling and fallbacks."""
     
+    category = "data_extraction"
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.steps_total = 4  # Book, News, Product, Boolean extraction
@@ -77,54 +79,45 @@ class InformationExtractionDemo(BaseDemo):
     
     def execute_steps(self) -> Dict[str, Any]:
         """Execute the main demo steps."""
-        extracted_data = {}
+        # Each extraction opens its own browser and none depends on another,
+        # so they run concurrently
+        graph = StepGraph()
+        graph.add("books", self._step_extract_books, description="Book extraction completed")
+        graph.add("news", self._step_extract_news, description="News extraction completed")
+        graph.add("product", self._step_extract_product, description="Product extraction completed")
+        graph.add("boolean", self._step_boolean_extraction, description="Boolean extraction completed")
         
         try:
-            # Step 1: Extract books
-            extracted_data.update(self._step_extract_books())
-            self.increment_step("Book extraction completed")
-            
-            # Step 2: Extract news
-            extracted_data.update(self._step_extract_news())
-            self.increment_step("News extraction completed")
-            
-            # Step 3: Extract product info
-            extracted_data.update(self._step_extract_product())
-            self.increment_step("Product extraction completed")
-            
-            # Step 4: Boolean extraction
-            extracted_data.update(self._step_boolean_extraction())
-            self.increment_step("Boolean extraction completed")
-            
+            return self.run_step_graph(graph)
         except Exception as e:
             self.logger.error(f"Error during extraction: {str(e)}")
             raise
-        
-        return extracted_data
     
     def _step_extract_books(self) -> Dict[str, Any]:
         """Step 1: Extract book information."""
         self.logger.log_step(1, "Book Extraction", "starting")
         
         try:
-            with NovaAct(
-                starting_page="https://books.toscrape.com/",
+            # Only text is extracted, so the session can skip heavy assets
+            with self.extraction_session(
+                "https://books.toscrape.com/",
                 logs_directory="./demo/logs/book_extraction"
             ) as nova:
                 self.logger.info("Navigating to book catalog...")
                 
                 # Try to navigate to a category
                 try:
-                    nova.act("click on 'Travel' category")
+                    self.act(nova, "click on 'Travel' category")
                 except:
                     # If Travel category doesn't exist, try another approach
                     self.add_warning("Travel category not found, using main catalog")
                 
                 # Extract book information
                 self.logger.info("Extracting book information...")
-                result = nova.act(
+                result = self.act(nova, 
                     "Extract information about the first 5 books shown including title, author, and price",
-                    schema=BookList.model_json_schema()
+                    schema=BookList.model_json_schema(),
+                    cache=True
                 )
                 
                 if result.matches_schema:
@@ -152,8 +145,8 @@ class InformationExtractionDemo(BaseDemo):
             try:
                 self.logger.info(f"Trying news site: {site}")
                 
-                with NovaAct(
-                    starting_page=site,
+                with self.extraction_session(
+                    site,
                     logs_directory="./demo/logs/news_extraction"
                 ) as nova:
                     
@@ -165,7 +158,8 @@ class InformationExtractionDemo(BaseDemo):
                     else:
                         extraction_prompt = "Extract news headlines and summaries from the main page"
                     
-                    result = nova.act(extraction_prompt, schema=NewsCollection.model_json_schema())
+                    result = self.act(nova, extraction_prompt, schema=NewsCollection.model_json_schema(),
+                                      cache=True)
                     
                     if result.matches_schema:
                         news_collection = NewsCollection.model_validate(result.parsed_response)
@@ -196,22 +190,23 @@ class InformationExtractionDemo(BaseDemo):
             try:
                 self.logger.info(f"Trying e-commerce site: {site}")
                 
-                with NovaAct(
-                    starting_page=site,
+                with self.extraction_session(
+                    site,
                     logs_directory="./demo/logs/product_extraction"
                 ) as nova:
                     
                     # Search for a product
                     search_term = "laptop"
-                    nova.act(f"search for {search_term}")
+                    self.act(nova, f"search for {search_term}")
                     
                     # Select first result
-                    nova.act("click on the first product result")
+                    self.act(nova, "click on the first product result")
                     
                     # Extract product information
-                    result = nova.act(
+                    result = self.act(nova, 
                         "Extract the product name, price, rating, availability status, and a brief description",
-                        schema=ProductInfo.model_json_schema()
+                        schema=ProductInfo.model_json_schema(),
+                        cache=True
                     )
                     
                     if result.matches_schema:
@@ -238,8 +233,8 @@ class InformationExtractionDemo(BaseDemo):
         
         try:
             # Use a simple, reliable site for boolean extraction
-            with NovaAct(
-                starting_page="https://example.com",
+            with self.extraction_session(
+                "https://example.com",
                 logs_directory="./demo/logs/boolean_extraction"
             ) as nova:
                 
@@ -254,7 +249,7 @@ class InformationExtractionDemo(BaseDemo):
                 
                 for i, question in enumerate(questions):
                     try:
-                        result = nova.act(question, schema=BOOL_SCHEMA)
+                        result = self.act(nova, question, schema=BOOL_SCHEMA)
                         if result.matches_schema:
                             boolean_results[f"question_{i+1}"] = {
                                 "question": question,
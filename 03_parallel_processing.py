@@ -10,13 +10,15 @@ with robust error handling and geographic awareness.
 import os
 import sys
 import time
+import asyncio
 from typing import Dict, Any, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from nova_act import NovaAct, ActError
+from nova_act import ActError
 from pydantic import BaseModel
 
 # Import our enhanced framework
-from demo_framework import BaseDemo, DemoResult
+from demo_framework import (
+    AsyncBaseDemo, DemoResult, SessionPool, AdaptiveLimiter, MemoryWatchdog, cached_step
+)
 
 
 class ProductInfo(BaseModel):
@@ -27,14 +29,18 @@ class ProductInfo(BaseModel):
     rating: str = "N/A"
 
 
-class ParallelProcessingDemo(BaseDemo):
+class ParallelProcessingDemo(AsyncBaseDemo):
     """Enhanced parallel processing demo with error handling and site validation."""
     
+    category = "advanced"
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.steps_total = 4  # Setup, Site validation, Parallel execution, Results aggregation
+        self.session_pool = None
+        self.memory_watchdog = None
         
-    def setup(self) -> bool:
+    async def setup(self) -> bool:
         """Setup demo environment and validate prerequisites."""
         self.logger.info("Setting up Parallel Processing Demo")
         
@@ -43,13 +49,44 @@ class ParallelProcessingDemo(BaseDemo):
             self.logger.error("NOVA_ACT_API_KEY environment variable not set")
             return False
         
+        # Searches in flight start at 2 and adapt to how the sites respond,
+        # up to max_browsers; every action reports back through self.act
+        self.concurrency = AdaptiveLimiter(
+            initial=2,
+            maximum=self.max_browsers,
+            on_change=lambda limit: self.logger.log_performance_metric(
+                "concurrency_limit", limit, "browsers"
+            )
+        )
+        
+        # Warm headless browsers shared by the searches, at most max_browsers open,
+        # replaced between searches when they age out or grow past the memory limit
+        self.memory_watchdog = MemoryWatchdog(limit_mb=self.config.get("browser_memory_limit_mb", 1500))
+        self.session_pool = SessionPool(
+            size=self.max_browsers,
+            max_uses=self.config.get("session_max_uses", 20),
+            max_acts=self.config.get("session_max_acts", 200),
+            act=self.act,
+            watchdog=self.memory_watchdog,
+            on_recycle=self.record_recycle,
+            logs_directory="./demo/logs/parallel"
+        )
+        
         return True
     
+    async def cleanup(self) -> None:
+        """Close the pooled browser sessions."""
+        if self.session_pool is not None:
+            await self.run_blocking(self.session_pool.close)
+        if self.memory_watchdog is not None:
+            self.memory_watchdog.stop()
+        await super().cleanup()
+    
     def get_fallback_sites(self) -> List[str]:
         """Get fallback sites for parallel processing."""
         return ["https://example.com", "https://httpbin.org/html"]
     
-    def execute_steps(self) -> Dict[str, Any]:
+    async def execute_steps(self) -> Dict[str, Any]:
         """Execute the main demo steps."""
         extracted_data = {}
         
@@ -60,12 +97,12 @@ class ParallelProcessingDemo(BaseDemo):
             self.increment_step("Site selection completed")
             
             # Step 2: Validate site accessibility
-            validated_sites = self._step_validate_sites(sites["sites"])
+            validated_sites = await self._step_validate_sites(sites["sites"])
             extracted_data.update(validated_sites)
             self.increment_step("Site validation completed")
             
             # Step 3: Run parallel searches
-            search_results = self._step_parallel_search(validated_sites["accessible_sites"])
+            search_results = await self._step_parallel_search(validated_sites["accessible_sites"])
             extracted_data.update(search_results)
             self.increment_step("Parallel search completed")
             
@@ -80,6 +117,7 @@ class ParallelProcessingDemo(BaseDemo):
         
         return extracted_data
     
+    @cached_step()
     def _step_get_sites(self) -> Dict[str, Any]:
         """Step 1: Get optimal sites for user's region."""
         self.logger.log_step(1, "Site Selection", "starting")
@@ -95,15 +133,20 @@ class ParallelProcessingDemo(BaseDemo):
         
         return {"sites": selected_sites}
     
-    def _step_validate_sites(self, sites: List[str]) -> Dict[str, Any]:
+    # Not cached: whether a site is reachable changes from run to run
+    async def _step_validate_sites(self, sites: List[str]) -> Dict[str, Any]:
         """Step 2: Validate site accessibility."""
         self.logger.log_step(2, "Site Validation", "starting")
         
         accessible_sites = []
         validation_results = {}
         
-        for site in sites:
-            is_accessible = self.config_manager.validate_site_access(site)
+        # Check all sites at once instead of one after another
+        checks = await asyncio.gather(
+            *(self.run_blocking(self.config_manager.validate_site_access, site) for site in sites)
+        )
+        
+        for site, is_accessible in zip(sites, checks):
             validation_results[site] = is_accessible
             
             if is_accessible:
@@ -125,60 +168,59 @@ class ParallelProcessingDemo(BaseDemo):
             "validation_results": validation_results
         }
     
-    def _step_parallel_search(self, sites: List[str]) -> Dict[str, Any]:
+    async def _step_parallel_search(self, sites: List[str]) -> Dict[str, Any]:
         """Step 3: Run parallel searches across multiple sites."""
         self.logger.log_step(3, "Parallel Search", "starting")
         
         search_term = "laptop"
         results = []
         
-        # Use ThreadPoolExecutor for parallel execution
-        max_workers = min(len(sites), 3)  # Limit concurrent sessions
+        # Searches interleave on the event loop, each with its own browser thread,
+        # as many at once as the concurrency limiter currently allows
+        async def search(site: str):
+            async with self.concurrency.async_slot(record=False):
+                # 60 second timeout per site, never past the demo's deadline
+                return site, await asyncio.wait_for(
+                    self._search_single_site(site, search_term), timeout=self.deadline.timeout(60)
+                )
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit search tasks
-            future_to_site = {
-                executor.submit(self._search_single_site, site, search_term): site 
-                for site in sites
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_site.keys()):
-                site = future_to_site[future]
-                try:
-                    result = future.result(timeout=60)  # 60 second timeout per site
-                    if result:
-                        results.append(result)
-                        self.logger.info(f"✅ Search completed on {site}")
-                    else:
-                        self.logger.warning(f"⚠️ No results from {site}")
-                        
-                except Exception as e:
-                    self.logger.error(f"❌ Search failed on {site}: {str(e)}")
-                    # Continue with other sites
-                    continue
+        # Collect results as they complete
+        for next_done in asyncio.as_completed([search(site) for site in sites]):
+            try:
+                site, result = await next_done
+                if result:
+                    results.append(result)
+                    self.logger.info(f"✅ Search completed on {site}")
+                else:
+                    self.logger.warning(f"⚠️ No results from {site}")
+                    
+            except Exception as e:
+                self.logger.error(f"❌ Search failed: {type(e).__name__}: {str(e)}")
+                # Continue with other sites
+                continue
         
         self.logger.log_step(3, "Parallel Search", "completed", f"Got results from {len(results)} sites")
         self.logger.log_data_extraction("search_results", {"results": results}, "parallel_search")
         
-        return {"results": results, "search_term": search_term}
+        return {
+            "results": results,
+            "search_term": search_term,
+            "concurrency": self.concurrency.snapshot()
+        }
     
-    def _search_single_site(self, site: str, search_term: str) -> Dict[str, Any]:
+    async def _search_single_site(self, site: str, search_term: str) -> Dict[str, Any]:
         """Search for a product on a single site."""
         try:
-            with NovaAct(
-                starting_page=site,
-                logs_directory=f"./demo/logs/parallel_{site.replace('https://', '').replace('.', '_')}",
-                headless=True  # Use headless for parallel execution
-            ) as nova:
+            # Borrow a warm browser, already pointed at the site
+            async with self.session_pool.async_session(site) as session:
                 
                 # Search for the product
-                nova.act(f"search for {search_term}")
+                await session.act_async(f"search for {search_term}")
                 
                 # Try to get first result info
                 try:
                     # Simple approach - just get visible text from first result
-                    nova.act("click on the first search result or product")
+                    await session.act_async("click on the first search result or product")
                     
                     # Extract basic product info
                     result = {
@@ -308,7 +350,7 @@ def main():
     if result.success:
         print("\n🎉 Parallel processing demo completed successfully!")
         print("This demo showcased:")
-        print("  • Concurrent browser sessions with ThreadPoolExecutor")
+        print("  • Concurrent browser sessions on one asyncio event loop")
         print("  • Site accessibility validation before parallel execution")
         print("  • Error handling for individual site failures")
         print("  • Results aggregation from multiple sources")
@@ -15,12 +15,14 @@ from getpass import getpass
 from nova_act import NovaAct, BOOL_SCHEMA
 
 # Import our enhanced framework
-from demo_framework import BaseDemo, DemoResult
+from demo_framework import BaseDemo, DemoResult, cached_step
 
 
 class AuthenticationDemo(BaseDemo):
     """Enhanced authentication demo with session persistence and security."""
     
+    category = "authentication"
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.steps_total = 5  # Setup, Session check, Login, Verification, Session persistence
@@ -87,6 +89,7 @@ class AuthenticationDemo(BaseDemo):
         
         return extracted_data
     
+    @cached_step()
     def _step_choose_site(self) -> Dict[str, Any]:
         """Step 1: Choose appropriate site for authentication demo."""
         self.logger.log_step(1, "Site Selection", "starting")
@@ -150,7 +153,7 @@ class AuthenticationDemo(BaseDemo):
                     already_authenticated = True
                 else:
                     # Generic check - look for login indicators
-                    result = nova.act("Is there a login or sign in button visible?", schema=BOOL_SCHEMA)
+                    result = self.act(nova, "Is there a login or sign in button visible?", schema=BOOL_SCHEMA)
                     already_authenticated = not (result.matches_schema and result.parsed_response)
                 
                 session_data = {
@@ -217,9 +220,9 @@ class AuthenticationDemo(BaseDemo):
         """Handle form-based authentication."""
         try:
             # For HTTPBin form demo, we'll just fill out the form
-            nova.act("fill in the customer name field with 'Demo User'")
-            nova.act("fill in the telephone field with '555-0123'")
-            nova.act("fill in the email field with 'demo@example.com'")
+            self.act(nova, "fill in the customer name field with 'Demo User'")
+            self.act(nova, "fill in the telephone field with '555-0123'")
+            self.act(nova, "fill in the email field with 'demo@example.com'")
             
             # Don't actually submit for demo purposes
             self.add_warning("Form filled but not submitted for demo safety")
@@ -241,11 +244,11 @@ class AuthenticationDemo(BaseDemo):
         """Handle generic authentication."""
         try:
             # Look for login elements
-            result = nova.act("Is there a login or sign in button?", schema=BOOL_SCHEMA)
+            result = self.act(nova, "Is there a login or sign in button?", schema=BOOL_SCHEMA)
             
             if result.matches_schema and result.parsed_response:
                 # Found login button
-                nova.act("click on the login or sign in button")
+                self.act(nova, "click on the login or sign in button")
                 
                 # For demo purposes, we won't actually enter credentials
                 self.add_warning("Login form found but credentials not entered for demo safety")
@@ -290,7 +293,7 @@ class AuthenticationDemo(BaseDemo):
                 # Site-specific verification
                 if site_info.get("type") == "simple_form":
                     # Check if form is still accessible
-                    result = nova.act("Can you see the form fields?", schema=BOOL_SCHEMA)
+                    result = self.act(nova, "Can you see the form fields?", schema=BOOL_SCHEMA)
                     verification_result["form_accessible"] = result.matches_schema and result.parsed_response
                 
                 self.logger.log_step(4, "Authentication Verification", "completed", "Site accessible")
@@ -330,7 +333,7 @@ class AuthenticationDemo(BaseDemo):
                 }
                 
                 # Check if we can still access the site
-                result = nova.act("What is the main heading or title of this page?")
+                result = self.act(nova, "What is the main heading or title of this page?")
                 persistence_result["page_title_accessible"] = bool(result.response)
                 
                 self.logger.log_step(5, "Session Persistence Test", "completed", 
@@ -17,12 +17,14 @@ from pathlib import Path
 from nova_act import NovaAct
 
 # Import our enhanced framework
-from demo_framework import BaseDemo, DemoResult
+from demo_framework import BaseDemo, DemoResult, cached_step
 
 
 class FileOperationsDemo(BaseDemo):
     """Enhanced file operations demo with validation and error handling."""
     
+    category = "file_handling"
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.steps_total = 6  # Setup, Create test files, Upload test, Download test, File validation, Cleanup
@@ -155,6 +157,7 @@ class FileOperationsDemo(BaseDemo):
             self.logger.log_step(1, "Test Files Creation", "failed", str(e))
             return {"created_files": [], "creation_error": str(e)}
     
+    @cached_step()
     def _step_choose_file_site(self) -> Dict[str, Any]:
         """Step 2: Choose appropriate site for file operations."""
         self.logger.log_step(2, "File Site Selection", "starting")
@@ -227,7 +230,6 @@ class FileOperationsDemo(BaseDemo):
                     for file_path in test_files[:2]:  # Upload first 2 files
                         upload_result = self._handle_file_sharing_upload(nova, file_path)
                         upload_results.append(upload_result)
-                        time.sleep(1)  # Brief pause between uploads
                 
                 else:
                     # Generic upload handling
@@ -249,13 +251,13 @@ class FileOperationsDemo(BaseDemo):
         """Handle form-based file upload."""
         try:
             # Look for file input
-            nova.act("look for a file upload input or browse button")
+            self.act(nova, "look for a file upload input or browse button")
             
             # Use Playwright to set the file
             nova.page.set_input_files('input[type="file"]', file_path)
             
             # Fill other form fields if present
-            nova.act("if there are other form fields, fill them with test data")
+            self.act(nova, "if there are other form fields, fill them with test data")
             
             # For demo safety, don't actually submit
             self.add_warning("File selected but form not submitted for demo safety")
@@ -279,7 +281,7 @@ class FileOperationsDemo(BaseDemo):
         """Handle file sharing service upload."""
         try:
             # Look for upload area
-            nova.act("look for an upload area, drag and drop zone, or upload button")
+            self.act(nova, "look for an upload area, drag and drop zone, or upload button")
             
             # Try to find file input
             file_inputs = nova.page.query_selector_all('input[type="file"]')
@@ -287,7 +289,7 @@ class FileOperationsDemo(BaseDemo):
                 file_inputs[0].set_input_files(file_path)
                 
                 # Wait for upload to process
-                nova.act("wait for the upload to complete or show progress")
+                self.act(nova, "wait for the upload to complete or show progress")
                 
                 return {
                     "success": True,
@@ -315,7 +317,7 @@ class FileOperationsDemo(BaseDemo):
         """Handle generic file upload."""
         try:
             # Generic approach
-            nova.act("look for any file upload functionality on this page")
+            self.act(nova, "look for any file upload functionality on this page")
             
             # Try to find and use file input
             try:
@@ -356,12 +358,12 @@ class FileOperationsDemo(BaseDemo):
                 download_results = []
                 
                 # Look for downloadable content
-                nova.act("look for any downloadable files or download links")
+                self.act(nova, "look for any downloadable files or download links")
                 
                 # Try to download using Playwright
                 try:
                     with nova.page.expect_download() as download_info:
-                        nova.act("click on a download link or button if available")
+                        self.act(nova, "click on a download link or button if available")
                     
                     # Save the downloaded file
                     download_path = os.path.join(self.downloads_dir, "downloaded_file")
@@ -9,18 +9,19 @@ including adaptive field detection, validation, and error recovery.
 
 import os
 import sys
-import time
 from typing import Dict, Any, List
-from nova_act import NovaAct, BOOL_SCHEMA
+from nova_act import BOOL_SCHEMA
 
 # Import our enhanced framework
-from demo_framework import BaseDemo, DemoResult
+from demo_framework import BaseDemo, DemoResult, cached_step
 from demo_framework.multi_selector import SelectorBuilder
 
 
 class FormFillingDemo(BaseDemo):
     """Enhanced form filling demo with adaptive field detection."""
     
+    category = "forms"
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.steps_total = 5  # Setup, Form site selection, Field detection, Form filling, Validation
@@ -80,6 +81,7 @@ class FormFillingDemo(BaseDemo):
         
         return extracted_data
     
+    @cached_step()
     def _step_choose_form_site(self) -> Dict[str, Any]:
         """Step 1: Choose appropriate site for form filling demo."""
         self.logger.log_step(1, "Form Site Selection", "starting")
@@ -128,9 +130,9 @@ class FormFillingDemo(BaseDemo):
         self.logger.log_step(2, "Form Analysis", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/form_analysis"
+            with self.session(
+                site_info["url"],
+                logs_directory="./demo/logs/form_filling"
             ) as nova:
                 
                 # Detect form fields using multiple strategies
@@ -268,7 +270,7 @@ class FormFillingDemo(BaseDemo):
         
         try:
             # Ask Nova Act to describe the form
-            result = nova.act("What form fields are visible on this page? List them briefly.")
+            result = self.act(nova, "What form fields are visible on this page? List them briefly.")
             
             if result.response:
                 # Parse the response to extract field information
@@ -322,8 +324,8 @@ class FormFillingDemo(BaseDemo):
             return {"form_filling": {"skipped": True, "reason": "no_fields"}}
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
+            with self.session(
+                site_info["url"],
                 logs_directory="./demo/logs/form_filling"
             ) as nova:
                 
@@ -344,9 +346,6 @@ class FormFillingDemo(BaseDemo):
                     field_name = field.get("name", "unknown")
                     field_result = self._fill_single_field(nova, field, test_data.get(field_name, f"Test {field_name}"))
                     filling_results.append(field_result)
-                    
-                    # Brief pause between field fills
-                    time.sleep(0.5)
                 
                 successful_fills = len([r for r in filling_results if r.get("success", False)])
                 
@@ -388,13 +387,13 @@ class FormFillingDemo(BaseDemo):
             # Strategy 2: Use Nova Act natural language
             try:
                 if field.get("input_type") == "email":
-                    nova.act(f"fill in the email field with {value}")
+                    self.act(nova, f"fill in the email field with {value}")
                 elif field.get("input_type") == "tel":
-                    nova.act(f"fill in the phone number field with {value}")
+                    self.act(nova, f"fill in the phone number field with {value}")
                 elif field_name == "message" or field.get("type") == "playwright_textarea":
-                    nova.act(f"fill in the message or comment field with: {value}")
+                    self.act(nova, f"fill in the message or comment field with: {value}")
                 else:
-                    nova.act(f"fill in the {field_name} field with {value}")
+                    self.act(nova, f"fill in the {field_name} field with {value}")
                 
                 return {
                     "field": field_name,
@@ -406,7 +405,7 @@ class FormFillingDemo(BaseDemo):
             except Exception as e:
                 # Strategy 3: Generic field filling
                 try:
-                    nova.act(f"find and fill any field related to {field_name} with {value}")
+                    self.act(nova, f"find and fill any field related to {field_name} with {value}")
                     return {
                         "field": field_name,
                         "success": True,
@@ -434,15 +433,15 @@ class FormFillingDemo(BaseDemo):
         self.logger.log_step(4, "Form Validation", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/form_validation"
+            with self.session(
+                site_info["url"],
+                logs_directory="./demo/logs/form_filling"
             ) as nova:
                 
                 validation_results = []
                 
                 # Check if form appears to be filled
-                result = nova.act("Are the form fields filled with data?", schema=BOOL_SCHEMA)
+                result = self.act(nova, "Are the form fields filled with data?", schema=BOOL_SCHEMA)
                 form_filled = result.matches_schema and result.parsed_response
                 
                 validation_results.append({
@@ -452,7 +451,7 @@ class FormFillingDemo(BaseDemo):
                 })
                 
                 # Check for validation errors
-                result = nova.act("Are there any validation errors or error messages visible?", schema=BOOL_SCHEMA)
+                result = self.act(nova, "Are there any validation errors or error messages visible?", schema=BOOL_SCHEMA)
                 has_errors = result.matches_schema and result.parsed_response
                 
                 validation_results.append({
@@ -462,7 +461,7 @@ class FormFillingDemo(BaseDemo):
                 })
                 
                 # Check if submit button is enabled
-                result = nova.act("Is the submit button enabled and clickable?", schema=BOOL_SCHEMA)
+                result = self.act(nova, "Is the submit button enabled and clickable?", schema=BOOL_SCHEMA)
                 submit_enabled = result.matches_schema and result.parsed_response
                 
                 validation_results.append({
@@ -493,13 +492,13 @@ class FormFillingDemo(BaseDemo):
         self.logger.log_step(5, "Form Submission", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/form_submission"
+            with self.session(
+                site_info["url"],
+                logs_directory="./demo/logs/form_filling"
             ) as nova:
                 
                 # Look for submit button
-                result = nova.act("Can you see a submit button or send button?", schema=BOOL_SCHEMA)
+                result = self.act(nova, "Can you see a submit button or send button?", schema=BOOL_SCHEMA)
                 submit_button_found = result.matches_schema and result.parsed_response
                 
                 submission_result = {
@@ -511,7 +510,7 @@ class FormFillingDemo(BaseDemo):
                 
                 if submit_button_found:
                     # For demo purposes, just identify the button but don't click it
-                    nova.act("locate the submit button but do not click it")
+                    self.act(nova, "locate the submit button but do not click it")
                     self.add_warning("Submit button found but not clicked for demo safety")
                 else:
                     self.add_warning("No submit button found on the form")
@@ -9,13 +9,12 @@ including multi-criteria filtering, sorting, and result refinement.
 
 import os
 import sys
-import time
 from typing import Dict, Any, List
-from nova_act import NovaAct, BOOL_SCHEMA
+from nova_act import BOOL_SCHEMA
 from pydantic import BaseModel
 
 # Import our enhanced framework
-from demo_framework import BaseDemo, DemoResult
+from demo_framework import BaseDemo, BatchQuery, DemoResult, cached_step
 from demo_framework.multi_selector import SelectorBuilder
 
 
@@ -30,6 +29,8 @@ class SearchResult(BaseModel):
 class SearchFilterDemo(BaseDemo):
     """Enhanced search and filter demo with multi-criteria filtering."""
     
+    category = "ecommerce"
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.steps_total = 6  # Setup, Site selection, Search, Filter, Sort, Results extraction
@@ -93,6 +94,7 @@ class SearchFilterDemo(BaseDemo):
         
         return extracted_data
     
+    @cached_step()
     def _step_choose_search_site(self) -> Dict[str, Any]:
         """Step 1: Choose appropriate site for search and filter demo."""
         self.logger.log_step(1, "Search Site Selection", "starting")
@@ -130,6 +132,14 @@ class SearchFilterDemo(BaseDemo):
         
         return {"target_site": target_site}
     
+    def _show_search_results(self, nova, site_info: Dict[str, Any], search_term: str = "laptop"):
+        """Search for a term unless the shared session already shows its results."""
+        state = self.sessions.state(site_info["url"])
+        if state.get("searched_term") != search_term:
+            self.act(nova, f"search for {search_term}")
+            self.wait_for_page_load(nova)
+            state["searched_term"] = search_term
+    
     def _step_perform_search(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 2: Perform initial search."""
         self.logger.log_step(2, "Initial Search", "starting")
@@ -137,19 +147,16 @@ class SearchFilterDemo(BaseDemo):
         search_term = "laptop"
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/search_initial"
+            with self.session(
+                site_info["url"],
+                logs_directory="./demo/logs/search_filter"
             ) as nova:
                 
                 # Perform search
-                nova.act(f"search for {search_term}")
-                
-                # Wait for results to load
-                time.sleep(3)
+                self._show_search_results(nova, site_info, search_term)
                 
                 # Check if search was successful
-                result = nova.act("Are there search results visible on the page?", schema=BOOL_SCHEMA)
+                result = self.act(nova, "Are there search results visible on the page?", schema=BOOL_SCHEMA)
                 search_successful = result.matches_schema and result.parsed_response
                 
                 # Get approximate result count
@@ -157,7 +164,7 @@ class SearchFilterDemo(BaseDemo):
                 if search_successful:
                     try:
                         # Try to get result count (simplified approach)
-                        nova.act("look at the search results")
+                        self.act(nova, "look at the search results")
                         result_count = "multiple"  # Simplified for demo
                     except:
                         result_count = "unknown"
@@ -194,27 +201,26 @@ class SearchFilterDemo(BaseDemo):
             return {"filter_result": {"skipped": True, "reason": "not_supported"}}
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/search_filters"
+            with self.session(
+                site_info["url"],
+                logs_directory="./demo/logs/search_filter"
             ) as nova:
                 
-                # Re-perform search to ensure we're on results page
-                nova.act("search for laptop")
-                time.sleep(2)
+                # Search again only if the session is not showing the results yet
+                self._show_search_results(nova, site_info)
                 
                 applied_filters = []
                 
                 # Try to apply price filter
                 try:
-                    nova.act("look for price filters or price range options")
-                    nova.act("if there are price filters, select a reasonable price range")
+                    self.act(nova, "look for price filters or price range options")
+                    self.act(nova, "if there are price filters, select a reasonable price range")
+                    self.wait_for_page_load(nova)
                     applied_filters.append({
                         "type": "price",
                         "applied": True,
                         "method": "price_range"
                     })
-                    time.sleep(1)
                 except Exception as e:
                     applied_filters.append({
                         "type": "price",
@@ -224,13 +230,13 @@ class SearchFilterDemo(BaseDemo):
                 
                 # Try to apply brand filter
                 try:
-                    nova.act("look for brand filters and select a popular brand if available")
+                    self.act(nova, "look for brand filters and select a popular brand if available")
+                    self.wait_for_page_load(nova)
                     applied_filters.append({
                         "type": "brand",
                         "applied": True,
                         "method": "brand_selection"
                     })
-                    time.sleep(1)
                 except Exception as e:
                     applied_filters.append({
                         "type": "brand",
@@ -240,13 +246,13 @@ class SearchFilterDemo(BaseDemo):
                 
                 # Try to apply rating filter
                 try:
-                    nova.act("look for customer rating filters and select 4 stars and up if available")
+                    self.act(nova, "look for customer rating filters and select 4 stars and up if available")
+                    self.wait_for_page_load(nova)
                     applied_filters.append({
                         "type": "rating",
                         "applied": True,
                         "method": "rating_filter"
                     })
-                    time.sleep(1)
                 except Exception as e:
                     applied_filters.append({
                         "type": "rating",
@@ -256,13 +262,13 @@ class SearchFilterDemo(BaseDemo):
                 
                 # Try to apply availability filter
                 try:
-                    nova.act("look for availability filters and select 'in stock' if available")
+                    self.act(nova, "look for availability filters and select 'in stock' if available")
+                    self.wait_for_page_load(nova)
                     applied_filters.append({
                         "type": "availability",
                         "applied": True,
                         "method": "stock_filter"
                     })
-                    time.sleep(1)
                 except Exception as e:
                     applied_filters.append({
                         "type": "availability",
@@ -297,14 +303,13 @@ class SearchFilterDemo(BaseDemo):
             return {"sort_result": {"skipped": True, "reason": "not_supported"}}
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/search_sorting"
+            with self.session(
+                site_info["url"],
+                logs_directory="./demo/logs/search_filter"
             ) as nova:
                 
-                # Re-perform search to ensure we're on results page
-                nova.act("search for laptop")
-                time.sleep(2)
+                # Search again only if the session is not showing the results yet
+                self._show_search_results(nova, site_info)
                 
                 sort_attempts = []
                 
@@ -319,11 +324,11 @@ class SearchFilterDemo(BaseDemo):
                 
                 for sort_option in sort_options[:2]:  # Try first 2 options
                     try:
-                        nova.act(f"look for sorting options and {sort_option['instruction']}")
-                        time.sleep(2)
+                        self.act(nova, f"look for sorting options and {sort_option['instruction']}")
+                        self.wait_for_page_load(nova)
                         
                         # Check if sorting was applied
-                        result = nova.act("Did the page refresh or change after sorting?", schema=BOOL_SCHEMA)
+                        result = self.act(nova, "Did the page refresh or change after sorting?", schema=BOOL_SCHEMA)
                         sort_applied = result.matches_schema and result.parsed_response
                         
                         sort_attempts.append({
@@ -365,23 +370,25 @@ class SearchFilterDemo(BaseDemo):
         self.logger.log_step(5, "Search Refinement", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/search_refinement"
+            with self.session(
+                site_info["url"],
+                logs_directory="./demo/logs/search_filter"
             ) as nova:
                 
-                # Re-perform search
-                nova.act("search for laptop")
-                time.sleep(2)
+                # Search again only if the session is not showing the results yet
+                self._show_search_results(nova, site_info)
                 
                 refinement_attempts = []
                 
+                # Refining changes the query, later steps have to search again
+                self.sessions.state(site_info["url"]).pop("searched_term", None)
+                
                 # Try to refine search with more specific terms
                 try:
-                    nova.act("refine the search by adding more specific terms like 'gaming laptop' or 'business laptop'")
-                    time.sleep(2)
+                    self.act(nova, "refine the search by adding more specific terms like 'gaming laptop' or 'business laptop'")
+                    self.wait_for_page_load(nova)
                     
-                    result = nova.act("Are the search results more specific now?", schema=BOOL_SCHEMA)
+                    result = self.act(nova, "Are the search results more specific now?", schema=BOOL_SCHEMA)
                     refinement_successful = result.matches_schema and result.parsed_response
                     
                     refinement_attempts.append({
@@ -399,8 +406,8 @@ class SearchFilterDemo(BaseDemo):
                 
                 # Try to use search suggestions
                 try:
-                    nova.act("look for search suggestions or related searches and try one")
-                    time.sleep(2)
+                    self.act(nova, "look for search suggestions or related searches and try one")
+                    self.wait_for_page_load(nova)
                     
                     refinement_attempts.append({
                         "type": "suggestions",
@@ -438,14 +445,13 @@ class SearchFilterDemo(BaseDemo):
         self.logger.log_step(6, "Results Extraction", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/search_extraction"
+            with self.session(
+                site_info["url"],
+                logs_directory="./demo/logs/search_filter"
             ) as nova:
                 
-                # Re-perform search to ensure we have results
-                nova.act("search for laptop")
-                time.sleep(3)
+                # Search again only if the session is not showing the results yet
+                self._show_search_results(nova, site_info)
                 
                 # Extract result information
                 extraction_data = {
@@ -454,27 +460,31 @@ class SearchFilterDemo(BaseDemo):
                 }
                 
                 try:
-                    # Get basic information about search results
-                    result = nova.act("How many search results are visible on this page?")
-                    if result.response:
-                        extraction_data["result_count_description"] = result.response
+                    # Ask about the results on the page in a single act
+                    ordinals = ["1st", "2nd", "3rd"]  # Try to get info about first 3 results
+                    query = BatchQuery(act=self.act)
+                    query.add("result_count", "How many search results are visible on this page?")
+                    for i, ordinal in enumerate(ordinals, 1):
+                        query.add(f"result_{i}", f"What is the title and price of the {ordinal} search result?")
+                    query.add("results_relevant", "Do the search results appear to be relevant to laptops?", BOOL_SCHEMA)
+                    answers = query.run(nova)
+                    
+                    if answers["result_count"].response:
+                        extraction_data["result_count_description"] = answers["result_count"].response
                     
-                    # Try to get information about first few results
-                    for i in range(1, 4):  # Try to get info about first 3 results
-                        try:
-                            result = nova.act(f"What is the title and price of the {i}{'st' if i==1 else 'nd' if i==2 else 'rd'} search result?")
-                            if result.response:
-                                extraction_data["results"].append({
-                                    "position": i,
-                                    "description": result.response,
-                                    "extraction_method": "natural_language"
-                                })
-                        except:
-                            continue
+                    for i in range(1, len(ordinals) + 1):
+                        answer = answers[f"result_{i}"]
+                        if answer.matches_schema and answer.response:
+                            extraction_data["results"].append({
+                                "position": i,
+                                "description": answer.response,
+                                "extraction_method": "natural_language"
+                            })
                     
                     # Check if results seem relevant
-                    result = nova.act("Do the search results appear to be relevant to laptops?", schema=BOOL_SCHEMA)
-                    extraction_data["results_relevant"] = result.matches_schema and result.parsed_response
+                    answer = answers["results_relevant"]
+                    extraction_data["results_relevant"] = answer.matches_schema and answer.parsed_response
+                    extraction_data["acts_used"] = query.acts
                     
                 except Exception as e:
                     extraction_data["extraction_error"] = str(e)
@@ -9,13 +9,12 @@ filtering, transportation analysis, and comprehensive property data extraction.
 
 import os
 import sys
-import time
 from typing import Dict, Any, List
-from nova_act import NovaAct, BOOL_SCHEMA
+from nova_act import BOOL_SCHEMA
 from pydantic import BaseModel
 
 # Import our enhanced framework
-from demo_framework import BaseDemo, DemoResult
+from demo_framework import BaseDemo, BatchQuery, DemoResult, cached_step
 
 
 class PropertyInfo(BaseModel):
@@ -31,6 +30,8 @@ class PropertyInfo(BaseModel):
 class RealEstateDemo(BaseDemo):
     """Enhanced real estate demo with location awareness and transportation analysis."""
     
+    category = "real_estate"
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.steps_total = 6  # Setup, Site selection, Location search, Property filtering, Transportation analysis, Data extraction
@@ -94,6 +95,7 @@ class RealEstateDemo(BaseDemo):
         
         return extracted_data
     
+    @cached_step()
     def _step_choose_real_estate_site(self) -> Dict[str, Any]:
         """Step 1: Choose appropriate real estate site based on user's region."""
         self.logger.log_step(1, "Real Estate Site Selection", "starting")
@@ -162,6 +164,15 @@ class RealEstateDemo(BaseDemo):
         else:
             return region_locations
     
+    def _show_search_results(self, nova, site_info: Dict[str, Any]):
+        """Search for the first location unless the shared session already shows its results."""
+        location = site_info.get("search_locations", ["City Center"])[0]
+        state = self.sessions.state(site_info["url"])
+        if state.get("searched_location") != location:
+            self.act(nova, f"search for properties in {location}")
+            self.wait_for_page_load(nova)
+            state["searched_location"] = location
+    
     def _step_set_search_location(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 2: Set search location for property search."""
         self.logger.log_step(2, "Search Location Setup", "starting")
@@ -174,17 +185,16 @@ class RealEstateDemo(BaseDemo):
             return {"location_result": {"skipped": True, "reason": "fallback_site"}}
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/real_estate_location"
+            with self.session(
+                site_info["url"],
+                logs_directory="./demo/logs/real_estate"
             ) as nova:
                 
                 # Set search location
-                nova.act(f"search for properties in {selected_location}")
-                time.sleep(3)
+                self._show_search_results(nova, site_info)
                 
                 # Verify location was set
-                result = nova.act("Are property listings visible for the searched location?", schema=BOOL_SCHEMA)
+                result = self.act(nova, "Are property listings visible for the searched location?", schema=BOOL_SCHEMA)
                 location_set = result.matches_schema and result.parsed_response
                 
                 location_data = {
@@ -219,27 +229,25 @@ class RealEstateDemo(BaseDemo):
             return {"filter_result": {"skipped": True, "reason": "not_supported"}}
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/real_estate_filters"
+            with self.session(
+                site_info["url"],
+                logs_directory="./demo/logs/real_estate"
             ) as nova:
                 
-                # Re-search to ensure we're on results page
-                search_locations = site_info.get("search_locations", ["City Center"])
-                nova.act(f"search for properties in {search_locations[0]}")
-                time.sleep(2)
+                # Search again only if the session is not showing the results yet
+                self._show_search_results(nova, site_info)
                 
                 applied_filters = []
                 
                 # Apply price filter
                 try:
-                    nova.act("look for price filters and set a reasonable price range")
+                    self.act(nova, "look for price filters and set a reasonable price range")
+                    self.wait_for_page_load(nova)
                     applied_filters.append({
                         "type": "price_range",
                         "applied": True,
                         "method": "price_filter"
                     })
-                    time.sleep(1)
                 except Exception as e:
                     applied_filters.append({
                         "type": "price_range",
@@ -249,13 +257,13 @@ class RealEstateDemo(BaseDemo):
                 
                 # Apply bedroom filter
                 try:
-                    nova.act("look for bedroom filters and select 2+ bedrooms")
+                    self.act(nova, "look for bedroom filters and select 2+ bedrooms")
+                    self.wait_for_page_load(nova)
                     applied_filters.append({
                         "type": "bedrooms",
                         "applied": True,
                         "method": "bedroom_filter"
                     })
-                    time.sleep(1)
                 except Exception as e:
                     applied_filters.append({
                         "type": "bedrooms",
@@ -265,13 +273,13 @@ class RealEstateDemo(BaseDemo):
                 
                 # Apply property type filter
                 try:
-                    nova.act("look for property type filters and select houses or apartments")
+                    self.act(nova, "look for property type filters and select houses or apartments")
+                    self.wait_for_page_load(nova)
                     applied_filters.append({
                         "type": "property_type",
                         "applied": True,
                         "method": "type_filter"
                     })
-                    time.sleep(1)
                 except Exception as e:
                     applied_filters.append({
                         "type": "property_type",
@@ -302,48 +310,49 @@ class RealEstateDemo(BaseDemo):
         self.logger.log_step(4, "Property Analysis", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/real_estate_analysis"
+            with self.session(
+                site_info["url"],
+                logs_directory="./demo/logs/real_estate"
             ) as nova:
                 
-                # Re-search to ensure we have results
-                search_locations = site_info.get("search_locations", ["City Center"])
-                nova.act(f"search for properties in {search_locations[0]}")
-                time.sleep(3)
+                # Search again only if the session is not showing the results yet
+                self._show_search_results(nova, site_info)
                 
                 analysis_data = {
                     "analysis_method": "simplified_demo",
                     "properties_analyzed": []
                 }
                 
-                # Get general information about available properties
+                # Ask about the listings on the page in a single act
                 try:
-                    result = nova.act("How many property listings are visible on this page?")
-                    if result.response:
-                        analysis_data["property_count_description"] = result.response
+                    ordinals = ["first", "second", "third"]  # Analyze first 3 properties
+                    query = BatchQuery(act=self.act)
+                    query.add("property_count", "How many property listings are visible on this page?")
+                    for ordinal in ordinals:
+                        query.add(f"{ordinal}_property",
+                                  f"What are the key details of the {ordinal} property listing (price, bedrooms, location)?")
+                    query.add("properties_available",
+                              "Do the properties appear to be currently available for sale or rent?", BOOL_SCHEMA)
+                    query.add("has_property_images", "Do the property listings have photos or images?", BOOL_SCHEMA)
+                    answers = query.run(nova)
                     
-                    # Analyze first few properties
-                    for i in range(1, 4):  # Analyze first 3 properties
-                        try:
-                            ordinal = "first" if i == 1 else "second" if i == 2 else "third"
-                            result = nova.act(f"What are the key details of the {ordinal} property listing (price, bedrooms, location)?")
-                            if result.response:
-                                analysis_data["properties_analyzed"].append({
-                                    "position": i,
-                                    "description": result.response,
-                                    "analysis_method": "natural_language"
-                                })
-                        except:
-                            continue
+                    if answers["property_count"].response:
+                        analysis_data["property_count_description"] = answers["property_count"].response
                     
-                    # Check property availability
-                    result = nova.act("Do the properties appear to be currently available for sale or rent?", schema=BOOL_SCHEMA)
-                    analysis_data["properties_available"] = result.matches_schema and result.parsed_response
+                    for i, ordinal in enumerate(ordinals, 1):
+                        answer = answers[f"{ordinal}_property"]
+                        if answer.matches_schema and answer.response:
+                            analysis_data["properties_analyzed"].append({
+                                "position": i,
+                                "description": answer.response,
+                                "analysis_method": "natural_language"
+                            })
                     
-                    # Check for property images
-                    result = nova.act("Do the property listings have photos or images?", schema=BOOL_SCHEMA)
-                    analysis_data["has_property_images"] = result.matches_schema and result.parsed_response
+                    # Check property availability and images
+                    for name in ("properties_available", "has_property_images"):
+                        answer = answers[name]
+                        analysis_data[name] = answer.matches_schema and answer.parsed_response
+                    analysis_data["acts_used"] = query.acts
                     
                 except Exception as e:
                     analysis_data["analysis_error"] = str(e)
@@ -369,51 +378,41 @@ class RealEstateDemo(BaseDemo):
             return {"transport_result": {"skipped": True, "reason": "not_supported"}}
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/real_estate_transport"
+            with self.session(
+                site_info["url"],
+                logs_directory="./demo/logs/real_estate"
             ) as nova:
                 
-                # Re-search to ensure we have results
-                search_locations = site_info.get("search_locations", ["City Center"])
-                nova.act(f"search for properties in {search_locations[0]}")
-                time.sleep(2)
+                # Search again only if the session is not showing the results yet
+                self._show_search_results(nova, site_info)
                 
                 transport_analysis = []
                 
                 # Check for transportation information
                 try:
-                    nova.act("look for transportation information, nearby transit, or commute details")
-                    
-                    # Check for public transit info
-                    result = nova.act("Is there information about public transportation or transit nearby?", schema=BOOL_SCHEMA)
-                    has_transit_info = result.matches_schema and result.parsed_response
-                    
-                    transport_analysis.append({
-                        "type": "public_transit",
-                        "information_available": has_transit_info,
-                        "method": "transit_check"
-                    })
+                    self.act(nova, "look for transportation information, nearby transit, or commute details")
                     
-                    # Check for walkability information
-                    result = nova.act("Is there information about walkability or walk scores?", schema=BOOL_SCHEMA)
-                    has_walk_info = result.matches_schema and result.parsed_response
+                    # Check for transit, walkability and amenity info in a single act
+                    checks = [
+                        ("public_transit", "transit_check",
+                         "Is there information about public transportation or transit nearby?"),
+                        ("walkability", "walkability_check",
+                         "Is there information about walkability or walk scores?"),
+                        ("amenities", "amenity_check",
+                         "Is there information about nearby schools, shopping, or amenities?")
+                    ]
+                    query = BatchQuery(act=self.act)
+                    for info_type, _, question in checks:
+                        query.add(info_type, question, BOOL_SCHEMA)
+                    answers = query.run(nova)
                     
-                    transport_analysis.append({
-                        "type": "walkability",
-                        "information_available": has_walk_info,
-                        "method": "walkability_check"
-                    })
-                    
-                    # Check for nearby amenities
-                    result = nova.act("Is there information about nearby schools, shopping, or amenities?", schema=BOOL_SCHEMA)
-                    has_amenity_info = result.matches_schema and result.parsed_response
-                    
-                    transport_analysis.append({
-                        "type": "amenities",
-                        "information_available": has_amenity_info,
-                        "method": "amenity_check"
-                    })
+                    for info_type, method, _ in checks:
+                        answer = answers[info_type]
+                        transport_analysis.append({
+                            "type": info_type,
+                            "information_available": answer.matches_schema and answer.parsed_response,
+                            "method": method
+                        })
                     
                 except Exception as e:
                     transport_analysis.append({
@@ -445,48 +444,47 @@ class RealEstateDemo(BaseDemo):
         self.logger.log_step(6, "Property Data Extraction", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/real_estate_extraction"
+            with self.session(
+                site_info["url"],
+                logs_directory="./demo/logs/real_estate",
+                reset=True
             ) as nova:
                 
-                # Re-search to ensure we have results
-                search_locations = site_info.get("search_locations", ["City Center"])
-                nova.act(f"search for properties in {search_locations[0]}")
-                time.sleep(3)
+                # Search again only if the session is not showing the results yet
+                self._show_search_results(nova, site_info)
                 
                 # Click on first property for detailed extraction
                 try:
-                    nova.act("click on the first property listing to see more details")
-                    time.sleep(3)
+                    self.act(nova, "click on the first property listing to see more details")
+                    self.wait_for_page_load(nova)
                     
                     # Extract detailed property information
                     property_details = {}
                     
                     # Get property address
                     try:
-                        result = nova.act("What is the address of this property?")
+                        result = self.act(nova, "What is the address of this property?")
                         property_details["address"] = result.response if result.response else "Address not found"
                     except:
                         property_details["address"] = "Address extraction failed"
                     
                     # Get property price
                     try:
-                        result = nova.act("What is the price of this property?")
+                        result = self.act(nova, "What is the price of this property?")
                         property_details["price"] = result.response if result.response else "Price not found"
                     except:
                         property_details["price"] = "Price extraction failed"
                     
                     # Get property specifications
                     try:
-                        result = nova.act("How many bedrooms and bathrooms does this property have?")
+                        result = self.act(nova, "How many bedrooms and bathrooms does this property have?")
                         property_details["bed_bath"] = result.response if result.response else "Bed/bath info not found"
                     except:
                         property_details["bed_bath"] = "Bed/bath extraction failed"
                     
                     # Get property size
                     try:
-                        result = nova.act("What is the square footage or size of this property?")
+                        result = self.act(nova, "What is the square footage or size of this property?")
                         property_details["size"] = result.response if result.response else "Size not found"
                     except:
                         property_details["size"] = "Size extraction failed"
@@ -507,7 +505,7 @@ class RealEstateDemo(BaseDemo):
                     
                     try:
                         # Try to extract from list view
-                        result = nova.act("Extract basic information about the first few properties from the list view")
+                        result = self.act(nova, "Extract basic information about the first few properties from the list view")
                         extraction_data["list_view_data"] = result.response if result.response else "No data extracted"
                         extraction_data["extraction_method"] = "list_view_fallback"
                     except:
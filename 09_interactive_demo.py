@@ -20,6 +20,8 @@ from demo_framework import BaseDemo, DemoResult
 class InteractiveDemo(BaseDemo):
     """Enhanced interactive demo with debugging and state capture."""
     
+    category = "debugging"
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.steps_total = 5  # Setup, Interactive session, Breakpoint demo, Manual intervention, State capture
@@ -9,17 +9,18 @@ S3 integration, monitoring, and production-ready capabilities.
 
 import os
 import sys
-import time
 from typing import Dict, Any, List
 from nova_act import NovaAct
 
 # Import our enhanced framework
-from demo_framework import BaseDemo, DemoResult
+from demo_framework import BaseDemo, DemoResult, ResourceBlocker
 
 
 class AdvancedFeaturesDemo(BaseDemo):
     """Advanced features demo with production capabilities."""
     
+    category = "advanced"
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.steps_total = 6  # Setup, Video recording, S3 integration, Monitoring, Performance, Production features
@@ -80,7 +81,7 @@ class AdvancedFeaturesDemo(BaseDemo):
         
         return extracted_data    
  
-   def _step_video_recording(self) -> Dict[str, Any]:
+    def _step_video_recording(self) -> Dict[str, Any]:
         """Step 1: Demonstrate video recording capabilities."""
         self.logger.log_step(1, "Video Recording", "starting")
         
@@ -101,11 +102,9 @@ class AdvancedFeaturesDemo(BaseDemo):
             ) as nova:
                 
                 # Perform actions that will be recorded
-                nova.act("scroll down to see more content")
-                time.sleep(2)
-                nova.act("scroll back to the top of the page")
-                time.sleep(1)
-                nova.act("look for any links or buttons on the page")
+                self.act(nova, "scroll down to see more content")
+                self.act(nova, "scroll back to the top of the page")
+                self.act(nova, "look for any links or buttons on the page")
                 
                 video_data = {
                     "recording_enabled": True,
@@ -249,6 +248,9 @@ class AdvancedFeaturesDemo(BaseDemo):
         try:
             print("⚡ Demonstrating performance optimization...")
             
+            # Resource blocking is measured on a real page load
+            blocking = self._measure_resource_blocking()
+            
             # Simulate performance optimizations
             optimizations = [
                 {
@@ -269,12 +271,7 @@ class AdvancedFeaturesDemo(BaseDemo):
                     "performance_gain": "25% faster page loads",
                     "timeout_reduction": "60%"
                 },
-                {
-                    "feature": "resource_blocking",
-                    "enabled": True,
-                    "performance_gain": "20% faster navigation",
-                    "bandwidth_savings": "45%"
-                }
+                blocking
             ]
             
             # Simulate performance benchmarks
@@ -310,6 +307,30 @@ class AdvancedFeaturesDemo(BaseDemo):
             self.logger.log_step(4, "Performance Demo", "failed", str(e))
             return {"performance_result": {"failed": True, "error": str(e)}}
     
+    def _measure_resource_blocking(self) -> Dict[str, Any]:
+        """Browse a catalog page with images, fonts, media and trackers blocked."""
+        blocker = ResourceBlocker()
+        try:
+            with blocker.open(
+                "https://books.toscrape.com/",
+                logs_directory="./demo/logs/resource_blocking",
+                headless=True
+            ) as nova:
+                self.act(nova, "go to the next page of books")
+        except Exception as e:
+            self.logger.warning(f"Could not measure resource blocking: {str(e)}")
+            return {"feature": "resource_blocking", "enabled": False, "performance_gain": "not measured"}
+        
+        stats = blocker.stats
+        return {
+            "feature": "resource_blocking",
+            "enabled": True,
+            "performance_gain": f"{stats['requests_blocked']} of "
+                                f"{stats['requests_blocked'] + stats['requests_allowed']} requests blocked",
+            "bandwidth_savings": f"~{stats['estimated_bytes_saved'] / 1024:.0f} KB (estimated)",
+            "blocked_by_type": stats["blocked_by_type"]
+        }
+    
     def _step_production_features(self) -> Dict[str, Any]:
         """Step 5: Demonstrate production-ready features."""
         self.logger.log_step(5, "Production Features", "starting")
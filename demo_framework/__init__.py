@@ -5,19 +5,78 @@ A robust framework for creating reliable, error-resilient demos that handle
 geographic restrictions, website changes, and various failure scenarios.
 """
 
-from .base_demo import BaseDemo, DemoResult, DemoError
+from .base_demo import BaseDemo, DemoResult, DemoError, StepMetrics
+from .async_demo import AsyncBaseDemo, BrowserSession
 from .error_handler import ErrorHandler, RecoveryAction
 from .config_manager import ConfigManager, EnvironmentInfo
 from .logger import Logger
+from .run_context import RunContext, get_run_context, set_run_context
+from .rate_limiter import RateLimiter, RateLimit, get_rate_limiter
+from .manifest import DemoManifest, DemoManifestEntry
+from .journal import ResultJournal
+from .report_writer import SuiteReportWriter, ReportStats
+from .work_queue import WorkQueue
+from .step_graph import StepGraph, Step
+from .duration_history import DurationHistory
+from .step_cache import StepCache, cached_step
+from .act_cache import ActCache, CachedActResult
+from .batch_query import BatchQuery, BatchAnswer
+from .session_provider import SessionProvider
+from .session_pool import SessionPool, PooledSession
+from .memory_watchdog import MemoryWatchdog
+from .profile_template import ProfileTemplate
+from .concurrency_limiter import AdaptiveLimiter
+from .resource_blocker import ResourceBlocker
+from .deadline import Deadline, CancelToken, DeadlineExceeded, DemoCancelled
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError, get_circuit_breakers
 
 __version__ = "1.0.0"
 __all__ = [
     "BaseDemo",
+    "AsyncBaseDemo",
+    "BrowserSession",
     "DemoResult", 
     "DemoError",
+    "StepMetrics",
     "ErrorHandler",
     "RecoveryAction",
     "ConfigManager",
     "EnvironmentInfo",
-    "Logger"
+    "Logger",
+    "RunContext",
+    "get_run_context",
+    "set_run_context",
+    "RateLimiter",
+    "RateLimit",
+    "get_rate_limiter",
+    "DemoManifest",
+    "DemoManifestEntry",
+    "ResultJournal",
+    "SuiteReportWriter",
+    "ReportStats",
+    "WorkQueue",
+    "StepGraph",
+    "Step",
+    "DurationHistory",
+    "StepCache",
+    "cached_step",
+    "ActCache",
+    "CachedActResult",
+    "BatchQuery",
+    "BatchAnswer",
+    "SessionProvider",
+    "SessionPool",
+    "PooledSession",
+    "MemoryWatchdog",
+    "ProfileTemplate",
+    "AdaptiveLimiter",
+    "ResourceBlocker",
+    "Deadline",
+    "CancelToken",
+    "DeadlineExceeded",
+    "DemoCancelled",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "get_circuit_breakers"
 ]
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""
+Disk cache for the results of read-only nova.act calls.
+
+Reruns repeat the same extractions against pages that rarely change, and
+each one costs a model round trip. An ActCache stores the response of an
+act on disk, keyed by page URL, prompt, schema and a hash of the page's
+text, so asking the same question of an unchanged page is answered from
+disk. Any change to the page text changes the key, so stale answers are
+not served; entries also expire after a TTL, and the least recently used
+ones are evicted beyond max_entries.
+
+Only use it for acts that read the page: a cached act does not run, so it
+cannot click, type or navigate.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+DEFAULT_ACT_CACHE_TTL = 6 * 3600
+
+# Text the agent sees; hashed so any visible change misses the cache
+_PAGE_TEXT_SCRIPT = "() => document.body ? document.body.innerText : ''"
+
+
+@dataclass
+class CachedActResult:
+    """An act result read from the cache; has the fields callers read from an ActResult."""
+    response: Optional[str]
+    parsed_response: Any
+    matches_schema: bool
+    valid_json: bool = True
+    cached: bool = True
+
+
+class ActCache:
+    """JSON files holding act results, one file per key, evicted least recently used first."""
+    
+    def __init__(self, cache_dir: str = "demo/cache/acts", max_entries: int = 500,
+                 ttl: float = DEFAULT_ACT_CACHE_TTL):
+        """
+        Args:
+            cache_dir: Directory of the cache files
+            max_entries: Entries kept; the least recently used beyond this are removed
+            ttl: Seconds an entry stays valid even if the page is unchanged
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(url: str, prompt: str, schema: Any, page_text: str) -> str:
+        """Cache key for asking a prompt of a page."""
+        schema_hash = hashlib.sha256(json.dumps(schema, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        text_hash = hashlib.sha256(page_text.encode("utf-8")).hexdigest()
+        payload = json.dumps([url, prompt, schema_hash, text_hash])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+    
+    def key_for(self, nova, url: Optional[str], prompt: str, schema: Any) -> Optional[str]:
+        """
+        Cache key for an act on the page a NovaAct is showing.
+        
+        Call on the thread that owns the session.
+        
+        Returns:
+            Optional[str]: None if the page text cannot be read (no caching)
+        """
+        if not url:
+            return None
+        try:
+            page_text = nova.page.evaluate(_PAGE_TEXT_SCRIPT)
+        except Exception:
+            return None
+        return self.make_key(url, prompt, schema, page_text or "")
+    
+    def _path(self, key: str) -> str:
+        """File of a cache entry."""
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[CachedActResult]:
+        """
+        Look up a cached act result, marking it as recently used.
+        
+        Returns:
+            Optional[CachedActResult]: None for a miss; expired or unreadable entries are misses
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._count(hit=False)
+            return None
+        
+        if entry.get("expires_at", 0) < time.time():
+            self._remove(path)
+            self._count(hit=False)
+            return None
+        
+        try:
+            os.utime(path)  # Recency for LRU eviction
+        except OSError:
+            pass
+        self._count(hit=True)
+        return CachedActResult(
+            response=entry.get("response"),
+            parsed_response=entry.get("parsed_response"),
+            matches_schema=entry.get("matches_schema", False),
+            valid_json=entry.get("valid_json", True)
+        )
+    
+    def set(self, key: str, result: Any) -> bool:
+        """
+        Store the result of an act (an ActResult or anything with the same fields).
+        
+        Returns:
+            bool: False if the result is not JSON-serializable or cannot be written
+        """
+        now = time.time()
+        entry = {
+            "created_at": now,
+            "expires_at": now + self.ttl,
+            "response": getattr(result, "response", None),
+            "parsed_response": getattr(result, "parsed_response", None),
+            "matches_schema": bool(getattr(result, "matches_schema", False)),
+            "valid_json": bool(getattr(result, "valid_json", True))
+        }
+        path = self._path(key)
+        try:
+            data = json.dumps(entry)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_file = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_file, path)
+        except (TypeError, ValueError, OSError):
+            return False
+        
+        self._evict()
+        return True
+    
+    def act(self, nova, prompt: str, **kwargs) -> Any:
+        """
+        nova.act with caching, for scripts that call NovaAct directly.
+        
+        Only calls with a schema are cached, and only results that match it.
+        """
+        schema = kwargs.get("schema")
+        key = None
+        if schema is not None:
+            key = self.key_for(nova, _page_url(nova), prompt, schema)
+            cached = self.get(key) if key else None
+            if cached is not None:
+                return cached
+        
+        result = nova.act(prompt, **kwargs)
+        if key and getattr(result, "matches_schema", False):
+            self.set(key, result)
+        return result
+    
+    def invalidate(self) -> int:
+        """
+        Remove all cached entries.
+        
+        Returns:
+            int: Number of entries removed
+        """
+        removed = 0
+        for path in glob.glob(os.path.join(self.cache_dir, "*.json")):
+            removed += self._remove(path)
+        return removed
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hits and misses of this cache object."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+    
+    def _count(self, hit: bool):
+        """Count a lookup."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+    
+    def _evict(self):
+        """Remove the least recently used entries beyond max_entries."""
+        paths = glob.glob(os.path.join(self.cache_dir, "*.json"))
+        if len(paths) <= self.max_entries:
+            return
+        
+        def last_used(path: str) -> float:
+            try:
+                return os.path.getmtime(path)
+            except OSError:
+                return 0.0  # Already removed by another process
+        
+        paths.sort(key=last_used)
+        for path in paths[:len(paths) - self.max_entries]:
+            self._remove(path)
+    
+    def _remove(self, path: str) -> int:
+        """Delete a cache file, ignoring files that are already gone."""
+        try:
+            os.remove(path)
+            return 1
+        except OSError:
+            return 0
+
+
+def _page_url(nova) -> Optional[str]:
+    """URL of the page a NovaAct instance is on."""
+    try:
+        return nova.page.url
+    except Exception:
+        return None
@@ -0,0 +1,206 @@
+"""
+Asyncio-native counterpart of BaseDemo.
+
+Demo logic runs as coroutines on one event loop. Each browser session gets a
+single dedicated thread (NovaAct drives Playwright's sync API, which must stay
+on the thread that started it), so concurrency costs one thread per open
+browser rather than one per step or task.
+"""
+
+from abc import abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import contextvars
+import functools
+import inspect
+
+from .base_demo import BaseDemo, DemoResult, DemoError, StepMetrics
+from .run_context import RunContext
+
+
+class BrowserSession:
+    """A NovaAct instance pinned to its own thread and driven from asyncio."""
+    
+    def __init__(self, demo: "AsyncBaseDemo", nova_kwargs: Dict[str, Any]):
+        self.demo = demo
+        self.nova_kwargs = nova_kwargs
+        self.nova = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    async def __aenter__(self) -> "BrowserSession":
+        await self.demo._browser_slots().acquire()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self.demo.demo_name}-browser")
+        try:
+            from nova_act import NovaAct
+            self.nova = await self.call(NovaAct, **self.nova_kwargs)
+            await self.call(self.nova.start)
+        except BaseException:
+            await self._shutdown()
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, tb):
+        try:
+            if self.nova is not None:
+                await self.call(self.nova.stop)
+        finally:
+            await self._shutdown()
+    
+    async def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking function on this session's browser thread."""
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(context.run, func, *args, **kwargs)
+        )
+    
+    async def act(self, prompt: str, **kwargs) -> Any:
+        """Run BaseDemo.act for this session's NovaAct instance."""
+        return await self.call(self.demo.act, self.nova, prompt, **kwargs)
+    
+    async def _shutdown(self):
+        """Release the browser thread and concurrency slot."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.demo._browser_slots().release()
+
+
+class AsyncBaseDemo(BaseDemo):
+    """
+    Base class for demos whose setup, steps and cleanup are coroutines.
+    
+    run() drives run_async() on a new event loop and returns the same
+    DemoResult as BaseDemo, so the suite runner handles both kinds of demo.
+    Async _step_* methods get the same metrics and step-scoped retries as
+    synchronous ones; their cpu_time is that of the event loop thread.
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 context: Optional[RunContext] = None):
+        super().__init__(config, context)
+        self.max_browsers = self.config.get("max_browsers", 4)
+        self._browser_semaphore: Optional[asyncio.Semaphore] = None
+    
+    @abstractmethod
+    async def setup(self) -> bool:
+        """
+        Setup demo environment and validate prerequisites.
+        
+        Returns:
+            bool: True if setup successful, False otherwise
+        """
+        pass
+    
+    @abstractmethod
+    async def execute_steps(self) -> Dict[str, Any]:
+        """
+        Execute the main demo steps.
+        
+        Returns:
+            Dict[str, Any]: Data extracted during demo execution
+        """
+        pass
+    
+    async def cleanup(self) -> None:
+        """Cleanup resources after demo execution."""
+        self.logger.info("Demo cleanup completed")
+    
+    def run(self) -> DemoResult:
+        """
+        Run the demo on a new event loop.
+        
+        Use `await demo.run_async()` from code already running in an event loop.
+        """
+        return asyncio.run(self.run_async())
+    
+    async def run_async(self) -> DemoResult:
+        """
+        Run the complete demo with error handling and logging.
+        
+        Returns:
+            DemoResult: Comprehensive result of demo execution
+        """
+        self._start_run()
+        self._browser_semaphore = None  # Bound to this run's event loop
+        
+        try:
+            # Setup phase
+            if not await self.setup():
+                return self._create_result(False, "Setup failed")
+            
+            # Execute main steps
+            self.data_extracted = await self.execute_steps()
+            
+            # Success
+            self.logger.info(f"Demo {self.demo_name} completed successfully")
+            return self._create_result(True, "Demo completed successfully")
+        
+        except Exception as e:
+            return self._handle_run_error(e)
+        
+        finally:
+            try:
+                await self.cleanup()
+            finally:
+                self.sessions.close_all()
+    
+    def browser(self, **nova_kwargs) -> BrowserSession:
+        """
+        Open a NovaAct browser session for use with `async with`.
+        
+        At most max_browsers (config "max_browsers", default 4) sessions of
+        this demo are open at once; further sessions wait for a free slot.
+        
+        Args:
+            **nova_kwargs: Arguments for NovaAct (starting_page, logs_directory, ...)
+        """
+        return BrowserSession(self, nova_kwargs)
+    
+    async def run_blocking(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking call that does not use a browser in a worker thread."""
+        return await asyncio.to_thread(func, *args, **kwargs)
+    
+    def _browser_slots(self) -> asyncio.Semaphore:
+        """Semaphore bounding open browser sessions, created on the running loop."""
+        if self._browser_semaphore is None:
+            self._browser_semaphore = asyncio.Semaphore(self.max_browsers)
+        return self._browser_semaphore
+    
+    def _measure_step(self, name: str, func: Callable) -> Callable:
+        """Wrap async step methods for metrics and retries; sync ones as in BaseDemo."""
+        if not inspect.iscoroutinefunction(func):
+            return super()._measure_step(name, func)
+        
+        @functools.wraps(func)
+        async def measured(*args, **kwargs):
+            metrics, token, usage = self._begin_step(name)
+            try:
+                return await self._run_async_step_with_retries(name, func, args, kwargs, metrics)
+            except BaseException:
+                metrics.success = False
+                raise
+            finally:
+                self._end_step(metrics, token, usage)
+        
+        return measured
+    
+    async def _run_async_step_with_retries(self, name: str, func: Callable, args: tuple,
+                                           kwargs: dict, metrics: StepMetrics) -> Any:
+        """Async version of BaseDemo._run_step_with_retries."""
+        failures: List[DemoError] = []
+        
+        while True:
+            try:
+                self.deadline.check(f"step {name}")
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                delay = self._record_step_failure(name, e, metrics, failures)
+                if delay is None:
+                    raise
+                await self.deadline.sleep_async(delay, f"retrying step {name}")
+                continue
+            
+            for error in failures:
+                error.recovery_successful = True
+            return result
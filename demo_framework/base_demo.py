@@ -3,15 +3,34 @@ Base demo class providing common functionality for all Nova Act demos.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
+import contextvars
+import functools
+import math
+import random
+import threading
+import time
 import traceback
 import os
+import sys
 
-from .error_handler import ErrorHandler
-from .logger import Logger
-from .config_manager import ConfigManager
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from .run_context import RunContext, get_run_context
+from .rate_limiter import get_rate_limiter
+from .circuit_breaker import get_circuit_breakers
+from .step_graph import StepGraph, Step
+from .session_provider import SessionProvider
+from .resource_blocker import ResourceBlocker
+from .deadline import Deadline, CancelToken, DeadlineExceeded, DemoCancelled
+
+# Longest wait for a page to load after a navigating action, in seconds
+PAGE_LOAD_TIMEOUT = 15
 
 
 @dataclass
@@ -24,6 +43,32 @@ class DemoError:
     recovery_successful: bool = False
     troubleshooting_tips: List[str] = field(default_factory=list)
     stack_trace: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DemoError":
+        """Create a DemoError from a dictionary produced by to_dict."""
+        data = dict(data)
+        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        return cls(**data)
+
+
+@dataclass
+class StepMetrics:
+    """Resource usage of a single demo step."""
+    name: str
+    wall_time: float = 0.0
+    cpu_time: float = 0.0  # CPU time of the thread that ran the step
+    peak_rss_delta_kb: int = 0  # Growth of the process's peak RSS during the step
+    act_calls: int = 0
+    attempts: int = 1
+    cached: bool = False  # Result came from the step cache
+    success: bool = True
 
 
 @dataclass
@@ -39,17 +84,59 @@ class DemoResult:
     data_extracted: Optional[Dict[str, Any]] = None
     log_path: str = ""
     screenshots: List[str] = field(default_factory=list)
+    step_metrics: List[StepMetrics] = field(default_factory=list)
+    recycle_events: List[Dict[str, Any]] = field(default_factory=list)  # Browser sessions replaced mid-run
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["errors"] = [error.to_dict() for error in self.errors]
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DemoResult":
+        """Create a DemoResult from a dictionary produced by to_dict."""
+        data = dict(data)
+        data["errors"] = [DemoError.from_dict(error) for error in data.get("errors", [])]
+        data["step_metrics"] = [StepMetrics(**metrics) for metrics in data.get("step_metrics", [])]
+        return cls(**data)
 
 
 class BaseDemo(ABC):
     """Abstract base class for all Nova Act demos."""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
-        self.config = config or {}
+    # Demo category, read statically by the demo manifest and used to pick
+    # a recommended configuration
+    category: str = "general"
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 context: Optional[RunContext] = None):
+        # Shared per-process state; the suite runner installs its own context
+        self.context = context or get_run_context()
+        self.config = self.context.demo_config(config)
         self.demo_name = self.__class__.__name__
-        self.logger = Logger(self.demo_name)
-        self.error_handler = ErrorHandler()
-        self.config_manager = ConfigManager()
+        self.logger = self.context.create_logger(self.demo_name)
+        self.error_handler = self.context.error_handler
+        self.config_manager = self.context.config_manager
+        self.rate_limiter = get_rate_limiter()
+        self.circuit_breakers = get_circuit_breakers()
+        self.step_cache = self.context.step_cache
+        # Opt-in cache of extraction results (config "use_act_cache"), used
+        # by actions that pass cache=True
+        self.act_cache = self.context.act_cache if self.config.get("use_act_cache", False) else None
+        self.sessions = SessionProvider(self.logger)
+        # Optional AdaptiveLimiter fed with the latency and outcome of every action
+        self.concurrency = None
+        # Request blocking for extraction sessions (config "block_resources")
+        block = self.config.get("block_resources")
+        self.resource_blocker = ResourceBlocker(block) if block else None
+        
+        # Per-step action timeouts from the duration history (config "step_timeouts")
+        self.step_timeouts: Dict[str, float] = dict(self.config.get("step_timeouts") or {})
+        
+        # Replaced by the orchestrator to be able to cancel this demo
+        self.cancel_token = CancelToken()
+        self.deadline = Deadline(token=self.cancel_token)
         
         # Demo state
         self.start_time = None
@@ -58,22 +145,24 @@ class BaseDemo(ABC):
         self.errors = []
         self.warnings = []
         self.data_extracted = {}
+        self.step_metrics: List[StepMetrics] = []
+        self.recycle_events: List[Dict[str, Any]] = []
+        self._step_lock = threading.Lock()
+        self._current_step = contextvars.ContextVar(f"{self.demo_name}_step", default=None)
+        self._active_steps: List[StepMetrics] = []
+        
+        # Step retries allowed for the whole demo, across all steps
+        self.retry_budget = self.config.get("retry_attempts", 3)
         
         # Ensure required directories exist
         self._ensure_directories()
+        
+        # Measure every _step_* method without changes to the demos
+        self._instrument_steps()
     
     def _ensure_directories(self):
-        """Create required directories for logs, screenshots, etc."""
-        directories = [
-            "demo/logs",
-            "demo/screenshots", 
-            "demo/downloads",
-            "demo/saved_content",
-            "demo/sessions"
-        ]
-        
-        for directory in directories:
-            os.makedirs(directory, exist_ok=True)
+        """Create required directories for logs, screenshots, etc. (once per run context)."""
+        self.context.ensure_directories()
     
     @abstractmethod
     def setup(self) -> bool:
@@ -116,8 +205,7 @@ class BaseDemo(ABC):
         Returns:
             DemoResult: Comprehensive result of demo execution
         """
-        self.start_time = datetime.now()
-        self.logger.info(f"Starting demo: {self.demo_name}")
+        self._start_run()
         
         try:
             # Setup phase
@@ -132,40 +220,59 @@ class BaseDemo(ABC):
             return self._create_result(True, "Demo completed successfully")
             
         except Exception as e:
-            self.logger.error(f"Demo failed with exception: {str(e)}")
-            error = DemoError(
-                error_type=type(e).__name__,
-                message=str(e),
-                timestamp=datetime.now(),
-                stack_trace=traceback.format_exc()
-            )
-            self.errors.append(error)
-            
-            # Attempt recovery
-            recovery_action = self.error_handler.handle_error(e, self)
-            if recovery_action and recovery_action.should_retry:
-                self.logger.info("Attempting error recovery...")
-                error.recovery_attempted = True
-                try:
-                    # Retry with recovery action
-                    if recovery_action.alternative_action:
-                        recovery_action.alternative_action()
-                    error.recovery_successful = True
-                    return self._create_result(True, "Demo completed after recovery")
-                except Exception as recovery_error:
-                    self.logger.error(f"Recovery failed: {str(recovery_error)}")
-                    error.recovery_successful = False
-            
-            return self._create_result(False, f"Demo failed: {str(e)}")
+            return self._handle_run_error(e)
             
         finally:
-            self.cleanup()
+            try:
+                self.cleanup()
+            finally:
+                self.sessions.close_all()
+    
+    def _start_run(self):
+        """Start the clock and the deadline (config "deadline_seconds") of a run."""
+        self.start_time = datetime.now()
+        self.sessions.bind()
+        self.deadline = Deadline(self.config.get("deadline_seconds"), self.cancel_token)
+        if self.deadline.seconds:
+            self.logger.info(f"Starting demo: {self.demo_name} (deadline {self.deadline.seconds:.0f}s)")
+        else:
+            self.logger.info(f"Starting demo: {self.demo_name}")
+    
+    def _handle_run_error(self, e: Exception) -> DemoResult:
+        """
+        Record the error that ended the demo; the run has failed.
+        
+        Retrying happens per step, so nothing is re-run here. Running out of
+        time or being cancelled always fails the demo, whatever the message
+        of the error says.
+        """
+        self.logger.error(f"Demo failed with exception: {str(e)}")
+        if getattr(e, "_step_error_recorded", False):
+            # The failing step already recorded the error and used its retries
+            return self._create_result(False, f"Demo failed: {str(e)}")
+        
+        error = DemoError(
+            error_type=type(e).__name__,
+            message=str(e),
+            timestamp=datetime.now(),
+            stack_trace=traceback.format_exc()
+        )
+        if not isinstance(e, (DeadlineExceeded, DemoCancelled)):
+            # Only for the troubleshooting tips
+            recovery_action = self.error_handler.handle_error(e, self)
+            if recovery_action and recovery_action.troubleshooting_tips:
+                error.troubleshooting_tips = list(recovery_action.troubleshooting_tips)
+        with self._step_lock:
+            self.errors.append(error)
+        
+        return self._create_result(False, f"Demo failed: {str(e)}")
     
     def _create_result(self, success: bool, message: str) -> DemoResult:
         """Create a DemoResult object with current state."""
         execution_time = 0.0
         if self.start_time:
             execution_time = (datetime.now() - self.start_time).total_seconds()
+        self._log_resource_savings()
         
         return DemoResult(
             demo_name=self.demo_name,
@@ -177,16 +284,401 @@ class BaseDemo(ABC):
             warnings=self.warnings,
             data_extracted=self.data_extracted,
             log_path=self.logger.log_file,
-            screenshots=[]  # Will be populated by specific demos
+            screenshots=[],  # Will be populated by specific demos
+            step_metrics=list(self.step_metrics),
+            recycle_events=list(self.recycle_events)
         )
     
+    def record_recycle(self, event: Dict[str, Any]):
+        """
+        Record a browser session replaced during the run (e.g. SessionPool's on_recycle).
+        
+        Args:
+            event: What was recycled and why ("reason", "uses", "acts", "rss_mb")
+        """
+        with self._step_lock:
+            self.recycle_events.append(event)
+        rss = f", {event['rss_mb']} MB" if event.get("rss_mb") else ""
+        self.logger.info(f"Recycled browser session ({event['reason']}{rss}) after {event.get('uses', 0)} tasks")
+    
     def add_warning(self, message: str):
         """Add a warning message to the demo results."""
         self.warnings.append(message)
         self.logger.warning(message)
     
     def increment_step(self, description: str = ""):
-        """Increment completed steps counter."""
-        self.steps_completed += 1
+        """Increment completed steps counter (safe to call from parallel steps)."""
+        with self._step_lock:
+            self.steps_completed += 1
+            step_number = self.steps_completed
         if description:
-            self.logger.info(f"Step {self.steps_completed}: {description}")
\ No newline at end of file
+            self.logger.info(f"Step {step_number}: {description}")
+    
+    def run_step_graph(self, graph: StepGraph, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run a graph of steps, with independent steps running concurrently.
+        
+        Each completed step increments the step counter. Dict results are
+        merged into the returned data in the order the steps were added.
+        
+        Args:
+            graph: Steps and their dependencies
+            max_workers: Maximum concurrent steps (default: config "max_parallel_steps")
+            
+        Returns:
+            Dict[str, Any]: Merged data returned by the steps
+        """
+        max_workers = max_workers or self.config.get("max_parallel_steps", 3)
+        
+        def on_complete(step: Step, result: Any):
+            self.increment_step(step.description or f"{step.name} completed")
+        
+        results = graph.run(max_workers=max_workers, on_complete=on_complete)
+        
+        extracted_data = {}
+        for name in graph.steps:
+            if isinstance(results.get(name), dict):
+                extracted_data.update(results[name])
+        return extracted_data
+    
+    def session(self, url: str, reset: bool = False, **nova_kwargs):
+        """
+        Browser session for a site, kept alive across the steps of this run.
+        
+        Use it like `with NovaAct(...)`: `with self.session(url) as nova:`.
+        Steps on the same site get the same NovaAct, still on the page the
+        previous step left it on; pass reset=True to start from the
+        starting page again. Sessions are closed when the run ends, or when
+        a `with` block raises.
+        
+        Args:
+            url: Starting page of the session
+            reset: Go back to the starting page before using the session
+            **nova_kwargs: Further NovaAct arguments (logs_directory, ...)
+        """
+        return self.sessions.session(url, reset=reset, **nova_kwargs)
+    
+    def extraction_session(self, url: str, **nova_kwargs):
+        """
+        Browser session for a step that only reads data from url.
+        
+        Use it like `with NovaAct(...)`. When config "block_resources" lists
+        resource types (see ResourceBlocker.RESOURCE_TYPES), they are blocked
+        before the browser navigates, so url itself loads without them.
+        
+        Args:
+            url: Page to extract from
+            **nova_kwargs: Further NovaAct arguments (logs_directory, ...)
+        """
+        if self.resource_blocker is not None:
+            return self.resource_blocker.open(url, **nova_kwargs)
+        from nova_act import NovaAct
+        return NovaAct(starting_page=url, **nova_kwargs)
+    
+    def block_resources(self, nova) -> bool:
+        """
+        Drop the resources this demo's config blocks on an already open session.
+        
+        Prefer extraction_session(), which blocks before the first page
+        loads; here only what is loaded after the call is filtered. It does
+        nothing unless config "block_resources" is set, and is safe to call
+        again for a shared session.
+        
+        Returns:
+            bool: True if blocking is active on the page
+        """
+        if self.resource_blocker is None:
+            return False
+        return self.resource_blocker.install(nova)
+    
+    def _log_resource_savings(self):
+        """Log what resource blocking saved during the run."""
+        if self.resource_blocker is None:
+            return
+        stats = self.resource_blocker.stats
+        if stats["requests_blocked"]:
+            self.logger.log_performance_metric("requests_blocked", stats["requests_blocked"], "requests")
+            self.logger.log_performance_metric("bytes_saved", stats["estimated_bytes_saved"], "bytes")
+    
+    def act(self, nova, prompt: str, **kwargs):
+        """
+        Run nova.act after acquiring a rate limit token for the current site.
+        
+        Use this instead of calling nova.act directly and sleeping between
+        actions; it only waits when a per-domain or per-API-key limit is hit.
+        The demo's deadline is checked first and the remaining time is passed
+        to nova.act as its timeout, so a hung action cannot stall the demo.
+        Inside a step with a timeout in config "step_timeouts", no single
+        action may take longer than that.
+        Actions on a site whose circuit breaker is open fail immediately with
+        CircuitOpenError, and the outcome of every action feeds that breaker
+        (and the demo's concurrency limiter, if it has one). With the act
+        cache enabled, extractions passed cache=True that are asked again of
+        an unchanged page are answered from the cache without a model call.
+        
+        Args:
+            nova: Active NovaAct instance
+            prompt: Natural language instruction for nova.act
+            **kwargs: Extra arguments passed to nova.act (e.g. schema), plus
+                cache=True for read-only extractions with a schema whose
+                answer depends only on the page text. Leave it off for
+                questions about page state (enabled buttons, whether the
+                page changed), which the cache key cannot see.
+            
+        Returns:
+            The ActResult returned by nova.act
+        """
+        metrics = self._current_step_metrics()
+        if metrics is not None:
+            with self._step_lock:
+                metrics.act_calls += 1
+        
+        self.deadline.check(f"action '{prompt[:60]}'")
+        
+        url = self._current_url(nova)
+        cache_key = None
+        use_cache = kwargs.pop("cache", False)
+        if use_cache and self.act_cache is not None and kwargs.get("schema") is not None:
+            cache_key = self.act_cache.key_for(nova, url, prompt, kwargs["schema"])
+            cached = self.act_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                self.logger.debug(f"Using cached result for action '{prompt[:60]}' on {url}")
+                return cached
+        
+        if url:
+            self.circuit_breakers.check(url)
+        try:
+            waited = self.rate_limiter.acquire(
+                url, api_key=os.getenv('NOVA_ACT_API_KEY'), timeout=self.deadline.timeout()
+            )
+        except TimeoutError as e:
+            raise DeadlineExceeded(f"Demo deadline would pass while rate limited: {e}") from e
+        if waited > 0.1:
+            self.logger.debug(f"Rate limited for {waited:.2f}s before action on {url}")
+        
+        timeout = self.deadline.timeout(self._act_timeout_cap(metrics, kwargs.get("timeout")))
+        if timeout is not None:
+            self.deadline.check(f"action '{prompt[:60]}'")
+            kwargs["timeout"] = max(1, math.ceil(timeout))
+        
+        started = time.monotonic()
+        try:
+            result = nova.act(prompt, **kwargs)
+        except Exception as e:
+            if self.concurrency is not None and not self.deadline.expired:
+                self.concurrency.record(time.monotonic() - started, e)
+            if url and self.error_handler.is_rate_limited(e):
+                self.rate_limiter.report_throttled(url)
+                self.logger.warning(f"Throttled by {url}, reducing action rate")
+            if url:
+                # A timeout we imposed because the deadline ran out is not the site's fault
+                failed = self.error_handler.is_site_failure(e) and not self.deadline.expired
+                self._report_site_outcome(url, failed)
+            raise
+        
+        if self.concurrency is not None:
+            self.concurrency.record(time.monotonic() - started)
+        if cache_key and getattr(result, "matches_schema", False):
+            self.act_cache.set(cache_key, result)
+        if url:
+            self.rate_limiter.report_success(url)
+            self._report_site_outcome(url, False)
+        return result
+    
+    def _act_timeout_cap(self, metrics: Optional[StepMetrics], timeout: Optional[float]) -> Optional[float]:
+        """Timeout requested for an action, lowered to the current step's timeout."""
+        step_timeout = self.step_timeouts.get(metrics.name) if metrics is not None else None
+        if step_timeout is None:
+            return timeout
+        return step_timeout if timeout is None else min(timeout, step_timeout)
+    
+    def wait_for_page_load(self, nova, timeout: float = PAGE_LOAD_TIMEOUT):
+        """
+        Wait for the page to finish loading after an action that navigated.
+        
+        Rate limiting paces requests but does not wait for pages; call this
+        after searches, clicks and filters that load a new page, so the next
+        action sees it. Returns as soon as the page has loaded and gives up
+        quietly after timeout seconds (capped at the demo's remaining time).
+        
+        Args:
+            nova: Active NovaAct instance
+            timeout: Longest wait in seconds
+        """
+        limit = self.deadline.timeout(timeout)
+        if limit <= 0:
+            return  # Out of time; the next checkpoint fails the demo
+        try:
+            nova.page.wait_for_load_state("load", timeout=limit * 1000)
+        except Exception as e:
+            self.logger.debug(f"Page did not finish loading within {limit:.0f}s: {e}")
+    
+    def _report_site_outcome(self, url: str, failed: bool):
+        """Feed an action's outcome to the site's circuit breaker."""
+        domain = self.circuit_breakers.domain(url)
+        if failed:
+            if self.circuit_breakers.record_failure(url):
+                self.logger.warning(f"Circuit opened for {domain}, other demos will skip it for now")
+        elif self.circuit_breakers.record_success(url):
+            self.logger.info(f"Circuit closed for {domain}, site is responding again")
+    
+    def _current_url(self, nova) -> Optional[str]:
+        """Best-effort URL of the page a NovaAct instance is on."""
+        try:
+            return nova.page.url
+        except Exception:
+            return getattr(nova, "starting_page", None)
+    
+    def _instrument_steps(self):
+        """Wrap each _step_* method so its resource usage is recorded."""
+        for name in dir(type(self)):
+            if name.startswith("_step_") and callable(getattr(type(self), name)):
+                setattr(self, name, self._measure_step(name[len("_step_"):], getattr(self, name)))
+    
+    def _measure_step(self, name: str, func: Callable) -> Callable:
+        """Wrap a step method to record a StepMetrics entry for each call."""
+        @functools.wraps(func)
+        def measured(*args, **kwargs):
+            metrics, token, usage = self._begin_step(name)
+            try:
+                return self._run_step_with_retries(name, func, args, kwargs, metrics)
+            except BaseException:
+                metrics.success = False
+                raise
+            finally:
+                self._end_step(metrics, token, usage)
+        
+        return measured
+    
+    def _begin_step(self, name: str) -> tuple:
+        """Start measuring a step and make it the current step of this context."""
+        metrics = StepMetrics(name=name)
+        token = self._current_step.set(metrics)
+        with self._step_lock:
+            self._active_steps.append(metrics)
+        return metrics, token, (_peak_rss_kb(), time.thread_time(), time.monotonic())
+    
+    def _end_step(self, metrics: StepMetrics, token, usage: tuple):
+        """Finish measuring a step and record its metrics."""
+        rss_before, cpu_before, wall_before = usage
+        metrics.wall_time = round(time.monotonic() - wall_before, 3)
+        metrics.cpu_time = round(time.thread_time() - cpu_before, 3)
+        metrics.peak_rss_delta_kb = max(0, _peak_rss_kb() - rss_before)
+        self._current_step.reset(token)
+        with self._step_lock:
+            self._active_steps.remove(metrics)
+            self.step_metrics.append(metrics)
+        self.logger.log_step_metrics(metrics)
+    
+    def _run_step_with_retries(self, name: str, func: Callable, args: tuple, kwargs: dict,
+                               metrics: StepMetrics) -> Any:
+        """
+        Run a step, re-running only this step when its error is recoverable.
+        
+        The RecoveryAction from the error handler decides whether to retry,
+        how many times (max_retries) and the base backoff delay
+        (delay_seconds). Each retry is also charged to the demo's
+        retry_budget. Every failed attempt is recorded as a DemoError.
+        """
+        failures: List[DemoError] = []
+        
+        while True:
+            try:
+                self.deadline.check(f"step {name}")
+                result = func(*args, **kwargs)
+            except Exception as e:
+                delay = self._record_step_failure(name, e, metrics, failures)
+                if delay is None:
+                    raise
+                self.deadline.sleep(delay, f"retrying step {name}")
+                continue
+            
+            for error in failures:
+                error.recovery_successful = True
+            return result
+    
+    def _record_step_failure(self, name: str, e: Exception, metrics: StepMetrics,
+                             failures: List[DemoError]) -> Optional[float]:
+        """
+        Record a failed step attempt and decide whether to run the step again.
+        
+        Must be called from the except block handling the error.
+        
+        Returns:
+            Backoff delay in seconds before the next attempt, or None if the
+            error should propagate
+        """
+        if getattr(e, "_step_error_recorded", False):
+            return None  # Already handled by a nested step
+        if isinstance(e, (DeadlineExceeded, DemoCancelled)):
+            return None  # Out of time or cancelled: retrying cannot help
+        
+        recovery_action = self.error_handler.handle_error(e, self)
+        error = DemoError(
+            error_type=type(e).__name__,
+            message=str(e),
+            timestamp=datetime.now(),
+            troubleshooting_tips=list(recovery_action.troubleshooting_tips or []) if recovery_action else [],
+            stack_trace=traceback.format_exc()
+        )
+        with self._step_lock:
+            self.errors.append(error)
+        failures.append(error)
+        
+        delay = self._retry_delay(recovery_action.delay_seconds if recovery_action else 0.0, metrics.attempts)
+        if not self._take_step_retry(recovery_action, metrics.attempts, delay):
+            try:
+                e._step_error_recorded = True
+            except AttributeError:
+                pass
+            return None
+        
+        error.recovery_attempted = True
+        self.logger.warning(
+            f"Step {name} failed ({type(e).__name__}: {e}), retry "
+            f"{metrics.attempts}/{recovery_action.max_retries} in {delay:.1f}s"
+        )
+        metrics.attempts += 1
+        return delay
+    
+    def _take_step_retry(self, recovery_action, attempts: int, delay: float) -> bool:
+        """Check whether a failed step may run again and charge the retry budget."""
+        if not recovery_action or not recovery_action.should_retry:
+            return False
+        if attempts > recovery_action.max_retries:
+            return False
+        if delay >= self.deadline.remaining():
+            self.logger.warning("Demo deadline is too close, not retrying step")
+            return False
+        with self._step_lock:
+            if self.retry_budget <= 0:
+                self.logger.warning("Retry budget exhausted, not retrying step")
+                return False
+            self.retry_budget -= 1
+        return True
+    
+    def _retry_delay(self, base_delay: float, attempt: int) -> float:
+        """Exponential backoff with jitter, capped at 30 seconds."""
+        delay = base_delay * (2 ** (attempt - 1))
+        return min(delay * random.uniform(0.5, 1.5), 30.0)
+    
+    def _current_step_metrics(self) -> Optional[StepMetrics]:
+        """
+        Metrics of the step an action belongs to.
+        
+        Actions run by helper threads of a step (e.g. a ThreadPoolExecutor
+        inside the step) are attributed to it when it is the only step running.
+        """
+        metrics = self._current_step.get()
+        if metrics is not None:
+            return metrics
+        with self._step_lock:
+            return self._active_steps[0] if len(self._active_steps) == 1 else None
+
+
+def _peak_rss_kb() -> int:
+    """Peak resident set size of this process in KiB, 0 where unsupported."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
@@ -0,0 +1,196 @@
+"""
+Several questions about one page, answered by a single act.
+
+Analysis steps used to ask the page one question per nova.act (how many
+listings, the first, second and third listing, a few yes/no checks), paying
+a model round trip for each. A BatchQuery combines named questions and
+their schemas into one object schema, asks them in one act, and splits the
+validated answer back into per-question results shaped like an ActResult
+(response, parsed_response, matches_schema), so call sites read them the
+same way as before.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+import copy
+import json
+
+
+STRING_SCHEMA = {"type": "string"}
+
+_JSON_TYPES = {
+    "string": str,
+    "boolean": bool,
+    "integer": int,
+    "number": (int, float),
+    "object": dict,
+    "array": list,
+    "null": type(None)
+}
+
+
+def _nova_act(nova, prompt: str, **kwargs) -> Any:
+    """Default action function: nova.act without extras."""
+    return nova.act(prompt, **kwargs)
+
+
+def _matches_type(value: Any, schema: Dict[str, Any]) -> bool:
+    """Check an answer against the top-level type of its schema."""
+    expected = schema.get("type")
+    if not isinstance(expected, str) or expected not in _JSON_TYPES:
+        return True  # Nothing simple to check; the combined result was validated
+    if isinstance(value, bool) and expected in ("integer", "number"):
+        return False
+    return isinstance(value, _JSON_TYPES[expected])
+
+
+@dataclass
+class BatchAnswer:
+    """Answer to one question of a BatchQuery."""
+    response: Optional[str]
+    parsed_response: Any
+    matches_schema: bool
+    batched: bool = True  # False if the question had to be asked on its own
+    error: Optional[str] = None  # Why asking it on its own failed
+
+
+class BatchQuery:
+    """Named questions about the current page, asked in one act."""
+    
+    def __init__(self, act: Optional[Callable[..., Any]] = None, fallback: bool = True):
+        """
+        Args:
+            act: Function called as act(nova, prompt, **kwargs), e.g. a
+                demo's BaseDemo.act; defaults to nova.act
+            fallback: Ask questions whose batched answer is missing or of
+                the wrong type again on their own
+        """
+        self.act_func = act or _nova_act
+        self.fallback = fallback
+        self.questions: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self.acts = 0  # Acts issued by the last run()
+    
+    def add(self, name: str, question: str, schema: Optional[Dict[str, Any]] = None) -> "BatchQuery":
+        """
+        Add a question.
+        
+        Args:
+            name: Field name of the answer (a valid identifier)
+            question: Question about the current page
+            schema: JSON schema of the answer (e.g. BOOL_SCHEMA or a model's
+                model_json_schema()); free text by default
+        
+        Returns:
+            BatchQuery: self, so questions can be chained
+        
+        Raises:
+            ValueError: If the name is not an identifier or is already used
+        """
+        if not name.isidentifier():
+            raise ValueError(f"Question name must be an identifier: {name!r}")
+        if name in self.questions:
+            raise ValueError(f"Duplicate question name: {name}")
+        self.questions[name] = (question, STRING_SCHEMA if schema is None else schema)
+        return self
+    
+    def schema(self) -> Dict[str, Any]:
+        """Combined JSON schema with one required property per question."""
+        properties = {}
+        definitions = {}
+        for name, (_, schema) in self.questions.items():
+            schema = copy.deepcopy(schema)
+            # Model schemas refer to their definitions from the root ("#/$defs/...")
+            definitions.update(schema.pop("$defs", {}))
+            properties[name] = schema
+        
+        combined = {
+            "type": "object",
+            "properties": properties,
+            "required": list(self.questions)
+        }
+        if definitions:
+            combined["$defs"] = definitions
+        return combined
+    
+    def prompt(self) -> str:
+        """Instruction asking all questions at once."""
+        lines = [
+            "Answer each of these questions about the current page. "
+            "Return one JSON object with one field per question, named as listed:"
+        ]
+        lines += [f"- {name}: {question}" for name, (question, _) in self.questions.items()]
+        return "\n".join(lines)
+    
+    def run(self, nova, **kwargs) -> Dict[str, BatchAnswer]:
+        """
+        Ask all questions of the page a NovaAct is on.
+        
+        Args:
+            nova: Active NovaAct instance
+            **kwargs: Extra arguments for the act (e.g. timeout)
+        
+        Returns:
+            Dict[str, BatchAnswer]: Answer per question name, in the order added
+        """
+        self.acts = 0
+        if not self.questions:
+            return {}
+        
+        result = self._act(nova, self.prompt(), schema=self.schema(), **kwargs)
+        parsed = result.parsed_response if getattr(result, "matches_schema", False) else None
+        if not isinstance(parsed, dict):
+            parsed = {}
+        
+        answers = {}
+        for name, (question, schema) in self.questions.items():
+            if name in parsed and _matches_type(parsed[name], schema):
+                answers[name] = self._answer(parsed[name])
+            elif self.fallback:
+                answers[name] = self._ask_alone(nova, question, schema, kwargs)
+            else:
+                answers[name] = BatchAnswer(response=None, parsed_response=None, matches_schema=False)
+        return answers
+    
+    def _ask_alone(self, nova, question: str, schema: Dict[str, Any],
+                   kwargs: Dict[str, Any]) -> BatchAnswer:
+        """
+        Ask a single question, as it would have been asked without batching.
+        
+        A failure only costs this answer; the answers already collected are kept.
+        """
+        try:
+            return self._ask_one(nova, question, schema, kwargs)
+        except Exception as e:
+            return BatchAnswer(response=None, parsed_response=None, matches_schema=False,
+                               batched=False, error=f"{type(e).__name__}: {e}")
+    
+    def _ask_one(self, nova, question: str, schema: Dict[str, Any],
+                 kwargs: Dict[str, Any]) -> BatchAnswer:
+        """Issue the act for a single question."""
+        if schema is STRING_SCHEMA:
+            result = self._act(nova, question, **kwargs)
+            return BatchAnswer(
+                response=result.response,
+                parsed_response=result.response,
+                matches_schema=bool(result.response),
+                batched=False
+            )
+        
+        result = self._act(nova, question, schema=schema, **kwargs)
+        return BatchAnswer(
+            response=result.response,
+            parsed_response=result.parsed_response,
+            matches_schema=bool(result.matches_schema),
+            batched=False
+        )
+    
+    def _act(self, nova, prompt: str, **kwargs) -> Any:
+        """Issue one act and count it."""
+        self.acts += 1
+        return self.act_func(nova, prompt, **kwargs)
+    
+    @staticmethod
+    def _answer(value: Any) -> BatchAnswer:
+        """Per-question answer from the combined result."""
+        response = value if isinstance(value, str) else json.dumps(value)
+        return BatchAnswer(response=response, parsed_response=value, matches_schema=True)
@@ -0,0 +1,178 @@
+"""
+Per-site circuit breakers shared by every demo in the process.
+
+When a site starts blocking us, consecutive site-level failures (as
+classified by ErrorHandler) open the site's circuit. While it is open,
+actions on the site fail immediately and site selection skips it, so demos
+and worker threads move to alternative sites instead of each running into
+the block on their own. After a cool-down one trial action is let through;
+its outcome closes the circuit again or re-opens it.
+"""
+
+from typing import Dict, List, Optional
+import threading
+import time
+
+from .rate_limiter import RateLimiter
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of running an action on a site whose circuit is open."""
+    
+    def __init__(self, domain: str, retry_in: float):
+        super().__init__(f"Circuit open for {domain}, skipping it for another {retry_in:.0f}s")
+        self.domain = domain
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Closed/open/half-open state machine for a single site."""
+    
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 120.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def _retry_in(self, now: float) -> float:
+        """Seconds until the circuit lets a trial call through."""
+        return max(0.0, self.opened_at + self.reset_timeout - now)
+    
+    def allow(self) -> float:
+        """
+        Ask to run a call against the site.
+        
+        Returns:
+            float: 0 if the call may run, otherwise seconds until it might
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.state == CLOSED:
+                return 0.0
+            if self.state == OPEN:
+                if self._retry_in(now) > 0:
+                    return self._retry_in(now)
+                self.state = HALF_OPEN
+                self.probe_started_at = None
+            
+            # Half-open: one trial call at a time. A trial that never reported
+            # back (e.g. its thread was interrupted) is replaced after a while.
+            if self.probe_started_at is not None and now - self.probe_started_at < self.reset_timeout:
+                return max(1.0, self.probe_started_at + self.reset_timeout - now)
+            self.probe_started_at = now
+            return 0.0
+    
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being refused outright."""
+        with self._lock:
+            return self.state == OPEN and self._retry_in(time.monotonic()) > 0
+    
+    def record_success(self) -> bool:
+        """
+        Record that the site responded normally.
+        
+        Returns:
+            bool: True if this closed a previously open circuit
+        """
+        with self._lock:
+            was_closed = self.state == CLOSED
+            self.state = CLOSED
+            self.failures = 0
+            self.probe_started_at = None
+            return not was_closed
+    
+    def record_failure(self) -> bool:
+        """
+        Record a site-level failure (block, throttling, network error, ...).
+        
+        Returns:
+            bool: True if this opened the circuit
+        """
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.probe_started_at = None
+                return True
+            return False
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers keyed by site domain."""
+    
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 120.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def domain(url: str) -> str:
+        """Domain a URL's circuit is keyed by, without a leading 'www.'."""
+        return RateLimiter.domain_key(url).split(":", 1)[1]
+    
+    def _breaker(self, url: str) -> CircuitBreaker:
+        """Get or create the breaker for the domain of a URL."""
+        domain = self.domain(url)
+        with self._lock:
+            breaker = self.breakers.get(domain)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self.breakers[domain] = breaker
+            return breaker
+    
+    def check(self, url: str):
+        """
+        Raise if calls to the site of a URL are currently refused.
+        
+        Raises:
+            CircuitOpenError: If the site's circuit is open
+        """
+        retry_in = self._breaker(url).allow()
+        if retry_in > 0:
+            raise CircuitOpenError(self.domain(url), retry_in)
+    
+    def is_open(self, url: str) -> bool:
+        """Whether the site of a URL is currently being skipped."""
+        return self._breaker(url).is_open
+    
+    def available(self, sites: List[str]) -> List[str]:
+        """Sites whose circuit is not open, in their original order."""
+        return [site for site in sites if not self.is_open(site)]
+    
+    def open_domains(self) -> List[str]:
+        """Domains currently being skipped."""
+        with self._lock:
+            breakers = dict(self.breakers)
+        return sorted(domain for domain, breaker in breakers.items() if breaker.is_open)
+    
+    def record_success(self, url: str) -> bool:
+        """Record a normal response from the site of a URL; True if this closed its circuit."""
+        return self._breaker(url).record_success()
+    
+    def record_failure(self, url: str) -> bool:
+        """Record a site-level failure for the site of a URL; True if this opened its circuit."""
+        return self._breaker(url).record_failure()
+
+
+_shared_registry: Optional[CircuitBreakerRegistry] = None
+_shared_lock = threading.Lock()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Get the process-wide circuit breaker registry shared by all demos."""
+    global _shared_registry
+    with _shared_lock:
+        if _shared_registry is None:
+            _shared_registry = CircuitBreakerRegistry()
+        return _shared_registry
@@ -0,0 +1,198 @@
+"""
+Adaptive (AIMD) limit on concurrent browser work.
+
+Instead of a hardcoded number of parallel workers, fan-out code takes a slot
+from an AdaptiveLimiter before each task. The limit grows by one after a
+round of healthy results (latency close to the best seen, low error rate)
+and is cut multiplicatively when results show throttling or timeouts, the
+way TCP congestion control probes for and backs off from capacity.
+"""
+
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+import asyncio
+import threading
+import time
+
+from .error_handler import ErrorHandler
+
+
+class AdaptiveLimiter:
+    """Additive-increase/multiplicative-decrease limit on tasks in flight."""
+    
+    def __init__(self, initial: int = 2, minimum: int = 1, maximum: int = 8,
+                 decrease: float = 0.5, latency_tolerance: float = 2.0,
+                 max_error_rate: float = 0.2,
+                 on_change: Optional[Callable[[int], None]] = None):
+        """
+        Args:
+            initial: Starting limit
+            minimum: Lowest limit backing off can reach
+            maximum: Highest limit; size worker pools to this
+            decrease: Factor applied to the limit on throttling or timeouts
+            latency_tolerance: Latency counts as healthy up to this multiple
+                of the best average latency seen so far
+            max_error_rate: Average error rate above which the limit stops growing
+            on_change: Called with the new limit whenever it changes
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = max(minimum, min(initial, maximum))
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.max_error_rate = max_error_rate
+        self.on_change = on_change
+        self.error_handler = ErrorHandler()
+        
+        self.in_flight = 0
+        self.peak_limit = self.limit
+        self.latency: Optional[float] = None  # Moving average of healthy results
+        self.best_latency: Optional[float] = None
+        self.error_rate = 0.0
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+    
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until a task may start.
+        
+        Returns:
+            bool: False if no slot became free within timeout
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.in_flight < self.limit, timeout):
+                return False
+            self.in_flight += 1
+            return True
+    
+    async def acquire_async(self):
+        """Wait on the event loop until a task may start."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self.in_flight < self.limit:
+                    self.in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+    
+    def release(self):
+        """Mark a task as finished."""
+        with self._cond:
+            self.in_flight -= 1
+            self._wake()
+    
+    @contextmanager
+    def slot(self, record: bool = True) -> Iterator[None]:
+        """
+        Run the body of a `with` block as one limited task.
+        
+        Args:
+            record: Feed the block's duration and any exception it raises
+                to the limiter; pass False when the work reports its own
+                results through record()
+        """
+        self.acquire()
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            if record:
+                self.record(time.monotonic() - start, e)
+            raise
+        else:
+            if record:
+                self.record(time.monotonic() - start)
+        finally:
+            self.release()
+    
+    @asynccontextmanager
+    async def async_slot(self, record: bool = True) -> AsyncIterator[None]:
+        """Async version of slot()."""
+        await self.acquire_async()
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            if record:
+                self.record(time.monotonic() - start, e)
+            raise
+        else:
+            if record:
+                self.record(time.monotonic() - start)
+        finally:
+            self.release()
+    
+    def record(self, latency: float, error: Optional[BaseException] = None):
+        """
+        Feed one observed result to the limiter.
+        
+        Args:
+            latency: Seconds the action or task took
+            error: Exception it raised, if any
+        """
+        overloaded = error is not None and self.error_handler.is_overload(error)
+        new_limit = None
+        
+        with self._cond:
+            self.error_rate = 0.9 * self.error_rate + 0.1 * (error is not None)
+            
+            if overloaded:
+                # One cut per round trip, not one per task that was in flight
+                now = time.monotonic()
+                if now - self._last_decrease >= (self.latency or 1.0):
+                    self._last_decrease = now
+                    self._successes = 0
+                    new_limit = max(self.minimum, int(self.limit * self.decrease))
+            elif error is None:
+                self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+                self.best_latency = min(self.best_latency or self.latency, self.latency)
+                healthy = (
+                    self.latency <= self.best_latency * self.latency_tolerance
+                    and self.error_rate <= self.max_error_rate
+                )
+                if healthy and self.in_flight >= self.limit:
+                    # Grow by one after a full round of healthy results while
+                    # every slot was in use (more slots would have been used)
+                    self._successes += 1
+                    if self._successes >= self.limit:
+                        self._successes = 0
+                        new_limit = min(self.maximum, self.limit + 1)
+                elif not healthy:
+                    self._successes = 0
+            
+            if new_limit is None or new_limit == self.limit:
+                return
+            self.limit = new_limit
+            self.peak_limit = max(self.peak_limit, new_limit)
+            self._wake()
+        
+        if self.on_change:
+            self.on_change(new_limit)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Current limit and the signals it is based on, for reports."""
+        with self._cond:
+            return {
+                "limit": self.limit,
+                "peak_limit": self.peak_limit,
+                "in_flight": self.in_flight,
+                "latency_seconds": round(self.latency, 3) if self.latency is not None else None,
+                "error_rate": round(self.error_rate, 3)
+            }
+    
+    def _wake(self):
+        """Let waiting tasks re-check the limit; caller holds the lock."""
+        self._cond.notify_all()
+        for loop, waiter in self._async_waiters:
+            loop.call_soon_threadsafe(_resolve, waiter)
+        self._async_waiters.clear()
+
+
+def _resolve(waiter: asyncio.Future):
+    """Wake an async waiter unless it was cancelled meanwhile."""
+    if not waiter.done():
+        waiter.set_result(None)
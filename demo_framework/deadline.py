@@ -0,0 +1,118 @@
+"""
+Per-demo deadlines and cooperative cancellation.
+
+A Deadline travels with a demo run. Steps and browser actions check it before
+starting, actions get the remaining time as their timeout, and the CancelToken
+behind it lets the orchestrator stop a straggling demo at its next check so
+its `with NovaAct(...)` blocks unwind and close their browsers.
+"""
+
+from typing import Optional
+import asyncio
+import math
+import threading
+import time
+
+
+# How often an async sleep looks at the cancel token
+_ASYNC_POLL_INTERVAL = 0.25
+
+
+class DemoCancelled(Exception):
+    """Raised at a checkpoint after the demo's cancel token was triggered."""
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised at a checkpoint after the demo's deadline has passed."""
+
+
+class CancelToken:
+    """Thread-safe flag an orchestrator sets to stop a running demo."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason = ""
+
+    def cancel(self, reason: str = "Cancelled"):
+        """Ask the demo to stop at its next checkpoint."""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        return self._event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or the timeout passes; True if cancelled."""
+        return self._event.wait(timeout)
+
+
+class Deadline:
+    """Point in time by which a demo should be done, plus its cancel token."""
+
+    def __init__(self, seconds: Optional[float] = None, token: Optional[CancelToken] = None):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds if seconds else None
+        self.token = token or CancelToken()
+
+    def remaining(self) -> float:
+        """Seconds left, math.inf without a deadline."""
+        if self.expires_at is None:
+            return math.inf
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def timeout(self, cap: Optional[float] = None) -> Optional[float]:
+        """
+        Timeout for a blocking call: the remaining time, optionally capped.
+
+        Returns:
+            float seconds, or None when there is neither a deadline nor a cap
+        """
+        limit = min(self.remaining(), cap if cap is not None else math.inf)
+        return None if limit == math.inf else limit
+
+    def check(self, what: str = ""):
+        """
+        Checkpoint: raise if the demo was cancelled or ran out of time.
+
+        Args:
+            what: Description of the work about to start, for the error message
+
+        Raises:
+            DemoCancelled: If the cancel token was triggered
+            DeadlineExceeded: If the deadline has passed
+        """
+        suffix = f" before {what}" if what else ""
+        if self.token.cancelled:
+            raise DemoCancelled(f"{self.token.reason}{suffix}")
+        if self.expired:
+            raise DeadlineExceeded(f"Demo deadline of {self.seconds:.0f}s exceeded{suffix}")
+
+    def sleep(self, seconds: float, what: str = ""):
+        """
+        Wait up to seconds, waking as soon as the demo is cancelled or out of time.
+
+        Raises:
+            DemoCancelled: If the cancel token was triggered
+            DeadlineExceeded: If the deadline passed
+        """
+        self.token.wait(min(seconds, self.remaining()))
+        self.check(what)
+
+    async def sleep_async(self, seconds: float, what: str = ""):
+        """Async version of sleep(), for code running on an event loop."""
+        wake_at = time.monotonic() + min(seconds, self.remaining())
+        while True:
+            self.check(what)
+            left = wake_at - time.monotonic()
+            if left <= 0:
+                break
+            await asyncio.sleep(min(left, _ASYNC_POLL_INTERVAL))
+        self.check(what)
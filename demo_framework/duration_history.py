@@ -0,0 +1,169 @@
+"""
+Persistent duration history for demos, demo steps and samples.
+
+Durations of successful runs are kept in a small rolling window per key, and
+p50/p95 estimates from that window replace hand-written duration guesses in
+scheduling order and timeouts. Demo steps are recorded under their own keys;
+their p95 bounds how long a single action inside the step may take.
+"""
+
+from typing import Dict, List, Optional
+import json
+import math
+import os
+import threading
+
+from .base_demo import DemoResult
+
+
+class DurationHistory:
+    """Rolling window of recorded durations per key, stored as JSON."""
+    
+    HISTORY_VERSION = 1
+    
+    def __init__(self, path: str = "demo/history/durations.json", window: int = 20,
+                 min_samples: int = 3):
+        self.path = path
+        self.window = window
+        self.min_samples = min_samples
+        self._durations: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._load()
+    
+    @staticmethod
+    def step_key(key: str, step_name: str) -> str:
+        """History key of a step within a demo."""
+        return f"{key}::{step_name}"
+    
+    def record_duration(self, key: str, seconds: float, save: bool = True):
+        """
+        Add one observed duration for a key.
+        
+        Args:
+            key: Demo file, sample file or step key
+            seconds: Observed duration
+            save: Write the history to disk afterwards
+        """
+        with self._lock:
+            durations = self._durations.setdefault(key, [])
+            durations.append(round(seconds, 3))
+            del durations[:-self.window]
+        if save:
+            self.save()
+    
+    def record(self, key: str, result: DemoResult, save: bool = True):
+        """
+        Add the overall and per-step durations of a successful demo result.
+        
+        Failed runs are skipped, since they usually stop early and would pull
+        the estimates down.
+        """
+        if not result.success:
+            return
+        self.record_duration(key, result.execution_time, save=False)
+        for metrics in result.step_metrics:
+            if metrics.cached:
+                continue  # Cache hits say nothing about how long the step takes
+            self.record_duration(self.step_key(key, metrics.name), metrics.wall_time, save=False)
+        if save:
+            self.save()
+    
+    def samples(self, key: str) -> List[float]:
+        """Recorded durations for a key, oldest first."""
+        with self._lock:
+            return list(self._durations.get(key, []))
+    
+    def percentile(self, key: str, percentile: float) -> Optional[float]:
+        """
+        Nearest-rank percentile of the recorded durations.
+        
+        Returns:
+            float, or None if fewer than min_samples durations are recorded
+        """
+        durations = sorted(self.samples(key))
+        if len(durations) < self.min_samples:
+            return None
+        rank = max(1, math.ceil(percentile / 100 * len(durations)))
+        return durations[rank - 1]
+    
+    def p50(self, key: str) -> Optional[float]:
+        """Median recorded duration."""
+        return self.percentile(key, 50)
+    
+    def p95(self, key: str) -> Optional[float]:
+        """95th percentile recorded duration."""
+        return self.percentile(key, 95)
+    
+    def estimate(self, key: str, default: float) -> float:
+        """Median duration, falling back to a static estimate without enough history."""
+        p50 = self.p50(key)
+        return p50 if p50 is not None else default
+    
+    def timeout(self, key: str, default: float, margin: float = 1.5,
+                minimum: float = 30.0) -> float:
+        """
+        Timeout derived from the p95 duration with a safety margin.
+        
+        Args:
+            key: History key
+            default: Static timeout used without enough history
+            margin: Multiplier applied to the p95 duration
+            minimum: Lower bound for history-based timeouts
+        
+        Returns:
+            float: Timeout in seconds
+        """
+        p95 = self.p95(key)
+        if p95 is None:
+            return default
+        return max(minimum, math.ceil(p95 * margin))
+    
+    def step_timeouts(self, key: str, margin: float = 2.0,
+                      minimum: float = 60.0) -> Dict[str, float]:
+        """
+        Timeouts of the steps of a demo that have enough history.
+        
+        Args:
+            key: History key of the demo
+            margin: Multiplier applied to each step's p95 duration
+            minimum: Lower bound for each timeout
+        
+        Returns:
+            Dict[str, float]: Timeout in seconds per step name
+        """
+        prefix = self.step_key(key, "")
+        with self._lock:
+            steps = [name[len(prefix):] for name in self._durations if name.startswith(prefix)]
+        
+        timeouts = {}
+        for step in steps:
+            p95 = self.p95(self.step_key(key, step))
+            if p95 is not None:
+                timeouts[step] = max(minimum, math.ceil(p95 * margin))
+        return timeouts
+    
+    def save(self):
+        """Write the history to disk atomically."""
+        with self._lock:
+            data = {"version": self.HISTORY_VERSION, "durations": self._durations}
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_file = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_file, self.path)
+            except OSError:
+                pass  # History only improves estimates
+    
+    def _load(self):
+        """Load the history from disk, ignoring unreadable files."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == self.HISTORY_VERSION:
+                self._durations = {
+                    key: [float(d) for d in durations][-self.window:]
+                    for key, durations in data.get("durations", {}).items()
+                }
+        except Exception:
+            self._durations = {}
@@ -7,6 +7,8 @@ from typing import Optional, Callable, List, Any
 import time
 import random
 
+from .circuit_breaker import CircuitOpenError
+
 
 @dataclass
 class RecoveryAction:
@@ -39,8 +41,12 @@ class ErrorHandler:
         error_type = type(error).__name__
         error_message = str(error).lower()
         
+        # Site skipped because it has been failing for other demos too
+        if isinstance(error, CircuitOpenError):
+            return self.handle_circuit_open(error, demo_instance)
+        
         # Authentication errors
-        if self._is_auth_error(error_message):
+        elif self._is_auth_error(error_message):
             return self.handle_auth_error(error, demo_instance)
         
         # Geographic restriction errors
@@ -142,6 +148,22 @@ class ErrorHandler:
             troubleshooting_tips=tips
         )
     
+    def handle_circuit_open(self, error: Exception, demo_instance) -> RecoveryAction:
+        """Handle an action refused because the site's circuit breaker is open."""
+        fallback_sites = demo_instance.get_fallback_sites() if demo_instance else []
+        
+        tips = [
+            f"{error.domain} failed repeatedly and is being skipped for now",
+            "Use one of the alternative sites for this demo",
+            "The site is tried again automatically after a cool-down"
+        ]
+        
+        return RecoveryAction(
+            should_retry=False,  # Retrying the same site would be refused again
+            fallback_sites=fallback_sites,
+            troubleshooting_tips=tips
+        )
+    
     def handle_generic_error(self, error: Exception, demo_instance) -> RecoveryAction:
         """Handle generic errors."""
         tips = [
@@ -172,6 +194,47 @@ class ErrorHandler:
         delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
         time.sleep(min(delay, 30))  # Cap at 30 seconds
     
+    def is_rate_limited(self, error: Exception) -> bool:
+        """Check if an error means the remote side is throttling requests."""
+        return self._is_rate_limit_error(str(error).lower())
+    
+    def is_overload(self, error: BaseException) -> bool:
+        """Check if an error means we are sending more work than can be handled (throttling, timeouts)."""
+        error_message = str(error).lower()
+        return self._is_rate_limit_error(error_message) or self._is_timeout_error(error_message)
+    
+    def is_site_failure(self, error: Exception) -> bool:
+        """
+        Check if an error means the site itself is blocking or failing us.
+        
+        These errors feed the per-site circuit breakers. Element errors and
+        Nova Act authentication problems do not count: the site responded.
+        """
+        error_message = str(error).lower()
+        return (
+            self._is_rate_limit_error(error_message)
+            or self._is_blocked_error(error_message)
+            or self._is_geo_restriction(error_message)
+            or self._is_timeout_error(error_message)
+            or self._is_network_error(error_message)
+        )
+    
+    def _is_rate_limit_error(self, error_message: str) -> bool:
+        """Check if error is due to rate limiting or throttling."""
+        rate_limit_keywords = [
+            "429", "too many requests", "rate limit", "rate exceeded",
+            "throttl", "slow down"
+        ]
+        return any(keyword in error_message for keyword in rate_limit_keywords)
+    
+    def _is_blocked_error(self, error_message: str) -> bool:
+        """Check if a site refused us as a bot."""
+        blocked_keywords = [
+            "captcha", "are you a robot", "bot detection", "access denied",
+            "forbidden", "403", "503", "service unavailable"
+        ]
+        return any(keyword in error_message for keyword in blocked_keywords)
+    
     def _is_auth_error(self, error_message: str) -> bool:
         """Check if error is authentication-related."""
         auth_keywords = [
@@ -0,0 +1,113 @@
+"""
+Append-only results journal for crash-safe demo suite runs.
+
+Every DemoResult is written as one JSON line and fsync'd before the next demo
+is reported, so a suite that dies partway through can resume and only redo
+the demos that did not succeed.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional
+import json
+import os
+import threading
+
+from .base_demo import DemoResult
+
+
+class ResultJournal:
+    """Durable JSON Lines journal of demo results keyed by demo file."""
+    
+    def __init__(self, path: str = "demo/journal/suite_journal.jsonl"):
+        self.path = path
+        self._lock = threading.Lock()
+    
+    def start(self, resume: bool = False):
+        """
+        Prepare the journal for a run.
+        
+        Args:
+            resume: Keep existing entries instead of starting a fresh journal
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        if not resume:
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.flush()
+                os.fsync(f.fileno())
+        elif os.path.exists(self.path):
+            self._drop_partial_line()
+    
+    def _drop_partial_line(self):
+        """
+        Cut the journal back to its last complete line.
+        
+        A crash mid-write leaves a last line without a newline; appending to
+        it would merge the next entry into that line, and both would be lost.
+        """
+        with open(self.path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            position = end
+            while position > 0:
+                step = min(4096, position)
+                f.seek(position - step)
+                chunk = f.read(step)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    position = position - step + newline + 1
+                    break
+                position -= step
+            if position != end:
+                f.truncate(position)
+                f.flush()
+                os.fsync(f.fileno())
+    
+    def append(self, key: str, result: DemoResult):
+        """
+        Durably record a result.
+        
+        Args:
+            key: Identifier of the demo, normally its file name
+            result: Result to record
+        """
+        entry = {
+            "key": key,
+            "recorded_at": datetime.now().isoformat(),
+            "result": result.to_dict()
+        }
+        line = json.dumps(entry, default=str) + "\n"
+        
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+    
+    def load(self) -> Dict[str, DemoResult]:
+        """
+        Read the latest recorded result for each key.
+        
+        A partially written last line (from a crash mid-write) is ignored.
+        
+        Returns:
+            Dict[str, DemoResult]: Latest result per key, in journal order
+        """
+        results: Dict[str, DemoResult] = {}
+        if not os.path.exists(self.path):
+            return results
+        
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    result = DemoResult.from_dict(entry["result"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+                results.pop(entry["key"], None)
+                results[entry["key"]] = result
+        
+        return results
+    
+    def get_successful(self) -> Dict[str, DemoResult]:
+        """Get the recorded results of demos that succeeded."""
+        return {key: result for key, result in self.load().items() if result.success}
\ No newline at end of file
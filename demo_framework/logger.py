@@ -12,7 +12,8 @@ import json
 class Logger:
     """Enhanced logger with structured output and file management."""
     
-    def __init__(self, demo_name: str, log_level: str = "INFO"):
+    def __init__(self, demo_name: str, log_level: str = "INFO",
+                 console_handler: Optional[logging.Handler] = None):
         self.demo_name = demo_name
         self.log_level = getattr(logging, log_level.upper())
         
@@ -35,18 +36,18 @@ class Logger:
         file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
         file_handler.setLevel(self.log_level)
         
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(self.log_level)
-        
         # Formatter
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
-        
         file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+        
+        # Console handler, shared between the demos of a run if one is given
+        if console_handler is None:
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(self.log_level)
+            console_handler.setFormatter(formatter)
         
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
@@ -111,6 +112,26 @@ class Logger:
         
         self.info(message, step_data)
     
+    def log_step_metrics(self, metrics):
+        """Log the measured resource usage of a demo step."""
+        metrics_data = {
+            "step_name": metrics.name,
+            "wall_time_seconds": metrics.wall_time,
+            "cpu_time_seconds": metrics.cpu_time,
+            "peak_rss_delta_kb": metrics.peak_rss_delta_kb,
+            "act_calls": metrics.act_calls,
+            "cached": metrics.cached,
+            "success": metrics.success,
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        self.debug(
+            f"Step metrics: {metrics.name} - {metrics.wall_time:.2f}s wall, "
+            f"{metrics.cpu_time:.2f}s CPU, +{metrics.peak_rss_delta_kb} KiB peak RSS, "
+            f"{metrics.act_calls} act call(s)",
+            metrics_data
+        )
+    
     def log_error_with_context(self, error: Exception, context: dict):
         """Log error with additional context information."""
         error_data = {
@@ -189,6 +210,16 @@ Error {i}:
             for tip in error.troubleshooting_tips:
                 summary_content += f"    - {tip}\n"
         
+        summary_content += f"""
+=== STEP METRICS ({len(demo_result.step_metrics)}) ===
+"""
+        for metrics in demo_result.step_metrics:
+            summary_content += (
+                f"  {metrics.name}: {metrics.wall_time:.2f}s wall, {metrics.cpu_time:.2f}s CPU, "
+                f"+{metrics.peak_rss_delta_kb} KiB peak RSS, {metrics.act_calls} act call(s)"
+                f"{'' if metrics.success else ' [FAILED]'}\n"
+            )
+        
         summary_content += f"""
 === WARNINGS ({len(demo_result.warnings)}) ===
 """
@@ -0,0 +1,199 @@
+"""
+Cached demo manifest built by static inspection of demo files.
+
+Listing, filtering and scheduling demos only needs class names, categories
+and step counts. Reading those from the AST means nova_act, pydantic and the
+demo module itself are only imported for demos that actually run.
+"""
+
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional, Any
+import ast
+import glob
+import json
+import os
+
+
+@dataclass
+class DemoManifestEntry:
+    """Statically discovered information about a demo file."""
+    file: str
+    mtime: float
+    class_name: Optional[str] = None
+    category: str = "general"
+    steps_total: int = 0
+    step_methods: List[str] = field(default_factory=list)
+    title: str = ""
+    description: str = ""
+    has_main: bool = False
+
+
+class DemoManifest:
+    """Discovers demos and caches their manifest entries by path and mtime."""
+    
+    CACHE_VERSION = 1
+    
+    def __init__(self, cache_file: str = "demo/manifest_cache.json",
+                 pattern: str = "[0-9][0-9]_*.py",
+                 base_classes: tuple = ("BaseDemo", "AsyncBaseDemo")):
+        self.cache_file = cache_file
+        self.pattern = pattern
+        self.base_classes = base_classes
+        self._entries: Dict[str, DemoManifestEntry] = {}
+        self._dirty = False
+        self._load_cache()
+    
+    def discover(self) -> List[DemoManifestEntry]:
+        """
+        Get manifest entries for all demo files matching the pattern.
+        
+        Files whose mtime matches the cache are not re-parsed.
+        
+        Returns:
+            List[DemoManifestEntry]: Entries sorted by file name
+        """
+        entries = [self.get(path, save=False) for path in sorted(glob.glob(self.pattern))]
+        if self._dirty:
+            self._save_cache()
+        return [entry for entry in entries if entry is not None]
+    
+    def get(self, path: str, save: bool = True) -> Optional[DemoManifestEntry]:
+        """
+        Get the manifest entry for a single demo file.
+        
+        Args:
+            path: Path to the demo file
+            save: Write the cache to disk if the entry had to be rebuilt
+        
+        Returns:
+            DemoManifestEntry, or None if the file does not exist or cannot be parsed
+        """
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return None
+        
+        cached = self._entries.get(path)
+        if cached and cached.mtime == mtime:
+            return cached
+        
+        entry = self.inspect_file(path, mtime)
+        if entry is not None:
+            self._entries[path] = entry
+            self._dirty = True
+            if save:
+                self._save_cache()
+        return entry
+    
+    def inspect_file(self, path: str, mtime: Optional[float] = None) -> Optional[DemoManifestEntry]:
+        """Build a manifest entry from the source of a demo file without importing it."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                tree = ast.parse(f.read(), filename=path)
+        except (OSError, SyntaxError):
+            return None
+        
+        title, description = self._parse_docstring(ast.get_docstring(tree) or "")
+        entry = DemoManifestEntry(
+            file=path,
+            mtime=mtime if mtime is not None else os.path.getmtime(path),
+            title=title,
+            description=description,
+            has_main=any(
+                isinstance(node, ast.FunctionDef) and node.name == "main"
+                for node in tree.body
+            )
+        )
+        
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and self._inherits_base(node):
+                self._inspect_demo_class(node, entry)
+                break
+        
+        return entry
+    
+    def _inherits_base(self, node: ast.ClassDef) -> bool:
+        """Check if a class lists a demo base class among its bases."""
+        for base in node.bases:
+            name = base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", None)
+            if name in self.base_classes:
+                return True
+        return False
+    
+    def _inspect_demo_class(self, node: ast.ClassDef, entry: DemoManifestEntry):
+        """Fill in class name, category, step count and step methods."""
+        entry.class_name = node.name
+        
+        for item in node.body:
+            # category = "..." class attribute
+            if isinstance(item, ast.Assign) and isinstance(item.value, ast.Constant):
+                for target in item.targets:
+                    if isinstance(target, ast.Name) and target.id == "category":
+                        entry.category = str(item.value.value)
+            
+            elif isinstance(item, ast.FunctionDef):
+                if item.name.startswith("_step_"):
+                    entry.step_methods.append(item.name)
+                elif item.name == "__init__":
+                    entry.steps_total = self._find_steps_total(item) or entry.steps_total
+    
+    def _find_steps_total(self, init: ast.FunctionDef) -> Optional[int]:
+        """Find a literal `self.steps_total = N` assignment in __init__."""
+        for node in ast.walk(init):
+            if (isinstance(node, ast.Assign) and
+                isinstance(node.value, ast.Constant) and
+                isinstance(node.value.value, int)):
+                for target in node.targets:
+                    if (isinstance(target, ast.Attribute) and
+                        target.attr == "steps_total" and
+                        isinstance(target.value, ast.Name) and
+                        target.value.id == "self"):
+                        return node.value.value
+        return None
+    
+    def _parse_docstring(self, docstring: str) -> tuple[str, str]:
+        """Extract a title and first paragraph from a demo module docstring."""
+        lines = [line.strip() for line in docstring.strip().splitlines()]
+        if not lines:
+            return "", ""
+        
+        title = lines[0].replace("Nova Act Demo:", "").strip()
+        paragraph = []
+        for line in lines[1:]:
+            if set(line) <= {"=", "-"}:
+                if paragraph:
+                    break
+                continue
+            paragraph.append(line)
+        
+        return title, " ".join(paragraph).strip()
+    
+    def _load_cache(self):
+        """Load cached entries from disk, ignoring unreadable caches."""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.CACHE_VERSION:
+                return
+            self._entries = {
+                path: DemoManifestEntry(**entry)
+                for path, entry in data.get("entries", {}).items()
+            }
+        except Exception:
+            self._entries = {}
+    
+    def _save_cache(self):
+        """Write cached entries to disk."""
+        data: Dict[str, Any] = {
+            "version": self.CACHE_VERSION,
+            "entries": {path: asdict(entry) for path, entry in self._entries.items()}
+        }
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except Exception:
+            pass  # The cache is an optimization only
@@ -0,0 +1,209 @@
+"""
+Memory watchdog for long-running browser sessions.
+
+A browser kept warm for hours grows: caches, leaked renderer memory, pages
+that never let go of their DOM. A MemoryWatchdog samples the resident memory
+of each managed browser's process tree from /proc in a background thread, so
+a SessionPool can recycle sessions that grew past a limit between tasks,
+before the kernel's OOM killer takes the whole run down.
+
+A session's browser is found by comparing the processes below this one
+before and after its launch, at any depth: Playwright may start Chromium
+under a driver process that an earlier session already started. The driver
+itself is shared and not counted.
+
+Linux only; elsewhere (no /proc) the watchdog never asks for a recycle.
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Hashable, Iterator, List, Optional, Set
+import os
+import threading
+
+_PROC = "/proc"
+
+
+def _process_table() -> Dict[int, int]:
+    """Map of every visible pid to its parent pid."""
+    parents = {}
+    for entry in os.listdir(_PROC):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"{_PROC}/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue  # Exited while we were scanning
+        # The command name in parentheses may contain spaces; fields follow the last ')'
+        fields = stat[stat.rfind(")") + 2:].split()
+        parents[int(entry)] = int(fields[1])
+    return parents
+
+
+def _is_driver(pid: int) -> bool:
+    """Whether a process is a Playwright driver (node ... run-driver)."""
+    try:
+        with open(f"{_PROC}/{pid}/cmdline", "rb") as f:
+            return b"run-driver" in f.read().split(b"\0")
+    except OSError:
+        return False
+
+
+def _ancestors(pid: int, parents: Dict[int, int]) -> Iterator[int]:
+    """Parent, grandparent, ... of a process, as far as they are known."""
+    seen = set()
+    pid = parents.get(pid, 0)
+    while pid > 0 and pid not in seen:
+        seen.add(pid)
+        yield pid
+        pid = parents.get(pid, 0)
+
+
+def _rss_bytes(pid: int) -> int:
+    """Resident memory of one process, 0 if it is gone."""
+    try:
+        with open(f"{_PROC}/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def _descendants(roots: Set[int], parents: Dict[int, int]) -> Set[int]:
+    """The roots that still exist and all processes below them."""
+    children: Dict[int, List[int]] = {}
+    for pid, ppid in parents.items():
+        children.setdefault(ppid, []).append(pid)
+    
+    tree = set()
+    pending = [pid for pid in roots if pid in parents]
+    while pending:
+        pid = pending.pop()
+        if pid not in tree:
+            tree.add(pid)
+            pending.extend(children.get(pid, ()))
+    return tree
+
+
+class MemoryWatchdog:
+    """Samples the RSS of registered browser process trees."""
+    
+    def __init__(self, limit_mb: float = 1500, interval: float = 5.0):
+        """
+        Args:
+            limit_mb: Resident memory of one browser's process tree above
+                which its session should be recycled
+            interval: Seconds between samples
+        """
+        self.limit_bytes = int(limit_mb * 1024 * 1024)
+        self.interval = interval
+        self.available = os.path.isdir(f"{_PROC}/self")
+        self.rss: Dict[Hashable, int] = {}  # Latest sample per session
+        self.peak_rss = 0  # Largest tree seen, in bytes
+        self._roots: Dict[Hashable, Set[int]] = {}
+        self._lock = threading.Lock()
+        self._launch_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @contextmanager
+    def launching(self, key: Hashable) -> Iterator[None]:
+        """
+        Attribute the processes started inside the block to a session.
+        
+        The browser is whatever new processes appear below ours while the
+        block runs, at any depth, so launches under the watchdog are
+        serialized to keep them apart. Its top-most new processes other than
+        Playwright drivers become the session's roots; processes that other
+        browsers spawned meanwhile are left to their own sessions.
+        """
+        if not self.available:
+            yield
+            return
+        
+        with self._launch_lock:
+            before = self._own_tree(_process_table())
+            yield
+            parents = _process_table()
+            started = self._own_tree(parents) - before
+            with self._lock:
+                claimed = set().union(*self._roots.values())
+                roots = set()
+                for pid in started:
+                    if _is_driver(pid):
+                        continue
+                    ancestors = set(_ancestors(pid, parents))
+                    if ancestors & claimed:
+                        continue  # Spawned by another session's browser
+                    if any(ancestor in started and not _is_driver(ancestor) for ancestor in ancestors):
+                        continue  # Below another new process; counted through it
+                    roots.add(pid)
+                self._roots[key] = roots
+        self._ensure_running()
+    
+    def unregister(self, key: Hashable):
+        """Stop watching a session whose browser was closed."""
+        with self._lock:
+            self._roots.pop(key, None)
+            self.rss.pop(key, None)
+    
+    def over_limit(self, key: Hashable) -> bool:
+        """Whether the session's browser used more than the limit at the last sample."""
+        with self._lock:
+            return self.rss.get(key, 0) > self.limit_bytes
+    
+    def rss_mb(self, key: Hashable) -> float:
+        """Resident memory of the session's browser at the last sample, in MB."""
+        with self._lock:
+            return round(self.rss.get(key, 0) / (1024 * 1024), 1)
+    
+    def sample(self):
+        """Measure every registered process tree now."""
+        if not self.available:
+            return
+        with self._lock:
+            roots = {key: set(pids) for key, pids in self._roots.items()}
+        
+        parents = _process_table()
+        sizes = {key: sum(_rss_bytes(pid) for pid in _descendants(pids, parents))
+                 for key, pids in roots.items()}
+        
+        with self._lock:
+            for key, size in sizes.items():
+                if key in self._roots:  # Not unregistered while we measured
+                    self.rss[key] = size
+                    self.peak_rss = max(self.peak_rss, size)
+    
+    def stop(self):
+        """Stop the sampling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+    
+    def __enter__(self) -> "MemoryWatchdog":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+    
+    def _ensure_running(self):
+        """Start the sampling thread with the first registered browser."""
+        with self._lock:
+            if self._thread is not None or self._stop.is_set():
+                return
+            self._thread = threading.Thread(target=self._run, name="memory-watchdog", daemon=True)
+            self._thread.start()
+    
+    def _run(self):
+        """Sample until stopped."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:
+                pass  # A bad sample must not stop the watchdog; the next one may work
+    
+    @staticmethod
+    def _own_tree(parents: Dict[int, int]) -> Set[int]:
+        """All processes below this one."""
+        me = os.getpid()
+        return _descendants({me}, parents) - {me}
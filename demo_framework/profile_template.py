@@ -0,0 +1,127 @@
+"""
+Cheap per-worker clones of an authenticated browser profile.
+
+NovaAct's clone_user_data_dir=True copies the whole profile for every
+session. A ProfileTemplate treats a prepared user_data_dir (e.g. after a
+manual login) as a read-only template and gives each worker its own clone
+in which files the browser never rewrites in place are hardlinked, caches
+are left out, and only the small mutable files (cookies, preferences, local
+storage logs, ...) are copied.
+"""
+
+from contextlib import contextmanager
+from fnmatch import fnmatch
+from typing import Dict, Iterator, List, Optional
+import os
+import shutil
+import tempfile
+import threading
+
+
+class ProfileTemplate:
+    """A prepared user_data_dir that workers clone with hardlinks."""
+    
+    # Caches the browser rebuilds on its own; clones start without them
+    SKIPPED_DIRS = (
+        "Cache", "Code Cache", "GPUCache", "GrShaderCache", "ShaderCache",
+        "DawnCache", "component_crx_cache", "Crashpad"
+    )
+    # Per-process lock files of the browser that wrote the template
+    SKIPPED_FILES = ("Singleton*", "lockfile")
+    # Directories whose files are written once and replaced, never modified
+    LINKED_DIRS = ("Extensions", "WidevineCdm", "hyphen-data")
+    # Immutable files: leveldb tables and spellcheck dictionaries
+    LINKED_FILES = ("*.ldb", "*.bdic")
+    
+    def __init__(self, user_data_dir: str, clones_dir: Optional[str] = None):
+        """
+        Args:
+            user_data_dir: Prepared profile; it must not be used by a browser
+                while clones exist, since clones share its linked files
+            clones_dir: Where clones are created, by default next to the
+                template so hardlinks stay on the same filesystem
+        """
+        self.user_data_dir = os.path.abspath(user_data_dir)
+        self.clones_dir = clones_dir or f"{self.user_data_dir}.clones"
+        self.clones: List[str] = []
+        self.stats: Dict[str, int] = {"linked": 0, "copied": 0, "skipped": 0, "copied_bytes": 0}
+        self._lock = threading.Lock()
+    
+    def clone(self) -> str:
+        """
+        Create a private copy-on-write style clone of the profile.
+        
+        Returns:
+            str: Path to pass to NovaAct as user_data_dir (with clone_user_data_dir=False)
+        """
+        os.makedirs(self.clones_dir, exist_ok=True)
+        clone_dir = tempfile.mkdtemp(prefix="clone_", dir=self.clones_dir)
+        try:
+            stats = self._populate(clone_dir)
+        except BaseException:
+            shutil.rmtree(clone_dir, ignore_errors=True)
+            raise
+        
+        with self._lock:
+            self.clones.append(clone_dir)
+            for key, value in stats.items():
+                self.stats[key] += value
+        return clone_dir
+    
+    def _populate(self, clone_dir: str) -> Dict[str, int]:
+        """Fill an empty clone directory from the template."""
+        stats = {"linked": 0, "copied": 0, "skipped": 0, "copied_bytes": 0}
+        
+        for root, dirs, files in os.walk(self.user_data_dir):
+            rel_root = os.path.relpath(root, self.user_data_dir)
+            dirs[:] = [d for d in dirs if d not in self.SKIPPED_DIRS]
+            target_root = os.path.normpath(os.path.join(clone_dir, rel_root))
+            os.makedirs(target_root, exist_ok=True)
+            linked_dir = any(part in self.LINKED_DIRS for part in rel_root.split(os.sep))
+            
+            for name in files:
+                source = os.path.join(root, name)
+                target = os.path.join(target_root, name)
+                if any(fnmatch(name, pattern) for pattern in self.SKIPPED_FILES):
+                    stats["skipped"] += 1
+                elif os.path.islink(source):
+                    os.symlink(os.readlink(source), target)
+                elif (linked_dir or any(fnmatch(name, pattern) for pattern in self.LINKED_FILES)) \
+                        and self._link(source, target):
+                    stats["linked"] += 1
+                else:
+                    shutil.copy2(source, target)
+                    stats["copied"] += 1
+                    stats["copied_bytes"] += os.path.getsize(target)
+        
+        return stats
+    
+    @contextmanager
+    def cloned(self) -> Iterator[str]:
+        """Clone the profile for the duration of a `with` block."""
+        clone_dir = self.clone()
+        try:
+            yield clone_dir
+        finally:
+            self.remove_clone(clone_dir)
+    
+    def remove_clone(self, clone_dir: str):
+        """Delete a clone; the template's linked files are unaffected."""
+        shutil.rmtree(clone_dir, ignore_errors=True)
+        with self._lock:
+            if clone_dir in self.clones:
+                self.clones.remove(clone_dir)
+    
+    def remove_clones(self):
+        """Delete every clone that still exists."""
+        for clone_dir in list(self.clones):
+            self.remove_clone(clone_dir)
+    
+    @staticmethod
+    def _link(source: str, target: str) -> bool:
+        """Hardlink a file, returning False where links are not possible."""
+        try:
+            os.link(source, target)
+            return True
+        except OSError:
+            return False  # Other filesystem, or links not supported
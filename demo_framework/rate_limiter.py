@@ -0,0 +1,176 @@
+"""
+Shared token-bucket rate limiting for Nova Act demos.
+
+Replaces fixed sleeps between browser actions with per-domain and per-API-key
+token buckets. Actions only wait when a limit is actually being hit, and a
+domain's rate backs off automatically when the site starts throttling us.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import hashlib
+import threading
+import time
+
+
+@dataclass
+class RateLimit:
+    """Configured rate for a bucket."""
+    rate: float  # Tokens added per second
+    burst: int = 1  # Maximum tokens that can accumulate
+
+
+class TokenBucket:
+    """Thread-safe token bucket with adaptive rate."""
+    
+    def __init__(self, limit: RateLimit, min_rate: float = 0.05):
+        self.limit = limit
+        self.rate = limit.rate
+        self.min_rate = min_rate
+        self.tokens = float(limit.burst)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        """Add tokens for the time elapsed since the last refill."""
+        elapsed = now - self.last_refill
+        self.tokens = min(float(self.limit.burst), self.tokens + elapsed * self.rate)
+        self.last_refill = now
+    
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> float:
+        """
+        Take tokens from the bucket, waiting only as long as necessary.
+        
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait, None to wait indefinitely
+        
+        Returns:
+            float: Seconds spent waiting
+        
+        Raises:
+            TimeoutError: If the tokens are not available within timeout
+        """
+        start = time.monotonic()
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return now - start
+                wait = (tokens - self.tokens) / self.rate
+            
+            if timeout is not None and (now - start) + wait > timeout:
+                raise TimeoutError(f"Rate limit wait exceeds {timeout:.1f}s")
+            time.sleep(wait)
+    
+    def throttle(self, factor: float = 0.5):
+        """Reduce the rate after the remote side signalled throttling."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate * factor)
+            self.tokens = min(self.tokens, 0.0)
+    
+    def recover(self, step: float = 0.1):
+        """Move the rate back towards its configured value after a success."""
+        with self._lock:
+            if self.rate < self.limit.rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.limit.rate, self.rate + self.limit.rate * step)
+
+
+class RateLimiter:
+    """Registry of token buckets keyed by target domain and by API key."""
+    
+    DEFAULT_DOMAIN_LIMIT = RateLimit(rate=1.0, burst=3)
+    DEFAULT_API_KEY_LIMIT = RateLimit(rate=4.0, burst=8)
+    
+    def __init__(self, domain_limit: Optional[RateLimit] = None,
+                 api_key_limit: Optional[RateLimit] = None):
+        self.domain_limit = domain_limit or self.DEFAULT_DOMAIN_LIMIT
+        self.api_key_limit = api_key_limit or self.DEFAULT_API_KEY_LIMIT
+        self.overrides: Dict[str, RateLimit] = {}
+        self.buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def domain_key(url: str) -> str:
+        """Bucket key for the domain of a URL."""
+        netloc = urlparse(url if "://" in url else f"https://{url}").netloc.lower()
+        if netloc.startswith("www."):
+            netloc = netloc[4:]
+        return f"domain:{netloc}"
+    
+    @staticmethod
+    def api_key_key(api_key: str) -> str:
+        """Bucket key for an API key (hashed, so the key is never stored)."""
+        return "api_key:" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+    
+    def configure(self, key: str, limit: RateLimit):
+        """Set a custom limit for a bucket key, e.g. from domain_key()."""
+        with self._lock:
+            self.overrides[key] = limit
+            self.buckets.pop(key, None)
+    
+    def configure_domain(self, url: str, rate: float, burst: int = 1):
+        """Set a custom limit for the domain of a URL."""
+        self.configure(self.domain_key(url), RateLimit(rate=rate, burst=burst))
+    
+    def _bucket(self, key: str) -> TokenBucket:
+        """Get or create the bucket for a key."""
+        with self._lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                if key in self.overrides:
+                    limit = self.overrides[key]
+                elif key.startswith("api_key:"):
+                    limit = self.api_key_limit
+                else:
+                    limit = self.domain_limit
+                bucket = TokenBucket(limit)
+                self.buckets[key] = bucket
+            return bucket
+    
+    def acquire(self, url: Optional[str] = None, api_key: Optional[str] = None,
+                timeout: Optional[float] = None) -> float:
+        """
+        Wait for a token from the domain bucket and the API key bucket.
+        
+        Args:
+            url: URL of the page the action targets
+            api_key: API key the action is billed to
+            timeout: Maximum seconds to wait per bucket
+        
+        Returns:
+            float: Total seconds spent waiting
+        """
+        waited = 0.0
+        if api_key:
+            waited += self._bucket(self.api_key_key(api_key)).acquire(timeout=timeout)
+        if url:
+            waited += self._bucket(self.domain_key(url)).acquire(timeout=timeout)
+        return waited
+    
+    def report_throttled(self, url: str):
+        """Halve the rate for a domain that returned a throttling response."""
+        self._bucket(self.domain_key(url)).throttle()
+    
+    def report_success(self, url: str):
+        """Let a previously throttled domain recover towards its limit."""
+        self._bucket(self.domain_key(url)).recover()
+
+
+_shared_rate_limiter: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter shared by all demos."""
+    global _shared_rate_limiter
+    with _shared_lock:
+        if _shared_rate_limiter is None:
+            _shared_rate_limiter = RateLimiter()
+        return _shared_rate_limiter
@@ -0,0 +1,267 @@
+"""
+Streaming suite report writer for Nova Act demo runs.
+
+Results are appended to text, JSON Lines and CSV reports as soon as each demo
+finishes, so dashboards can read partial results during a long run and the
+writer only keeps running totals in memory.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+import csv
+import json
+import os
+import threading
+
+from .base_demo import DemoResult
+from .config_manager import EnvironmentInfo
+
+
+@dataclass
+class ReportStats:
+    """Running totals for a suite report."""
+    total: int = 0
+    successful: int = 0
+    failed: int = 0
+    total_execution_time: float = 0.0
+    error_types: Dict[str, int] = field(default_factory=dict)
+    failures: List[DemoResult] = field(default_factory=list)  # Kept for the console summary
+    
+    def add(self, result: DemoResult):
+        """Account for one demo result."""
+        self.total += 1
+        self.total_execution_time += result.execution_time
+        if result.success:
+            self.successful += 1
+        else:
+            self.failed += 1
+            self.failures.append(result)
+            for error in result.errors:
+                self.error_types[error.error_type] = self.error_types.get(error.error_type, 0) + 1
+    
+    @property
+    def success_rate(self) -> float:
+        """Percentage of successful demos."""
+        return self.successful / self.total * 100 if self.total else 0.0
+
+
+def format_summary(stats: ReportStats, total_duration: float) -> List[str]:
+    """Format the summary section of a report."""
+    return [
+        f"Total Execution Time: {total_duration:.2f} seconds",
+        "",
+        "SUMMARY",
+        "=" * 40,
+        f"Total Demos: {stats.total}",
+        f"Successful: {stats.successful}",
+        f"Failed: {stats.failed}",
+        f"Success Rate: {stats.success_rate:.1f}%",
+    ]
+
+
+def format_environment(env_info: Optional[EnvironmentInfo]) -> List[str]:
+    """Format the environment section of a report."""
+    lines = ["", "ENVIRONMENT INFORMATION", "=" * 40]
+    if env_info is None:
+        return lines + ["Not detected"]
+    
+    return lines + [
+        f"Country: {env_info.country_code}",
+        f"Region: {env_info.region}",
+        f"Platform: {env_info.platform}",
+        f"Python Version: {env_info.python_version}",
+        f"VPN Detected: {env_info.has_vpn}",
+    ]
+
+
+def format_result(result: DemoResult) -> List[str]:
+    """Format a single demo result."""
+    lines = [
+        f"• {result.demo_name}",
+        f"  Duration: {result.execution_time:.2f}s",
+    ]
+    
+    if result.success:
+        lines.append(f"  Steps: {result.steps_completed}/{result.steps_total}")
+        if result.step_metrics:
+            slowest = max(result.step_metrics, key=lambda m: m.wall_time)
+            lines.append(f"  Slowest step: {slowest.name} ({slowest.wall_time:.2f}s, "
+                         f"{slowest.act_calls} act call(s))")
+        if result.warnings:
+            lines.append(f"  Warnings: {len(result.warnings)}")
+    else:
+        lines.append(f"  Errors: {len(result.errors)}")
+        for error in result.errors:
+            lines.append(f"    - {error.error_type}: {error.message}")
+            if error.troubleshooting_tips:
+                lines.append("      Troubleshooting:")
+                for tip in error.troubleshooting_tips:
+                    lines.append(f"        * {tip}")
+    
+    if result.recycle_events:
+        reasons = Counter(event["reason"] for event in result.recycle_events)
+        lines.append("  Browser sessions recycled: " +
+                     ", ".join(f"{count} ({reason})" for reason, count in sorted(reasons.items())))
+    
+    lines.append("")
+    return lines
+
+
+def format_recommendations(stats: ReportStats, env_info: Optional[EnvironmentInfo]) -> List[str]:
+    """Format the recommendations section of a report."""
+    lines = ["", "RECOMMENDATIONS", "=" * 40]
+    
+    if stats.successful == stats.total:
+        lines += [
+            "🎉 All demos completed successfully!",
+            "• Your environment is well-configured for Nova Act",
+            "• Consider exploring advanced features and customizations",
+            "• Try running demos with different configurations",
+        ]
+        return lines
+    
+    lines.append("⚠️ Some demos encountered issues:")
+    
+    # Analyze common failure patterns
+    if stats.error_types:
+        lines += ["", "Common Issues:"]
+        for error_type, count in sorted(stats.error_types.items(), key=lambda x: x[1], reverse=True):
+            lines.append(f"• {error_type}: {count} occurrence(s)")
+    
+    # Geographic recommendations
+    if env_info and env_info.region != "north_america":
+        lines += [
+            "",
+            "• Consider that some sites may have geographic restrictions",
+            "• The framework automatically tries alternative sites",
+            "• VPN usage may help if legally permitted in your jurisdiction",
+        ]
+    
+    lines += [
+        "",
+        "• Check individual demo logs for detailed troubleshooting",
+        "• Verify your internet connection and API key",
+        "• Try running failed demos individually for better debugging",
+    ]
+    return lines
+
+
+class SuiteReportWriter:
+    """Writes suite results incrementally as text, JSON Lines and CSV."""
+    
+    CSV_FIELDS = [
+        "recorded_at", "demo_name", "success", "execution_time",
+        "steps_completed", "steps_total", "error_count", "warning_count",
+        "error_types", "log_path"
+    ]
+    
+    def __init__(self, output_dir: str = "demo/logs", prefix: str = "comprehensive_report"):
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        base_path = os.path.join(output_dir, f"{prefix}_{timestamp}")
+        
+        self.output_dir = output_dir
+        self.text_path = f"{base_path}.txt"
+        self.jsonl_path = f"{base_path}.jsonl"
+        self.csv_path = f"{base_path}.csv"
+        self.stats = ReportStats()
+        self.env_info: Optional[EnvironmentInfo] = None
+        
+        self._text_file = None
+        self._jsonl_file = None
+        self._csv_file = None
+        self._csv_writer = None
+        self._lock = threading.Lock()
+    
+    @property
+    def is_open(self) -> bool:
+        """Whether the report files are open for writing."""
+        return self._text_file is not None
+    
+    def open(self, env_info: Optional[EnvironmentInfo] = None):
+        """Create the report files and write their headers."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.env_info = env_info
+        
+        self._text_file = open(self.text_path, "w", encoding="utf-8")
+        self._jsonl_file = open(self.jsonl_path, "w", encoding="utf-8")
+        self._csv_file = open(self.csv_path, "w", encoding="utf-8", newline="")
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=self.CSV_FIELDS)
+        self._csv_writer.writeheader()
+        
+        header = [
+            "",
+            "Nova Act Demo Suite Comprehensive Report",
+            "=" * 80,
+            f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        ]
+        header += format_environment(env_info)
+        header += ["", "RESULTS (in completion order)", "=" * 40]
+        self._write_text(header)
+        self._flush()
+    
+    def write_result(self, result: DemoResult):
+        """Append one result to every report format and flush it to disk."""
+        recorded_at = datetime.now().isoformat()
+        
+        with self._lock:
+            self.stats.add(result)
+            if not self.is_open:
+                return
+            
+            status = "✅" if result.success else "❌"
+            lines = format_result(result)
+            lines[0] = f"{status} {lines[0]}"
+            self._write_text(lines)
+            
+            entry = {"recorded_at": recorded_at, **result.to_dict()}
+            self._jsonl_file.write(json.dumps(entry, default=str) + "\n")
+            
+            self._csv_writer.writerow({
+                "recorded_at": recorded_at,
+                "demo_name": result.demo_name,
+                "success": result.success,
+                "execution_time": f"{result.execution_time:.2f}",
+                "steps_completed": result.steps_completed,
+                "steps_total": result.steps_total,
+                "error_count": len(result.errors),
+                "warning_count": len(result.warnings),
+                "error_types": ";".join(error.error_type for error in result.errors),
+                "log_path": result.log_path,
+            })
+            self._flush()
+    
+    def close(self, total_duration: float = 0.0) -> str:
+        """
+        Write the summary and recommendations, then close all report files.
+        
+        Args:
+            total_duration: Wall-clock duration of the suite in seconds
+        
+        Returns:
+            str: Path of the text report
+        """
+        with self._lock:
+            if not self.is_open:
+                return self.text_path
+            
+            lines = [""] + format_summary(self.stats, total_duration)
+            lines += format_recommendations(self.stats, self.env_info)
+            self._write_text(lines)
+            
+            for report_file in (self._text_file, self._jsonl_file, self._csv_file):
+                report_file.close()
+            self._text_file = self._jsonl_file = self._csv_file = None
+            self._csv_writer = None
+        
+        return self.text_path
+    
+    def _write_text(self, lines: List[str]):
+        """Write lines to the text report."""
+        self._text_file.write("\n".join(lines) + "\n")
+    
+    def _flush(self):
+        """Flush all report files so partial results are visible to readers."""
+        for report_file in (self._text_file, self._jsonl_file, self._csv_file):
+            report_file.flush()
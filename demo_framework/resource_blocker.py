@@ -0,0 +1,154 @@
+"""
+Request blocking for extraction-only browser sessions.
+
+Most of the bandwidth and load time of the pages we scrape goes to images,
+fonts, media and third-party trackers that an extraction never reads. A
+ResourceBlocker installs a route on a NovaAct's Playwright page that aborts
+those requests, and counts what it saved. Sessions opened with
+ResourceBlocker.open() start on a blank page and get the route before they
+navigate, so the landing page itself loads without those resources.
+
+Only use it where the page is read for text: blocked images also disappear
+from the screenshots the agent sees, which can hurt visual navigation.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional
+from urllib.parse import urlparse
+import threading
+import weakref
+
+
+class ResourceBlocker:
+    """Aborts requests for resources an extraction does not need."""
+    
+    # Playwright resource types that can be blocked; "tracker" matches TRACKER_DOMAINS
+    RESOURCE_TYPES = ("image", "font", "media", "tracker")
+    
+    # Ad, analytics and tag manager hosts, blocked with their subdomains
+    TRACKER_DOMAINS = (
+        "google-analytics.com", "googletagmanager.com", "googlesyndication.com",
+        "doubleclick.net", "googleadservices.com", "facebook.net", "connect.facebook.com",
+        "scorecardresearch.com", "quantserve.com", "hotjar.com", "segment.io",
+        "segment.com", "mixpanel.com", "amplitude.com", "criteo.com", "taboola.com",
+        "outbrain.com", "adsrvr.org", "amazon-adsystem.com", "newrelic.com", "nr-data.net"
+    )
+    
+    # Typical transfer sizes (HTTP Archive medians, rounded) used to estimate
+    # the bytes saved, since blocked responses are never downloaded
+    ESTIMATED_BYTES = {"image": 15_000, "font": 25_000, "media": 250_000, "tracker": 10_000}
+    
+    def __init__(self, block: Optional[Iterable[str]] = None):
+        """
+        Args:
+            block: Resource types to block (see RESOURCE_TYPES); all of them by default
+        
+        Raises:
+            ValueError: If an unknown resource type is given
+        """
+        self.block = set(self.RESOURCE_TYPES if block is None else block)
+        unknown = self.block - set(self.RESOURCE_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown resource types to block: {', '.join(sorted(unknown))}")
+        
+        self.blocked: Dict[str, int] = {resource: 0 for resource in self.block}
+        self.allowed = 0
+        self._pages = weakref.WeakSet()
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def open(self, url: str, **nova_kwargs) -> Iterator[Any]:
+        """
+        NovaAct on url with blocking in place before the page loads.
+        
+        The browser starts on about:blank, gets the route, then navigates to
+        url. If this NovaAct version rejects a blank starting page, it starts
+        on url and blocking covers what is loaded after that.
+        
+        Args:
+            url: Page to extract from
+            **nova_kwargs: Further NovaAct arguments (logs_directory, headless, ...)
+        """
+        from nova_act import NovaAct
+        
+        try:
+            nova = NovaAct(starting_page="about:blank", **nova_kwargs)
+            blank = True
+        except Exception:
+            nova = NovaAct(starting_page=url, **nova_kwargs)
+            blank = False
+        
+        nova.start()
+        try:
+            self.install(nova)
+            if blank:
+                nova.go_to_url(url)
+            yield nova
+        finally:
+            nova.stop()
+    
+    def install(self, nova: Any) -> bool:
+        """
+        Start blocking on a NovaAct's page; call on the thread that owns the session.
+        
+        Installing on a page that is already blocked does nothing, so steps
+        sharing a session can all call it.
+        
+        Returns:
+            bool: False if the session has no page to route
+        """
+        try:
+            page = nova.page
+        except Exception:
+            return False  # Not started, or a NovaAct without a Playwright page
+        
+        with self._lock:
+            if page in self._pages:
+                return True
+            self._pages.add(page)
+        page.route("**/*", self._route)
+        return True
+    
+    def _route(self, route: Any):
+        """Abort a request if its type or host is blocked."""
+        request = route.request
+        resource = self.classify(request.resource_type, request.url)
+        if resource is None:
+            with self._lock:
+                self.allowed += 1
+            route.continue_()
+            return
+        
+        with self._lock:
+            self.blocked[resource] += 1
+        route.abort("blockedbyclient")
+    
+    def classify(self, resource_type: str, url: str) -> Optional[str]:
+        """
+        Blocked category of a request.
+        
+        Returns:
+            Optional[str]: The blocked resource type, or None if the request goes through
+        """
+        if "tracker" in self.block:
+            host = (urlparse(url).hostname or "").lower()
+            if any(host == domain or host.endswith("." + domain) for domain in self.TRACKER_DOMAINS):
+                return "tracker"
+        if resource_type in self.block and resource_type != "tracker":
+            return resource_type
+        return None
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Requests blocked (per type and in total), let through, and estimated bytes saved."""
+        with self._lock:
+            blocked = dict(self.blocked)
+            allowed = self.allowed
+        return {
+            "requests_blocked": sum(blocked.values()),
+            "requests_allowed": allowed,
+            "blocked_by_type": blocked,
+            "estimated_bytes_saved": sum(
+                count * self.ESTIMATED_BYTES[resource] for resource, count in blocked.items()
+            )
+        }
@@ -0,0 +1,101 @@
+"""
+State shared by every demo of a run.
+
+Creating a demo used to build its own ConfigManager (with a fresh geolocation
+lookup), ErrorHandler and console handler and to create the demo directories
+again. A RunContext does that work once per process or suite; demos take
+their shared pieces from it, so instantiating a demo is nearly free.
+"""
+
+from typing import Any, Dict, Optional
+import logging
+import os
+import threading
+
+from .config_manager import ConfigManager, EnvironmentInfo
+from .error_handler import ErrorHandler
+from .logger import Logger
+from .step_cache import StepCache
+from .act_cache import ActCache
+
+
+class RunContext:
+    """Configuration, environment, directories and log sinks shared by demos."""
+    
+    DIRECTORIES = (
+        "demo/logs",
+        "demo/screenshots",
+        "demo/downloads",
+        "demo/saved_content",
+        "demo/sessions"
+    )
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 environment: Optional[EnvironmentInfo] = None, log_level: str = "INFO"):
+        """
+        Args:
+            config: Settings applied to every demo, below each demo's own config
+            environment: Already detected environment, e.g. passed to worker
+                processes so they skip the geolocation lookup
+            log_level: Log level of demo loggers
+        """
+        self.config = dict(config or {})
+        self.log_level = log_level
+        self.config_manager = ConfigManager()
+        if environment is not None:
+            self.config_manager.environment_cache = environment
+        self.error_handler = ErrorHandler()
+        self.step_cache = StepCache()
+        self.act_cache = ActCache()
+        
+        self.console_handler = logging.StreamHandler()
+        self.console_handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+        
+        self._directories_ready = False
+        self._lock = threading.Lock()
+    
+    @property
+    def environment(self) -> EnvironmentInfo:
+        """Detected environment, looked up once per context."""
+        return self.config_manager.detect_environment()
+    
+    def demo_config(self, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """A demo's configuration on top of the shared settings."""
+        return {**self.config, **(config or {})}
+    
+    def create_logger(self, name: str) -> Logger:
+        """Logger writing to its own file and to the shared console handler."""
+        return Logger(name, self.log_level, console_handler=self.console_handler)
+    
+    def ensure_directories(self):
+        """Create the demo directories, once per context."""
+        with self._lock:
+            if self._directories_ready:
+                return
+            for directory in self.DIRECTORIES:
+                os.makedirs(directory, exist_ok=True)
+            self._directories_ready = True
+
+
+_shared_context: Optional[RunContext] = None
+_shared_lock = threading.Lock()
+
+
+def get_run_context() -> RunContext:
+    """Get the run context of this process, creating a default one if needed."""
+    global _shared_context
+    with _shared_lock:
+        if _shared_context is None:
+            _shared_context = RunContext()
+        return _shared_context
+
+
+def set_run_context(context: RunContext) -> RunContext:
+    """Make a context the one demos created in this process use by default."""
+    global _shared_context
+    with _shared_lock:
+        _shared_context = context
+    return context
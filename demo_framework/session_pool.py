@@ -0,0 +1,279 @@
+"""
+Pool of warm NovaAct browser sessions for fan-out work.
+
+Map-reduce style demos used to start and tear down a browser per task, so
+for many small tasks browser startup dominated. A SessionPool keeps started
+headless sessions between tasks and points a borrowed session at the task's
+starting page instead. Each session is pinned to its own thread (Playwright's
+sync API must stay on the thread that started it), so any number of worker
+threads or coroutines can borrow from the same pool. Sessions are recycled
+between tasks after max_uses tasks, max_acts actions, or when an optional
+MemoryWatchdog reports their browser grew past its memory limit.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable, Dict, Iterator, AsyncIterator, List, Optional
+import asyncio
+import contextvars
+import threading
+
+from .memory_watchdog import MemoryWatchdog
+
+
+def _nova_act(nova, prompt: str, **kwargs) -> Any:
+    """Default action function: nova.act without extras."""
+    return nova.act(prompt, **kwargs)
+
+
+class PooledSession:
+    """A started NovaAct pinned to its own thread, lent out by a SessionPool."""
+    
+    def __init__(self, pool: "SessionPool"):
+        self.pool = pool
+        self.nova = None
+        self.uses = 0
+        self.acts = 0
+        self.broken = False
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pooled-browser")
+    
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """Run a function on this session's browser thread."""
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, self._guarded, func, args, kwargs)
+    
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a function on the browser thread and wait for its result."""
+        return self.submit(func, *args, **kwargs).result()
+    
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a function on the browser thread without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(func, *args, **kwargs))
+    
+    def act(self, prompt: str, **kwargs) -> Any:
+        """Run the pool's action function (nova.act by default) for this session."""
+        self.acts += 1
+        return self.call(self.pool.act_func, self.nova, prompt, **kwargs)
+    
+    async def act_async(self, prompt: str, **kwargs) -> Any:
+        """Async version of act()."""
+        self.acts += 1
+        return await self.call_async(self.pool.act_func, self.nova, prompt, **kwargs)
+    
+    def _guarded(self, func: Callable, args: tuple, kwargs: dict) -> Any:
+        """Run a call and mark the session for recycling if it fails."""
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            self.broken = True
+            raise
+    
+    def _start(self, starting_page: str):
+        """Start the browser on its thread."""
+        def start():
+            from nova_act import NovaAct
+            nova = NovaAct(starting_page=starting_page, **self.pool.nova_kwargs)
+            nova.start()
+            return nova
+        
+        watchdog = self.pool.watchdog
+        if watchdog is None:
+            self.nova = self.call(start)
+        else:
+            with watchdog.launching(self):
+                self.nova = self.call(start)
+    
+    def _navigate(self, url: str):
+        """Point the browser at a new task's starting page."""
+        self.call(self.nova.go_to_url, url)
+    
+    def _close(self):
+        """Stop the browser and release its thread."""
+        try:
+            if self.nova is not None:
+                self.call(self.nova.stop)
+        except Exception:
+            pass  # Already broken; the thread is released either way
+        finally:
+            self.nova = None
+            self._executor.shutdown(wait=False)
+            if self.pool.watchdog is not None:
+                self.pool.watchdog.unregister(self)
+
+
+class SessionPool:
+    """Thread-safe pool of warm NovaAct sessions."""
+    
+    def __init__(self, size: int = 3, max_uses: int = 20,
+                 act: Optional[Callable[..., Any]] = None,
+                 max_acts: Optional[int] = None,
+                 watchdog: Optional[MemoryWatchdog] = None,
+                 on_recycle: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 **nova_kwargs):
+        """
+        Args:
+            size: Maximum number of sessions open (and lent out) at once
+            max_uses: Tasks a session serves before it is replaced by a fresh one
+            act: Function called as act(nova, prompt, **kwargs) by
+                PooledSession.act, e.g. a demo's BaseDemo.act for rate
+                limiting and deadlines; defaults to nova.act
+            max_acts: Actions a session runs before it is replaced (no limit by default)
+            watchdog: Memory watchdog; sessions whose browser is over its
+                limit are replaced between tasks
+            on_recycle: Called with each recycle event (see recycles)
+            **nova_kwargs: NovaAct arguments for every session; headless
+                defaults to True
+        """
+        nova_kwargs.setdefault("headless", True)
+        self.size = size
+        self.max_uses = max_uses
+        self.max_acts = max_acts
+        self.act_func = act or _nova_act
+        self.watchdog = watchdog
+        self.on_recycle = on_recycle
+        self.nova_kwargs: Dict[str, Any] = nova_kwargs
+        self.started = 0
+        self.recycles: List[Dict[str, Any]] = []  # Sessions retired for age or memory
+        self._idle: List[PooledSession] = []
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    @contextmanager
+    def session(self, starting_page: str, timeout: Optional[float] = None) -> Iterator[PooledSession]:
+        """
+        Borrow a session already showing starting_page.
+        
+        Waits for a free session if all of them are lent out. A session whose
+        calls raised, or that reached max_uses, is closed on return instead
+        of going back to the pool.
+        
+        Args:
+            starting_page: Page the task starts on
+            timeout: Maximum seconds to wait for a free session
+        
+        Raises:
+            TimeoutError: If no session becomes free within timeout
+        """
+        session = self._checkout(starting_page, timeout)
+        failed = False
+        try:
+            yield session
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._checkin(session, failed)
+    
+    @asynccontextmanager
+    async def async_session(self, starting_page: str,
+                            timeout: Optional[float] = None) -> AsyncIterator[PooledSession]:
+        """Borrow a session from a coroutine; use act_async()/call_async() on it."""
+        checkout = asyncio.ensure_future(asyncio.to_thread(self._checkout, starting_page, timeout))
+        try:
+            session = await asyncio.shield(checkout)
+        except asyncio.CancelledError:
+            # The checkout keeps running in its thread; give its session back
+            checkout.add_done_callback(
+                lambda done: done.exception() is None and self._checkin(done.result(), False)
+            )
+            raise
+        
+        failed = False
+        try:
+            yield session
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            await asyncio.to_thread(self._checkin, session, failed)
+    
+    def close(self):
+        """Close all idle sessions; sessions still lent out close on return."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for session in idle:
+            session._close()
+    
+    def __enter__(self) -> "SessionPool":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+    
+    def _checkout(self, starting_page: str, timeout: Optional[float]) -> PooledSession:
+        """Take a free session, or start one, and navigate it to starting_page."""
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No browser session became free within {timeout:.0f}s")
+        
+        try:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Session pool is closed")
+                session = self._idle.pop() if self._idle else None
+            
+            if session is not None and self._recycle_reason(session) == "memory":
+                # Grew while idle; the watchdog sampled it since its last task
+                self._recycle(session, "memory")
+                session = None
+            
+            if session is not None:
+                try:
+                    session._navigate(starting_page)
+                    return session
+                except Exception:
+                    session._close()  # Recycle a session that cannot navigate
+            
+            session = PooledSession(self)
+            try:
+                session._start(starting_page)
+            except BaseException:
+                session._close()
+                raise
+            with self._lock:
+                self.started += 1
+            return session
+        except BaseException:
+            self._slots.release()
+            raise
+    
+    def _checkin(self, session: PooledSession, failed: bool):
+        """Return a borrowed session, recycling it if it failed or is used up."""
+        try:
+            session.uses += 1
+            reason = self._recycle_reason(session)
+            with self._lock:
+                keep = not (failed or session.broken or self._closed or reason)
+                if keep:
+                    self._idle.append(session)
+            if reason and not (failed or session.broken):
+                self._recycle(session, reason)
+            elif not keep:
+                session._close()
+        finally:
+            self._slots.release()
+    
+    def _recycle_reason(self, session: PooledSession) -> Optional[str]:
+        """Why a healthy session should be replaced now, if it should."""
+        if self.watchdog is not None and self.watchdog.over_limit(session):
+            return "memory"
+        if self.max_acts is not None and session.acts >= self.max_acts:
+            return "max_acts"
+        if session.uses >= self.max_uses:
+            return "max_uses"
+        return None
+    
+    def _recycle(self, session: PooledSession, reason: str):
+        """Close a session that aged out or grew too large, and record why."""
+        event = {
+            "reason": reason,
+            "uses": session.uses,
+            "acts": session.acts,
+            "rss_mb": self.watchdog.rss_mb(session) if self.watchdog is not None else None
+        }
+        session._close()
+        with self._lock:
+            self.recycles.append(event)
+        if self.on_recycle:
+            self.on_recycle(event)
@@ -0,0 +1,127 @@
+"""
+Browser sessions kept alive across the steps of a demo.
+
+Steps that work on the same site used to open their own NovaAct, paying for
+a browser launch and page load each time and repeating earlier navigation.
+The SessionProvider keeps one started NovaAct per site and hands it to every
+step that asks for that site; a step that needs a clean page asks for a reset.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+import threading
+
+from .rate_limiter import RateLimiter
+
+
+class SessionProvider:
+    """One live NovaAct per site, shared by the steps of a demo run."""
+    
+    def __init__(self, logger=None):
+        self.logger = logger
+        self.owner_thread: Optional[int] = None
+        self._sessions: Dict[str, Any] = {}
+        self._states: Dict[str, Dict[str, Any]] = {}
+    
+    @staticmethod
+    def site_key(url: str) -> str:
+        """Sessions are shared per domain."""
+        return RateLimiter.domain_key(url)
+    
+    def bind(self):
+        """
+        Make the calling thread the one whose sessions are kept alive.
+        
+        Playwright objects must stay on the thread that created them, so
+        steps running on other threads (e.g. in a StepGraph) get a private
+        browser for the duration of their `with` block instead.
+        """
+        self.owner_thread = threading.get_ident()
+    
+    @contextmanager
+    def session(self, url: str, reset: bool = False, **nova_kwargs) -> Iterator[Any]:
+        """
+        Use the site's live NovaAct, starting it on first use.
+        
+        The session outlives the `with` block. If the block raises, the
+        session is closed, since the page is in an unknown state.
+        
+        Args:
+            url: Starting page; the session is shared by all URLs of its domain
+            reset: Go back to the starting page and clear the session state first
+            **nova_kwargs: Further NovaAct arguments, used when the session starts
+        """
+        if threading.get_ident() != self.owner_thread:
+            from nova_act import NovaAct
+            with NovaAct(starting_page=url, **nova_kwargs) as nova:
+                yield nova
+            return
+        
+        key = self.site_key(url)
+        nova = self._sessions.get(key)
+        if nova is None:
+            nova = self._start(key, url, nova_kwargs)
+        elif reset:
+            nova = self._reset(key, nova, url, nova_kwargs)
+        
+        try:
+            yield nova
+        except BaseException:
+            self.close(url)
+            raise
+    
+    def state(self, url: str) -> Dict[str, Any]:
+        """
+        Scratch space describing where the site's session currently is.
+        
+        Steps record what they did to the page here (e.g. the search they ran)
+        so later steps can skip repeating it. It is cleared whenever the
+        session is started, reset or closed.
+        """
+        if threading.get_ident() != self.owner_thread:
+            return {}  # Private sessions start fresh every time
+        return self._states.setdefault(self.site_key(url), {})
+    
+    def close(self, url: str):
+        """Stop the session of a site, if one is open."""
+        key = self.site_key(url)
+        self._states.pop(key, None)
+        nova = self._sessions.pop(key, None)
+        if nova is not None:
+            self._stop(key, nova)
+    
+    def close_all(self):
+        """Stop every open session."""
+        for key in list(self._sessions):
+            self._states.pop(key, None)
+            self._stop(key, self._sessions.pop(key))
+    
+    def _start(self, key: str, url: str, nova_kwargs: Dict[str, Any]) -> Any:
+        """Start a NovaAct for a site and keep it."""
+        from nova_act import NovaAct
+        nova = NovaAct(starting_page=url, **nova_kwargs)
+        nova.start()
+        self._sessions[key] = nova
+        self._states[key] = {}
+        return nova
+    
+    def _reset(self, key: str, nova: Any, url: str, nova_kwargs: Dict[str, Any]) -> Any:
+        """Navigate a session back to its starting page, restarting it if that fails."""
+        self._states[key] = {}
+        try:
+            nova.go_to_url(url)
+            return nova
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Could not reset session for {url} ({e}), restarting it")
+            self._sessions.pop(key, None)
+            self._stop(key, nova)
+            return self._start(key, url, nova_kwargs)
+    
+    def _stop(self, key: str, nova: Any):
+        """Stop a NovaAct, logging instead of raising on failure."""
+        try:
+            nova.stop()
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Could not stop browser session for {key}: {e}")
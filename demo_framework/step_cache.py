@@ -0,0 +1,195 @@
+"""
+Disk cache for the output of demo steps.
+
+Probe steps such as site selection and accessibility checks give the same
+answer for a while. Decorating them with @cached_step stores their return
+value on disk, keyed by demo, step, arguments and the user's region, so
+reruns within the TTL skip the network and browser probing. A cached result
+naming a site whose circuit breaker is open is not used; the step runs
+again and picks from the sites that are still up.
+"""
+
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+import functools
+import glob
+import hashlib
+import inspect
+import json
+import os
+import time
+
+
+DEFAULT_STEP_CACHE_TTL = 3600
+
+
+class StepCache:
+    """JSON files holding cached step results, one file per key."""
+    
+    def __init__(self, cache_dir: str = "demo/cache/steps"):
+        self.cache_dir = cache_dir
+    
+    @staticmethod
+    def make_key(demo_name: str, step_name: str, args: tuple, kwargs: Dict[str, Any],
+                 region: str) -> str:
+        """Cache key for a step call."""
+        payload = json.dumps([demo_name, step_name, args, kwargs, region], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+    
+    def _path(self, demo_name: str, step_name: str, key: str) -> str:
+        """File of a cache entry; demo and step names make invalidation by glob possible."""
+        return os.path.join(self.cache_dir, f"{demo_name}__{step_name}__{key}.json")
+    
+    def get(self, demo_name: str, step_name: str, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached step result.
+        
+        Returns:
+            (hit, value); expired or unreadable entries are misses
+        """
+        path = self._path(demo_name, step_name, key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return False, None
+        
+        if entry.get("expires_at", 0) < time.time():
+            self._remove(path)
+            return False, None
+        return True, entry.get("value")
+    
+    def set(self, demo_name: str, step_name: str, key: str, value: Any,
+            ttl: float = DEFAULT_STEP_CACHE_TTL) -> bool:
+        """
+        Store a step result.
+        
+        Returns:
+            bool: False if the value is not JSON-serializable or cannot be written
+        """
+        now = time.time()
+        entry = {
+            "demo": demo_name,
+            "step": step_name,
+            "created_at": now,
+            "expires_at": now + ttl,
+            "value": value
+        }
+        path = self._path(demo_name, step_name, key)
+        try:
+            data = json.dumps(entry)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_file = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_file, path)
+            return True
+        except (TypeError, ValueError, OSError):
+            return False
+    
+    def invalidate(self, demo_name: Optional[str] = None, step_name: Optional[str] = None) -> int:
+        """
+        Remove cached entries.
+        
+        Args:
+            demo_name: Only remove entries of this demo class
+            step_name: Only remove entries of this step method
+        
+        Returns:
+            int: Number of entries removed
+        """
+        pattern = f"{demo_name or '*'}__{step_name or '*'}__*.json"
+        removed = 0
+        for path in glob.glob(os.path.join(self.cache_dir, pattern)):
+            removed += self._remove(path)
+        return removed
+    
+    def _remove(self, path: str) -> int:
+        """Delete a cache file, ignoring files that are already gone."""
+        try:
+            os.remove(path)
+            return 1
+        except OSError:
+            return 0
+
+
+def _site_urls(value: Any) -> Iterator[str]:
+    """URLs anywhere in a JSON-like step result."""
+    if isinstance(value, str):
+        if value.startswith(("http://", "https://")):
+            yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _site_urls(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _site_urls(item)
+
+
+def cached_step(ttl: float = DEFAULT_STEP_CACHE_TTL) -> Callable:
+    """
+    Cache a BaseDemo step method's return value on disk.
+    
+    The key includes the demo class, step name, call arguments and the
+    detected region. Results are not cached when the step raised or added a
+    warning (e.g. it had to fall back to another site), cached results that
+    name a site whose circuit breaker is open are ignored, and config
+    "use_step_cache": False bypasses the cache. Works for sync and async
+    steps; a cache hit is flagged on the step's StepMetrics.
+    
+    Args:
+        ttl: Seconds a cached result stays valid
+    """
+    def decorator(func: Callable) -> Callable:
+        step_name = func.__name__
+        
+        def lookup(demo, args, kwargs):
+            region = demo.config_manager.detect_environment().region
+            key = StepCache.make_key(demo.demo_name, step_name, args, kwargs, region)
+            hit, value = demo.step_cache.get(demo.demo_name, step_name, key)
+            if not hit:
+                return key, False, None
+            
+            skipped = [url for url in _site_urls(value) if demo.circuit_breakers.is_open(url)]
+            if skipped:
+                demo.logger.info(f"Not using cached result for {step_name}: circuit open for "
+                                 f"{', '.join(sorted(set(skipped)))}")
+                return key, False, None
+            
+            demo.logger.info(f"Using cached result for {step_name}")
+            metrics = demo._current_step.get()
+            if metrics is not None:
+                metrics.cached = True
+            return key, True, value
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(demo, *args, **kwargs):
+                if not demo.config.get("use_step_cache", True):
+                    return await func(demo, *args, **kwargs)
+                key, hit, value = lookup(demo, args, kwargs)
+                if hit:
+                    return value
+                warnings_before = len(demo.warnings)
+                value = await func(demo, *args, **kwargs)
+                if len(demo.warnings) == warnings_before:
+                    demo.step_cache.set(demo.demo_name, step_name, key, value, ttl)
+                return value
+            
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(demo, *args, **kwargs):
+            if not demo.config.get("use_step_cache", True):
+                return func(demo, *args, **kwargs)
+            key, hit, value = lookup(demo, args, kwargs)
+            if hit:
+                return value
+            warnings_before = len(demo.warnings)
+            value = func(demo, *args, **kwargs)
+            if len(demo.warnings) == warnings_before:
+                demo.step_cache.set(demo.demo_name, step_name, key, value, ttl)
+            return value
+        
+        return wrapper
+    
+    return decorator
@@ -0,0 +1,120 @@
+"""
+Dependency graph of demo steps.
+
+Steps declare the steps they depend on; steps whose dependencies have all
+finished run concurrently on a bounded thread pool instead of strictly one
+after another.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class Step:
+    """A single step of a demo and the steps it must wait for."""
+    name: str
+    func: Callable[[], Any]
+    depends_on: List[str] = field(default_factory=list)
+    description: str = ""
+
+
+class StepGraph:
+    """Runs demo steps in dependency order, independent steps in parallel."""
+    
+    def __init__(self):
+        self.steps: Dict[str, Step] = {}
+    
+    def add(self, name: str, func: Callable[[], Any], depends_on: Optional[List[str]] = None,
+            description: str = "") -> "StepGraph":
+        """
+        Add a step to the graph.
+        
+        Args:
+            name: Unique step name
+            func: Callable run for the step, typically a bound _step_* method
+            depends_on: Names of steps that must finish before this one starts
+            description: Message logged when the step completes
+        
+        Returns:
+            StepGraph: The graph itself, so calls can be chained
+        """
+        if name in self.steps:
+            raise ValueError(f"Duplicate step: {name}")
+        self.steps[name] = Step(name, func, list(depends_on or []), description)
+        return self
+    
+    def validate(self):
+        """Check that all dependencies exist and the graph has no cycles."""
+        for step in self.steps.values():
+            for dependency in step.depends_on:
+                if dependency not in self.steps:
+                    raise ValueError(f"Step '{step.name}' depends on unknown step '{dependency}'")
+        
+        visiting, visited = set(), set()
+        
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through step '{name}'")
+            visiting.add(name)
+            for dependency in self.steps[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+        
+        for name in self.steps:
+            visit(name)
+    
+    def run(self, max_workers: int = 1,
+            on_complete: Optional[Callable[[Step, Any], None]] = None) -> Dict[str, Any]:
+        """
+        Run all steps, starting each one as soon as its dependencies finish.
+        
+        If a step raises, no further steps are started; steps already running
+        are allowed to finish and the first exception is re-raised.
+        
+        Args:
+            max_workers: Maximum number of steps running at the same time
+            on_complete: Called with each step and its return value as it finishes
+        
+        Returns:
+            Dict[str, Any]: Step return values keyed by step name
+        """
+        self.validate()
+        
+        results: Dict[str, Any] = {}
+        remaining = dict(self.steps)
+        running = {}
+        failure: Optional[BaseException] = None
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="step") as executor:
+            while remaining or running:
+                if failure is None:
+                    ready = [
+                        step for step in remaining.values()
+                        if all(dependency in results for dependency in step.depends_on)
+                    ]
+                    for step in ready:
+                        del remaining[step.name]
+                        running[executor.submit(step.func)] = step
+                
+                if not running:
+                    break
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    try:
+                        results[step.name] = future.result()
+                    except BaseException as e:
+                        failure = failure or e
+                        continue
+                    if on_complete:
+                        on_complete(step, results[step.name])
+        
+        if failure is not None:
+            raise failure
+        return results
@@ -0,0 +1,299 @@
+"""
+SQLite-backed work queue for running the demo suite across several workers.
+
+A coordinator enqueues demo jobs; workers on the same machine or on other
+Linux boxes sharing the database file claim jobs, run them and push the
+DemoResult back. Claims are leased for a short time that the worker keeps
+renewing with a heartbeat while the demo runs, so jobs held by a worker that
+died are handed out again within minutes, and a worker that lost its lease
+cannot overwrite the result of the worker that took the job over.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Collection, Dict, Iterator, List, Optional, Tuple
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+from .base_demo import DemoResult
+
+
+class WorkQueue:
+    """Durable job queue stored in a single SQLite database file."""
+    
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    CANCELLED = "cancelled"
+    
+    def __init__(self, path: str = "demo/queue/suite_queue.db",
+                 lease_seconds: float = 120, max_attempts: int = 3):
+        """
+        Args:
+            path: SQLite database file shared by coordinator and workers
+            lease_seconds: Time a claim stays valid without a heartbeat;
+                workers renew it every quarter of this while a job runs
+            max_attempts: Claims of a job before it is reported abandoned
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._init_schema()
+    
+    @contextmanager
+    def _connect(self):
+        """Open an autocommit connection with a generous busy timeout for concurrent workers."""
+        connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        try:
+            yield connection
+        finally:
+            connection.close()
+    
+    def _init_schema(self):
+        """Create the jobs table if needed."""
+        with self._connect() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id TEXT NOT NULL,
+                    job_key TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    worker TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    enqueued_at REAL NOT NULL,
+                    leased_at REAL,
+                    finished_at REAL,
+                    result TEXT
+                )
+            """)
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id)"
+            )
+    
+    @staticmethod
+    def default_worker_id() -> str:
+        """Worker identifier made of host name and process id."""
+        return f"{socket.gethostname()}:{os.getpid()}"
+    
+    @staticmethod
+    def new_run_id() -> str:
+        """Unique identifier for a coordinator run (timestamp for readability, uuid for uniqueness)."""
+        return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex}"
+    
+    def enqueue(self, run_id: str, job_key: str, payload: Dict[str, Any]) -> int:
+        """
+        Add a job to the queue.
+        
+        Args:
+            run_id: Coordinator run the job belongs to
+            job_key: Identifier of the job within the run, e.g. the demo file
+            payload: JSON-serializable job description
+        
+        Returns:
+            int: Job id
+        """
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO jobs (run_id, job_key, payload, status, enqueued_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (run_id, job_key, json.dumps(payload, default=str), self.PENDING, time.time())
+            )
+            return cursor.lastrowid
+    
+    def claim(self, worker_id: str, run_id: Optional[str] = None) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Atomically lease the oldest pending job of a run.
+        
+        Jobs whose lease expired (their worker died) are made pending again
+        first, up to max_attempts.
+        
+        Args:
+            worker_id: Identifier recorded on the claimed job
+            run_id: Run to take jobs from; by default the most recently
+                enqueued run that has pending jobs, so jobs left over from an
+                abandoned run do not hold up the current one
+        
+        Returns:
+            (job_id, payload), or None if no job is available
+        """
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                connection.execute(
+                    "UPDATE jobs SET status = ?, worker = NULL "
+                    "WHERE status = ? AND leased_at < ? AND attempts < ?",
+                    (self.PENDING, self.RUNNING, now - self.lease_seconds, self.max_attempts)
+                )
+                if run_id is None:
+                    latest = connection.execute(
+                        "SELECT run_id FROM jobs WHERE status = ? ORDER BY id DESC LIMIT 1",
+                        (self.PENDING,)
+                    ).fetchone()
+                    run_id = latest["run_id"] if latest is not None else None
+                row = connection.execute(
+                    "SELECT id, payload FROM jobs WHERE status = ? AND run_id = ? ORDER BY id LIMIT 1",
+                    (self.PENDING, run_id)
+                ).fetchone()
+                if row is not None:
+                    connection.execute(
+                        "UPDATE jobs SET status = ?, worker = ?, leased_at = ?, attempts = attempts + 1 "
+                        "WHERE id = ?",
+                        (self.RUNNING, worker_id, now, row["id"])
+                    )
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+        
+        if row is None:
+            return None
+        return row["id"], json.loads(row["payload"])
+    
+    def renew(self, job_id: int, worker_id: str) -> bool:
+        """
+        Extend the lease on a claimed job.
+        
+        Returns:
+            bool: False if the worker no longer holds the job
+        """
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET leased_at = ? WHERE id = ? AND worker = ? AND status = ?",
+                (time.time(), job_id, worker_id, self.RUNNING)
+            )
+            return cursor.rowcount == 1
+    
+    @contextmanager
+    def heartbeat(self, job_id: int, worker_id: str) -> Iterator[None]:
+        """Renew the lease on a job in a background thread while the block runs."""
+        stop = threading.Event()
+        
+        def beat():
+            while not stop.wait(self.lease_seconds / 4):
+                try:
+                    if not self.renew(job_id, worker_id):
+                        return  # Lease lost; complete() will refuse the result
+                except sqlite3.Error:
+                    pass  # Database busy; the next beat may get through
+        
+        thread = threading.Thread(target=beat, name=f"lease-{job_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+    
+    def complete(self, job_id: int, result: DemoResult, worker_id: str) -> bool:
+        """
+        Store the result of a job the worker still holds.
+        
+        Returns:
+            bool: False if the lease was lost and the job reclaimed, in which
+            case the result is discarded
+        """
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, result = ? "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (self.DONE, time.time(), json.dumps(result.to_dict(), default=str),
+                 job_id, worker_id, self.RUNNING)
+            )
+            return cursor.rowcount == 1
+    
+    def release(self, job_id: int, worker_id: str) -> bool:
+        """
+        Return a job the worker holds to the queue without a result.
+        
+        Returns:
+            bool: False if the worker no longer held the job
+        """
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = ?, worker = NULL, leased_at = NULL "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (self.PENDING, job_id, worker_id, self.RUNNING)
+            )
+            return cursor.rowcount == 1
+    
+    def cancel(self, run_id: str) -> int:
+        """
+        Withdraw the jobs of a run that no worker has claimed yet.
+        
+        Returns:
+            int: Number of jobs cancelled
+        """
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = ? WHERE run_id = ? AND status = ?",
+                (self.CANCELLED, run_id, self.PENDING)
+            )
+            return cursor.rowcount
+    
+    def counts(self, run_id: Optional[str] = None) -> Dict[str, int]:
+        """Number of jobs per status, optionally for a single run."""
+        query = "SELECT status, COUNT(*) AS n FROM jobs"
+        params: tuple = ()
+        if run_id:
+            query += " WHERE run_id = ?"
+            params = (run_id,)
+        query += " GROUP BY status"
+        
+        with self._connect() as connection:
+            counts = {self.PENDING: 0, self.RUNNING: 0, self.DONE: 0, self.CANCELLED: 0}
+            counts.update({row["status"]: row["n"] for row in connection.execute(query, params)})
+            return counts
+    
+    def finished_results(self, run_id: str,
+                         exclude: Collection[int] = ()) -> List[Tuple[int, str, DemoResult, float]]:
+        """
+        Get finished jobs of a run.
+        
+        Finish times are stamped by each worker's own clock, so callers
+        polling for new results pass the ids they already have rather than
+        a time watermark.
+        
+        Args:
+            run_id: Coordinator run
+            exclude: Ids of jobs already collected; their results are not loaded
+        
+        Returns:
+            List of (job_id, job_key, DemoResult, finished_at) ordered by finish time
+        """
+        with self._connect() as connection:
+            finished = connection.execute(
+                "SELECT id FROM jobs WHERE run_id = ? AND status = ?",
+                (run_id, self.DONE)
+            ).fetchall()
+            new_ids = [row["id"] for row in finished if row["id"] not in exclude]
+            if not new_ids:
+                return []
+            rows = connection.execute(
+                "SELECT id, job_key, result, finished_at FROM jobs "
+                f"WHERE id IN ({', '.join('?' * len(new_ids))}) ORDER BY finished_at, id",
+                new_ids
+            ).fetchall()
+        
+        return [
+            (row["id"], row["job_key"], DemoResult.from_dict(json.loads(row["result"])), row["finished_at"])
+            for row in rows
+        ]
+    
+    def abandoned_jobs(self, run_id: str) -> List[Tuple[int, str]]:
+        """Jobs whose lease expired after max_attempts and will never finish."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT id, job_key FROM jobs "
+                "WHERE run_id = ? AND status = ? AND leased_at < ? AND attempts >= ?",
+                (run_id, self.RUNNING, time.time() - self.lease_seconds, self.max_attempts)
+            ).fetchall()
+        return [(row["id"], row["job_key"]) for row in rows]
@@ -10,22 +10,256 @@ providing comprehensive error handling, geographic awareness, and detailed repor
 import os
 import sys
 import time
+import argparse
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import json
 
 # Import framework components
-from demo_framework import BaseDemo, DemoResult, ConfigManager, Logger
+from demo_framework import (
+    BaseDemo, DemoResult, DemoError, DemoManifest, ResultJournal, DurationHistory, StepCache,
+    ActCache, CancelToken, EnvironmentInfo, RunContext, set_run_context, get_circuit_breakers
+)
+from demo_framework.work_queue import WorkQueue
+from demo_framework.report_writer import (
+    SuiteReportWriter, ReportStats, format_summary, format_environment,
+    format_result, format_recommendations
+)
+
+
+# Display metadata for the bundled demos. Class names, categories and step
+# counts come from the demo manifest; demos found on disk that are not listed
+# here are still run, with default metadata.
+DEMO_METADATA = {
+    "01_basic_ecommerce.py": {
+        "name": "Basic E-commerce Operations",
+        "description": "Search products, view details, add to cart",
+        "priority": 1,
+        "estimated_duration": 60
+    },
+    "02_information_extraction.py": {
+        "name": "Information Extraction",
+        "description": "Extract structured data from websites",
+        "priority": 2,
+        "estimated_duration": 45
+    },
+    "03_parallel_processing.py": {
+        "name": "Parallel Processing",
+        "description": "Run multiple browser instances in parallel",
+        "priority": 3,
+        "estimated_duration": 90
+    },
+    "04_authentication_demo.py": {
+        "name": "Authentication Demo",
+        "description": "Handle login forms and session management",
+        "priority": 2,
+        "estimated_duration": 30
+    },
+    "05_file_operations.py": {
+        "name": "File Operations",
+        "description": "Upload, download, and manage files",
+        "priority": 2,
+        "estimated_duration": 40
+    },
+    "06_form_filling.py": {
+        "name": "Form Filling",
+        "description": "Fill out complex web forms automatically",
+        "priority": 2,
+        "estimated_duration": 35
+    },
+    "07_search_filter.py": {
+        "name": "Search and Filter",
+        "description": "Advanced search with filters and sorting",
+        "priority": 2,
+        "estimated_duration": 50
+    },
+    "08_real_estate.py": {
+        "name": "Real Estate Search",
+        "description": "Search properties with location-based filtering",
+        "priority": 2,
+        "estimated_duration": 55
+    },
+    "09_interactive_demo.py": {
+        "name": "Interactive Demo",
+        "description": "Interactive debugging and step-by-step execution",
+        "priority": 3,
+        "estimated_duration": 120
+    },
+    "10_advanced_features.py": {
+        "name": "Advanced Features",
+        "description": "Advanced Nova Act features and integrations",
+        "priority": 3,
+        "estimated_duration": 100
+    }
+}
+
+DEFAULT_PRIORITY = 3
+DEFAULT_ESTIMATED_DURATION = 60
+DEFAULT_DEMO_DEADLINE = 900  # Used until the duration history has enough runs
+DEFAULT_WORKER_WAIT = 300  # Distributed runs give up if no worker claims a job by then
+
+
+def execute_demo(demo_info: Dict[str, Any], config: Dict[str, Any],
+                 cancel_token: CancelToken = None) -> DemoResult:
+    """
+    Load a demo file and run it, never raising.
+    
+    This is a module-level function so it can be shipped to worker
+    processes; the returned DemoResult is pickled back to the orchestrator.
+    
+    Args:
+        demo_info: Demo metadata from get_available_demos
+        config: Recommended configuration for the demo category
+        cancel_token: Token the caller can use to stop the demo (same process only)
+        
+    Returns:
+        DemoResult: Result of the demo, or an error result if it could not run
+    """
+    start_time = time.time()
+    
+    try:
+        # Import the demo module dynamically
+        import importlib.util
+        spec = importlib.util.spec_from_file_location("demo", demo_info["file"])
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        
+        # Use the class found by the manifest, or look for a BaseDemo subclass
+        demo_instance = None
+        demo_class = getattr(module, demo_info.get("class_name") or "", None)
+        if demo_class is None:
+            for attr_name in dir(module):
+                attr = getattr(module, attr_name)
+                if (isinstance(attr, type) and 
+                    issubclass(attr, BaseDemo) and 
+                    attr != BaseDemo):
+                    demo_class = attr
+                    break
+        
+        if demo_class is not None:
+            demo_instance = demo_class(config)
+            if cancel_token is not None:
+                demo_instance.cancel_token = cancel_token
+        
+        if demo_instance:
+            # Run using new framework
+            return demo_instance.run()
+        
+        # Fallback to old-style main() function
+        if hasattr(module, 'main'):
+            module.main()
+            # Create a basic result
+            return DemoResult(
+                demo_name=demo_info["name"],
+                success=True,
+                execution_time=time.time() - start_time,
+                steps_completed=1,
+                steps_total=1
+            )
+        
+        raise Exception("No main() function or BaseDemo class found")
+        
+    except Exception as e:
+        return _create_error_result(demo_info, e, time.time() - start_time)
+
+
+def _create_error_result(demo_info: Dict[str, Any], error: BaseException, execution_time: float) -> DemoResult:
+    """Create a failed DemoResult for a demo that could not be run."""
+    return DemoResult(
+        demo_name=demo_info["name"],
+        success=False,
+        execution_time=execution_time,
+        steps_completed=0,
+        steps_total=1,
+        errors=[DemoError(
+            error_type=type(error).__name__,
+            message=str(error),
+            timestamp=datetime.now()
+        )]
+    )
+
+
+def _init_demo_worker(environment: Optional[EnvironmentInfo] = None):
+    """
+    Warm up a demo worker process before it receives its first demo.
+    
+    Installs a run context shared by all demos the worker runs, seeded with
+    the orchestrator's environment so workers skip the geolocation lookup.
+    """
+    set_run_context(RunContext(environment=environment)).ensure_directories()
+
+
+def run_queue_worker(queue_path: str, worker_id: str = None, idle_timeout: float = 0.0,
+                     poll_interval: float = 2.0, run_id: Optional[str] = None) -> int:
+    """
+    Claim and run demo jobs from a shared work queue.
+    
+    Args:
+        queue_path: Path of the SQLite queue shared with the coordinator
+        worker_id: Identifier recorded on claimed jobs (default: host:pid)
+        idle_timeout: Seconds to keep polling an empty queue before exiting
+        poll_interval: Seconds between polls of an empty queue
+        run_id: Only run jobs of this coordinator run (default: the newest
+            run with pending jobs)
+        
+    Returns:
+        int: Number of demos this worker ran
+    """
+    queue = WorkQueue(queue_path)
+    worker_id = worker_id or WorkQueue.default_worker_id()
+    completed = 0
+    idle_since = time.time()
+    
+    while True:
+        job = queue.claim(worker_id, run_id)
+        if job is None:
+            if time.time() - idle_since >= idle_timeout:
+                break
+            time.sleep(poll_interval)
+            continue
+        
+        job_id, payload = job
+        demo_info = payload["demo_info"]
+        print(f"🔧 [{worker_id}] Running {demo_info['file']}")
+        
+        try:
+            with queue.heartbeat(job_id, worker_id):
+                result = execute_demo(demo_info, payload["config"])
+        except KeyboardInterrupt:
+            queue.release(job_id, worker_id)
+            raise
+        
+        idle_since = time.time()
+        if not queue.complete(job_id, result, worker_id):
+            print(f"⚠️ [{worker_id}] Lost the lease on {demo_info['file']}, result discarded")
+            continue
+        completed += 1
+        print(f"{'✅' if result.success else '❌'} [{worker_id}] {demo_info['file']} "
+              f"({result.execution_time:.2f}s)")
+    
+    return completed
 
 
 class DemoSuiteOrchestrator:
     """Orchestrates the execution of all Nova Act demos."""
     
-    def __init__(self):
-        self.config_manager = ConfigManager()
-        self.logger = Logger("DemoSuiteOrchestrator")
+    def __init__(self, journal_path: str = "demo/journal/suite_journal.jsonl",
+                 config_overrides: Dict[str, Any] = None):
+        # Shared by every demo run in this process
+        self.context = set_run_context(RunContext())
+        self.config_manager = self.context.config_manager
+        self.config_overrides = config_overrides or {}
+        self.logger = self.context.create_logger("DemoSuiteOrchestrator")
+        self.manifest = DemoManifest()
+        self.history = DurationHistory()
+        self.journal = ResultJournal(journal_path)
+        self.report_writer = None
+        self.env_info = None
         self.results = []
         self.start_time = None
+        self.cancel_tokens: Dict[int, CancelToken] = {}
         
     def validate_environment(self) -> bool:
         """Validate environment before running demos."""
@@ -40,6 +274,7 @@ class DemoSuiteOrchestrator:
         
         # Detect environment
         env_info = self.config_manager.detect_environment()
+        self.env_info = env_info
         self.logger.info(f"Environment detected: {env_info.country_code} ({env_info.region})")
         
         # Check internet connectivity
@@ -68,174 +303,167 @@ class DemoSuiteOrchestrator:
         return True
     
     def get_available_demos(self) -> List[Dict[str, Any]]:
-        """Get list of available demos with metadata."""
-        demos = [
-            {
-                "file": "01_basic_ecommerce.py",
-                "name": "Basic E-commerce Operations",
-                "description": "Search products, view details, add to cart",
-                "category": "ecommerce",
-                "priority": 1,
-                "estimated_duration": 60
-            },
-            {
-                "file": "02_information_extraction.py", 
-                "name": "Information Extraction",
-                "description": "Extract structured data from websites",
-                "category": "data_extraction",
-                "priority": 2,
-                "estimated_duration": 45
-            },
-            {
-                "file": "03_parallel_processing.py",
-                "name": "Parallel Processing",
-                "description": "Run multiple browser instances in parallel",
-                "category": "advanced",
-                "priority": 3,
-                "estimated_duration": 90
-            },
-            {
-                "file": "04_authentication_demo.py",
-                "name": "Authentication Demo", 
-                "description": "Handle login forms and session management",
-                "category": "authentication",
-                "priority": 2,
-                "estimated_duration": 30
-            },
-            {
-                "file": "05_file_operations.py",
-                "name": "File Operations",
-                "description": "Upload, download, and manage files",
-                "category": "file_handling",
-                "priority": 2,
-                "estimated_duration": 40
-            },
-            {
-                "file": "06_form_filling.py",
-                "name": "Form Filling",
-                "description": "Fill out complex web forms automatically",
-                "category": "forms",
-                "priority": 2,
-                "estimated_duration": 35
-            },
-            {
-                "file": "07_search_filter.py",
-                "name": "Search and Filter",
-                "description": "Advanced search with filters and sorting",
-                "category": "ecommerce",
-                "priority": 2,
-                "estimated_duration": 50
-            },
-            {
-                "file": "08_real_estate.py",
-                "name": "Real Estate Search",
-                "description": "Search properties with location-based filtering",
-                "category": "real_estate",
-                "priority": 2,
-                "estimated_duration": 55
-            },
-            {
-                "file": "09_interactive_demo.py",
-                "name": "Interactive Demo",
-                "description": "Interactive debugging and step-by-step execution",
-                "category": "debugging",
-                "priority": 3,
-                "estimated_duration": 120
-            },
-            {
-                "file": "10_advanced_features.py",
-                "name": "Advanced Features",
-                "description": "Advanced Nova Act features and integrations",
-                "category": "advanced",
-                "priority": 3,
-                "estimated_duration": 100
-            }
-        ]
+        """
+        Get list of available demos with metadata.
         
-        # Filter to only include existing files
+        Demos are discovered through the cached manifest, so no demo module
+        (and therefore neither nova_act nor pydantic) is imported here.
+        Estimated durations come from the duration history when available.
+        """
         available_demos = []
-        for demo in demos:
-            if os.path.exists(demo["file"]):
-                available_demos.append(demo)
-            else:
-                self.logger.warning(f"Demo file not found: {demo['file']}")
+        discovered = set()
+        
+        for entry in self.manifest.discover():
+            if not entry.class_name and not entry.has_main:
+                continue
+            
+            discovered.add(entry.file)
+            metadata = DEMO_METADATA.get(entry.file, {})
+            static_duration = metadata.get("estimated_duration", DEFAULT_ESTIMATED_DURATION)
+            available_demos.append({
+                "file": entry.file,
+                "name": metadata.get("name", entry.title or entry.file),
+                "description": metadata.get("description", entry.description),
+                "category": entry.category,
+                "class_name": entry.class_name,
+                "steps_total": entry.steps_total,
+                "priority": metadata.get("priority", DEFAULT_PRIORITY),
+                # Median of recent successful runs once there is enough history
+                "estimated_duration": round(self.history.estimate(entry.file, static_duration)),
+                "duration_p95": self.history.p95(entry.file)
+            })
+        
+        for demo_file in DEMO_METADATA:
+            if demo_file not in discovered:
+                self.logger.warning(f"Demo file not found: {demo_file}")
         
         return available_demos
     
     def run_single_demo(self, demo_info: Dict[str, Any]) -> DemoResult:
-        """Run a single demo and return results."""
+        """Run a single demo in this process and return results."""
         self.logger.info(f"Starting demo: {demo_info['name']}")
         
-        start_time = time.time()
+        config = self._demo_config(demo_info)
+        cancel_token = CancelToken()
+        self.cancel_tokens[id(demo_info)] = cancel_token
+        try:
+            result = execute_demo(demo_info, config, cancel_token)
+        finally:
+            self.cancel_tokens.pop(id(demo_info), None)
+        self._record_result(demo_info, result)
         
+        return result
+    
+    def cancel_running(self, reason: str = "Cancelled by the orchestrator"):
+        """
+        Ask every demo running in this process to stop.
+        
+        Demos stop at their next step or action checkpoint, which unwinds
+        their NovaAct blocks and closes the browsers.
+        """
+        for cancel_token in list(self.cancel_tokens.values()):
+            cancel_token.cancel(reason)
+    
+    def _demo_config(self, demo_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Recommended configuration for a demo with command line overrides applied.
+        
+        The demo's deadline is twice the p95 of its recorded durations, or
+        DEFAULT_DEMO_DEADLINE until there is enough history. Steps with
+        enough history get the same bound for each of their actions.
+        """
+        config = self.config_manager.get_recommended_config(demo_info["category"])
+        config["deadline_seconds"] = self.history.timeout(
+            demo_info["file"], DEFAULT_DEMO_DEADLINE, margin=2.0, minimum=60.0
+        )
+        config["step_timeouts"] = self.history.step_timeouts(demo_info["file"], margin=2.0, minimum=60.0)
+        config.update(self.config_overrides)
+        return config
+    
+    def _record_result(self, demo_info: Dict[str, Any], result: DemoResult):
+        """Log a finished demo, journal its result and stream it to the reports."""
+        self._log_demo_outcome(demo_info, result)
+        self.history.record(demo_info["file"], result)
         try:
-            # Import the demo module dynamically
-            import importlib.util
-            spec = importlib.util.spec_from_file_location("demo", demo_info["file"])
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            # Look for a demo class that inherits from BaseDemo
-            demo_instance = None
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (isinstance(attr, type) and 
-                    issubclass(attr, BaseDemo) and 
-                    attr != BaseDemo):
-                    # Found a demo class
-                    config = self.config_manager.get_recommended_config(demo_info["category"])
-                    demo_instance = attr(config)
-                    break
-            
-            if demo_instance:
-                # Run using new framework
-                result = demo_instance.run()
-            else:
-                # Fallback to old-style main() function
-                if hasattr(module, 'main'):
-                    module.main()
-                    # Create a basic result
-                    result = DemoResult(
-                        demo_name=demo_info["name"],
-                        success=True,
-                        execution_time=time.time() - start_time,
-                        steps_completed=1,
-                        steps_total=1
-                    )
-                else:
-                    raise Exception("No main() function or BaseDemo class found")
-            
-            self.logger.info(f"Demo completed: {demo_info['name']} ({'SUCCESS' if result.success else 'FAILED'})")
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Demo failed: {demo_info['name']} - {str(e)}")
-            
-            # Create error result
-            from demo_framework.base_demo import DemoError
-            error = DemoError(
-                error_type=type(e).__name__,
-                message=str(e),
-                timestamp=datetime.now()
-            )
-            
-            result = DemoResult(
-                demo_name=demo_info["name"],
-                success=False,
-                execution_time=time.time() - start_time,
-                steps_completed=0,
-                steps_total=1,
-                errors=[error]
-            )
-            
-            return result
+            self.journal.append(demo_info["file"], result)
+        except OSError as e:
+            self.logger.error(f"Failed to journal result for {demo_info['file']}: {e}")
+        
+        if self.report_writer:
+            try:
+                self.report_writer.write_result(result)
+            except OSError as e:
+                self.logger.error(f"Failed to write report entry for {demo_info['file']}: {e}")
     
-    def run_all_demos(self, selected_demos: List[str] = None) -> List[DemoResult]:
-        """Run all or selected demos."""
+    def _log_demo_outcome(self, demo_info: Dict[str, Any], result: DemoResult):
+        """Log the outcome of a finished demo."""
+        if result.success:
+            self.logger.info(f"Demo completed: {demo_info['name']} (SUCCESS)")
+        elif result.errors:
+            self.logger.error(f"Demo failed: {demo_info['name']} - {result.errors[-1].message}")
+        else:
+            self.logger.info(f"Demo completed: {demo_info['name']} (FAILED)")
+    
+    def run_all_demos(self, selected_demos: List[str] = None, jobs: int = 1,
+                      isolation: str = "thread", recycle_after: int = 1,
+                      resume: bool = False) -> List[DemoResult]:
+        """
+        Run all or selected demos.
+        
+        Args:
+            selected_demos: Optional list of demo files to run
+            jobs: Maximum number of demos to run concurrently. With more than
+                one job, demos are scheduled longest-first using their
+                estimated duration so the suite finishes close to the
+                duration of the slowest demo.
+            isolation: "thread" runs demos inside this process, "process"
+                runs them in a pool of worker processes
+            recycle_after: In process isolation, number of demos a worker
+                runs before it is replaced by a fresh process
+            resume: Reuse successful results from the journal of a previous
+                run and only run the demos that did not succeed
+                
+        Returns:
+            List[DemoResult]: Results in priority order
+        """
         self.start_time = time.time()
         self.logger.info("Starting Nova Act Demo Suite")
         
-        # Get available demos
+        available_demos = self._select_demos(selected_demos)
+        
+        # Reuse results journaled by an interrupted run
+        completed = {}
+        if resume:
+            completed = self.journal.get_successful()
+            if completed:
+                print(f"♻️ Resuming: {len(completed)} demo(s) already succeeded in the journal")
+                self.logger.info(f"Resuming from journal {self.journal.path}: skipping {sorted(completed)}")
+        self.journal.start(resume=resume)
+        
+        self._open_report_writer([completed[d["file"]] for d in available_demos if d["file"] in completed])
+        
+        pending_demos = [d for d in available_demos if d["file"] not in completed]
+        self.logger.info(f"Running {len(pending_demos)} demos")
+        
+        if not pending_demos:
+            results = []
+        elif isolation == "process":
+            results = self._run_demos_in_processes(pending_demos, jobs, recycle_after)
+        elif jobs > 1 and len(pending_demos) > 1:
+            results = self._run_demos_concurrently(pending_demos, jobs)
+        else:
+            results = self._run_demos_sequentially(pending_demos)
+        
+        # Merge new and journaled results back into priority order
+        new_results = {d["file"]: result for d, result in zip(pending_demos, results)}
+        self.results = [
+            new_results[d["file"]] if d["file"] in new_results else completed[d["file"]]
+            for d in available_demos
+        ]
+        return self.results
+    
+    def _select_demos(self, selected_demos: List[str] = None) -> List[Dict[str, Any]]:
+        """Get the available demos to run, filtered and sorted by priority."""
         available_demos = self.get_available_demos()
         
         # Filter selected demos if specified
@@ -244,14 +472,152 @@ class DemoSuiteOrchestrator:
         
         # Sort by priority
         available_demos.sort(key=lambda x: x["priority"])
+        return available_demos
+    
+    def _open_report_writer(self, previous_results: List[DemoResult] = None):
+        """Start streaming results to text, JSON Lines and CSV reports."""
+        self.env_info = self.env_info or self.config_manager.detect_environment()
+        self.report_writer = SuiteReportWriter()
+        self.report_writer.open(self.env_info)
+        for result in previous_results or []:
+            self.report_writer.write_result(result)
+    
+    def run_distributed(self, queue_path: str, selected_demos: List[str] = None,
+                        local_workers: int = 0, poll_interval: float = 2.0,
+                        timeout: Optional[float] = None,
+                        worker_wait: float = DEFAULT_WORKER_WAIT) -> List[DemoResult]:
+        """
+        Coordinate a suite run over a shared work queue.
+        
+        Demo jobs (file, class and recommended config) are enqueued longest
+        first. Workers started with --worker on any machine that can reach
+        the queue file claim and run them; local_workers additional worker
+        processes are started on this machine. Results are journaled and
+        streamed to the reports as they come back.
+        
+        The coordinator gives up if no worker has claimed a job after
+        worker_wait, or when the run takes longer than timeout (by default
+        the sum of the demos' deadlines, as if a single worker ran them all).
+        Jobs not yet claimed are then withdrawn and the demos without a
+        result are reported as failed.
+        
+        Args:
+            queue_path: Path of the SQLite queue database
+            selected_demos: Optional list of demo files to run
+            local_workers: Number of worker processes to start locally
+            poll_interval: Seconds between polls for finished jobs
+            timeout: Seconds to wait for the whole run
+            worker_wait: Seconds to wait for the first job to be claimed
+            
+        Returns:
+            List[DemoResult]: Results in priority order
+        """
+        self.start_time = time.time()
+        self.logger.info("Starting Nova Act Demo Suite (distributed)")
+        
+        demos = self._select_demos(selected_demos)
+        demos_by_file = {d["file"]: d for d in demos}
+        self.journal.start()
+        self._open_report_writer()
+        
+        queue = WorkQueue(queue_path)
+        run_id = WorkQueue.new_run_id()
+        total_deadline = 0.0
+        for demo_info in sorted(demos, key=lambda d: d.get("estimated_duration", 0), reverse=True):
+            config = self._demo_config(demo_info)
+            total_deadline += config.get("deadline_seconds") or DEFAULT_DEMO_DEADLINE
+            queue.enqueue(run_id, demo_info["file"], {"demo_info": demo_info, "config": config})
+        if timeout is None:
+            timeout = total_deadline
+        
+        print(f"\n{'='*80}")
+        print(f"Enqueued {len(demos)} demos in {queue_path} (run {run_id})")
+        print(f"Local workers: {local_workers}; remote workers: "
+              f"python run_all_demos.py --queue {queue_path} --worker --run-id {run_id}")
+        print(f"{'='*80}")
+        self.logger.info(f"Distributed run {run_id}: {len(demos)} jobs in {queue_path}")
+        
+        context = multiprocessing.get_context("spawn")
+        workers = []
+        
+        def start_local_worker():
+            worker = context.Process(
+                target=run_queue_worker,
+                args=(queue_path, f"{WorkQueue.default_worker_id()}-local{len(workers) + 1}", 0.0,
+                      poll_interval, run_id),
+                daemon=True
+            )
+            worker.start()
+            workers.append(worker)
         
-        self.logger.info(f"Running {len(available_demos)} demos")
+        for _ in range(local_workers):
+            start_local_worker()
         
+        results_by_file = {}
+        seen_jobs = set()
+        
+        while len(results_by_file) < len(demos):
+            for job_id, job_key, result, finished_at in queue.finished_results(run_id, exclude=seen_jobs):
+                seen_jobs.add(job_id)
+                results_by_file[job_key] = result
+                self._record_result(demos_by_file[job_key], result)
+                print(f"{'✅' if result.success else '❌'} [{len(results_by_file)}/{len(demos)}] "
+                      f"{demos_by_file[job_key]['name']} ({result.execution_time:.2f}s)")
+            
+            for job_id, job_key in queue.abandoned_jobs(run_id):
+                if job_key not in results_by_file:
+                    error = RuntimeError(f"Job {job_id} abandoned after {queue.max_attempts} attempts")
+                    result = _create_error_result(demos_by_file[job_key], error, 0.0)
+                    results_by_file[job_key] = result
+                    self._record_result(demos_by_file[job_key], result)
+            
+            if len(results_by_file) >= len(demos):
+                break
+            
+            waited = time.time() - self.start_time
+            counts = queue.counts(run_id)
+            if waited >= timeout:
+                reason = f"Distributed run did not finish within {timeout:.0f}s"
+            elif counts[WorkQueue.PENDING] == len(demos) and waited >= worker_wait:
+                reason = f"No worker claimed a job within {worker_wait:.0f}s"
+            else:
+                reason = None
+            if reason:
+                self._give_up_distributed(queue, run_id, reason, demos, results_by_file)
+                break
+            
+            # Replace local workers that exited while jobs are still queued
+            if local_workers and not any(w.is_alive() for w in workers) and counts[WorkQueue.PENDING]:
+                self.logger.warning("All local workers exited with jobs pending, starting a replacement")
+                start_local_worker()
+            
+            time.sleep(poll_interval)
+        
+        for worker in workers:
+            worker.join(timeout=poll_interval)
+        
+        self.results = [results_by_file[d["file"]] for d in demos]
+        return self.results
+    
+    def _give_up_distributed(self, queue: WorkQueue, run_id: str, reason: str,
+                             demos: List[Dict[str, Any]], results_by_file: Dict[str, DemoResult]):
+        """Withdraw the unclaimed jobs of a run and fail the demos without a result."""
+        cancelled = queue.cancel(run_id)
+        self.logger.error(f"{reason}; withdrew {cancelled} unclaimed job(s)")
+        print(f"❌ {reason}")
+        for demo_info in demos:
+            if demo_info["file"] not in results_by_file:
+                result = _create_error_result(demo_info, TimeoutError(reason), 0.0)
+                results_by_file[demo_info["file"]] = result
+                self._record_result(demo_info, result)
+    
+    def _run_demos_sequentially(self, demos: List[Dict[str, Any]]) -> List[DemoResult]:
+        """Run demos one after another in the given order."""
         results = []
         
-        for i, demo_info in enumerate(available_demos, 1):
+        for i, demo_info in enumerate(demos, 1):
             print(f"\n{'='*80}")
-            print(f"Demo {i}/{len(available_demos)}: {demo_info['name']}")
+            print(f"Demo {i}/{len(demos)}: {demo_info['name']}")
             print(f"File: {demo_info['file']}")
             print(f"Category: {demo_info['category']}")
             print(f"Estimated duration: {demo_info['estimated_duration']}s")
@@ -259,133 +625,302 @@ class DemoSuiteOrchestrator:
             
             result = self.run_single_demo(demo_info)
             results.append(result)
-            
-            # Brief pause between demos
-            time.sleep(2)
         
-        self.results = results
         return results
     
-    def generate_comprehensive_report(self) -> str:
-        """Generate a comprehensive report of all demo results."""
-        if not self.results:
-            return "No demo results available"
+    def _run_demos_concurrently(self, demos: List[Dict[str, Any]], jobs: int) -> List[DemoResult]:
+        """
+        Run demos on a bounded pool, longest estimated duration first.
         
-        total_duration = time.time() - self.start_time if self.start_time else 0
-        successful_demos = [r for r in self.results if r.success]
-        failed_demos = [r for r in self.results if not r.success]
-        
-        # Create report
-        report = f"""
-Nova Act Demo Suite Comprehensive Report
-{'='*80}
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Total Execution Time: {total_duration:.2f} seconds
-
-SUMMARY
-{'='*40}
-Total Demos: {len(self.results)}
-Successful: {len(successful_demos)}
-Failed: {len(failed_demos)}
-Success Rate: {len(successful_demos)/len(self.results)*100:.1f}%
-
-ENVIRONMENT INFORMATION
-{'='*40}
-"""
+        Starting the longest demos first (LPT scheduling) keeps short demos
+        available to fill idle workers at the end of the run, so wall-clock
+        time approaches the longest single demo rather than the sum.
+        """
+        schedule = sorted(demos, key=lambda d: d.get("estimated_duration", 0), reverse=True)
+        max_workers = min(jobs, len(schedule))
+        estimated_total = sum(d.get("estimated_duration", 0) for d in schedule)
         
-        env_info = self.config_manager.detect_environment()
-        report += f"Country: {env_info.country_code}\n"
-        report += f"Region: {env_info.region}\n"
-        report += f"Platform: {env_info.platform}\n"
-        report += f"Python Version: {env_info.python_version}\n"
-        report += f"VPN Detected: {env_info.has_vpn}\n"
-        
-        if successful_demos:
-            report += f"\n✅ SUCCESSFUL DEMOS ({len(successful_demos)})\n"
-            report += "="*40 + "\n"
-            for demo in successful_demos:
-                report += f"• {demo.demo_name}\n"
-                report += f"  Duration: {demo.execution_time:.2f}s\n"
-                report += f"  Steps: {demo.steps_completed}/{demo.steps_total}\n"
-                if demo.warnings:
-                    report += f"  Warnings: {len(demo.warnings)}\n"
-                report += "\n"
-        
-        if failed_demos:
-            report += f"\n❌ FAILED DEMOS ({len(failed_demos)})\n"
-            report += "="*40 + "\n"
-            for demo in failed_demos:
-                report += f"• {demo.demo_name}\n"
-                report += f"  Duration: {demo.execution_time:.2f}s\n"
-                report += f"  Errors: {len(demo.errors)}\n"
-                
-                for error in demo.errors:
-                    report += f"    - {error.error_type}: {error.message}\n"
-                    if error.troubleshooting_tips:
-                        report += "      Troubleshooting:\n"
-                        for tip in error.troubleshooting_tips:
-                            report += f"        * {tip}\n"
-                report += "\n"
-        
-        # Recommendations
-        report += "\nRECOMMENDATIONS\n"
-        report += "="*40 + "\n"
-        
-        if len(successful_demos) == len(self.results):
-            report += "🎉 All demos completed successfully!\n"
-            report += "• Your environment is well-configured for Nova Act\n"
-            report += "• Consider exploring advanced features and customizations\n"
-            report += "• Try running demos with different configurations\n"
-        else:
-            report += "⚠️ Some demos encountered issues:\n"
-            
-            # Analyze common failure patterns
-            error_types = {}
-            for demo in failed_demos:
-                for error in demo.errors:
-                    error_types[error.error_type] = error_types.get(error.error_type, 0) + 1
-            
-            if error_types:
-                report += "\nCommon Issues:\n"
-                for error_type, count in sorted(error_types.items(), key=lambda x: x[1], reverse=True):
-                    report += f"• {error_type}: {count} occurrence(s)\n"
+        print(f"\n{'='*80}")
+        print(f"Running {len(schedule)} demos with {max_workers} concurrent jobs")
+        print(f"Schedule (longest first): {', '.join(d['file'] for d in schedule)}")
+        print(f"Estimated sequential duration: {estimated_total}s")
+        print(f"{'='*80}")
+        self.logger.info(f"Concurrent scheduler: {max_workers} jobs, order: {[d['file'] for d in schedule]}")
+        
+        results_by_demo = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="demo") as executor:
+            future_to_demo = {
+                executor.submit(self.run_single_demo, demo_info): demo_info
+                for demo_info in schedule
+            }
             
-            # Geographic recommendations
-            if env_info.region != "north_america":
-                report += "\n• Consider that some sites may have geographic restrictions\n"
-                report += "• The framework automatically tries alternative sites\n"
-                report += "• VPN usage may help if legally permitted in your jurisdiction\n"
+            try:
+                for future in as_completed(future_to_demo):
+                    demo_info = future_to_demo[future]
+                    result = future.result()  # run_single_demo never raises
+                    results_by_demo[id(demo_info)] = result
+                    status = "✅" if result.success else "❌"
+                    print(f"{status} [{len(results_by_demo)}/{len(schedule)}] {demo_info['name']} "
+                          f"({result.execution_time:.2f}s)")
+            except KeyboardInterrupt:
+                # Let running demos close their browsers instead of abandoning them
+                print("\n🛑 Interrupted - cancelling running demos...")
+                for future in future_to_demo:
+                    future.cancel()
+                self.cancel_running("Suite interrupted")
+                raise
+        
+        # Report results in the same priority order as a sequential run
+        return [results_by_demo[id(d)] for d in demos]
+    
+    def _run_demos_in_processes(self, demos: List[Dict[str, Any]], jobs: int,
+                                recycle_after: int) -> List[DemoResult]:
+        """
+        Run demos in a pool of isolated worker processes, longest first.
+        
+        Each worker imports and runs BaseDemo subclasses in its own
+        interpreter, so browser state, logger handlers and memory do not
+        accumulate in the orchestrator. A worker exits after running
+        recycle_after demos and the pool starts a fresh one.
+        """
+        schedule = sorted(demos, key=lambda d: d.get("estimated_duration", 0), reverse=True)
+        max_workers = max(1, min(jobs, len(schedule)))
+        
+        pool_options = {
+            "max_workers": max_workers,
+            "initializer": _init_demo_worker,
+            "initargs": (self.config_manager.detect_environment(),),
+            "mp_context": multiprocessing.get_context("spawn"),
+        }
+        if sys.version_info >= (3, 11):
+            pool_options["max_tasks_per_child"] = recycle_after
+        else:
+            self.logger.warning("Worker recycling requires Python 3.11+, workers will be reused")
+        
+        print(f"\n{'='*80}")
+        print(f"Running {len(schedule)} demos in {max_workers} worker processes "
+              f"(recycled every {recycle_after} demo(s))")
+        print(f"Schedule (longest first): {', '.join(d['file'] for d in schedule)}")
+        print(f"{'='*80}")
+        self.logger.info(f"Process pool: {max_workers} workers, recycle after {recycle_after} demos")
+        
+        results_by_demo = {}
+        
+        with ProcessPoolExecutor(**pool_options) as executor:
+            future_to_demo = {}
+            for demo_info in schedule:
+                self.logger.info(f"Starting demo: {demo_info['name']}")
+                config = self._demo_config(demo_info)
+                future = executor.submit(execute_demo, demo_info, config)
+                future_to_demo[future] = (demo_info, time.time())
             
-            report += "\n• Check individual demo logs for detailed troubleshooting\n"
-            report += "• Verify your internet connection and API key\n"
-            report += "• Try running failed demos individually for better debugging\n"
+            for future in as_completed(future_to_demo):
+                demo_info, submitted_at = future_to_demo[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Worker died (e.g. BrokenProcessPool) or result could not be unpickled
+                    result = _create_error_result(demo_info, e, time.time() - submitted_at)
+                
+                results_by_demo[id(demo_info)] = result
+                self._record_result(demo_info, result)
+                status = "✅" if result.success else "❌"
+                print(f"{status} [{len(results_by_demo)}/{len(schedule)}] {demo_info['name']} "
+                      f"({result.execution_time:.2f}s)")
         
-        # Save report to file
-        report_file = f"demo/logs/comprehensive_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        try:
-            with open(report_file, 'w', encoding='utf-8') as f:
-                f.write(report)
+        return [results_by_demo[id(d)] for d in demos]
+    
+    def generate_comprehensive_report(self) -> str:
+        """
+        Finalize the report files and return the summary for the console.
+        
+        The report files were streamed while demos ran, so the details of
+        successful demos are in them; the console summary is built from the
+        writer's running totals and lists only the failed demos.
+        """
+        total_duration = time.time() - self.start_time if self.start_time else 0
+        
+        if self.report_writer:
+            stats = self.report_writer.stats
+            report_file = self.report_writer.close(total_duration)
             self.logger.info(f"Comprehensive report saved to: {report_file}")
-        except Exception as e:
-            self.logger.error(f"Failed to save report: {e}")
+            self.logger.info(f"Machine-readable results: {self.report_writer.jsonl_path}, "
+                             f"{self.report_writer.csv_path}")
+        else:
+            report_file = None
+            stats = ReportStats()
+            for result in self.results:
+                stats.add(result)
+        
+        if not stats.total:
+            return "No demo results available"
+        
+        env_info = self.env_info or self.config_manager.detect_environment()
+        lines = [
+            "",
+            "Nova Act Demo Suite Summary",
+            "=" * 80,
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        ]
+        lines += format_summary(stats, total_duration)
+        lines += format_environment(env_info)
+        
+        if stats.failures:
+            lines += ["", f"❌ FAILED DEMOS ({stats.failed})", "=" * 40]
+            for result in stats.failures:
+                lines += format_result(result)
+        
+        lines += format_recommendations(stats, env_info)
         
-        return report
+        open_sites = get_circuit_breakers().open_domains()
+        if open_sites:
+            lines += ["", f"🚧 Sites skipped after repeated failures: {', '.join(open_sites)}"]
+        if report_file:
+            lines += ["", f"📄 Details of every demo: {report_file}"]
+        
+        return "\n".join(lines)
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """Parse command line arguments for the demo suite runner."""
+    parser = argparse.ArgumentParser(description="Run the Nova Act demo suite")
+    parser.add_argument(
+        "demos", nargs="*",
+        help="Demo files to run (default: all available demos)"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="Number of demos to run concurrently, longest first (default: 1)"
+    )
+    parser.add_argument(
+        "--isolation", choices=["thread", "process"], default="thread",
+        help="Run demos in this process (thread) or in worker processes (process)"
+    )
+    parser.add_argument(
+        "--recycle-after", type=int, default=1, metavar="N",
+        help="With --isolation process, replace a worker after N demos (default: 1)"
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="Skip demos that already succeeded according to the results journal"
+    )
+    parser.add_argument(
+        "--journal", default="demo/journal/suite_journal.jsonl", metavar="PATH",
+        help="Results journal used for --resume (default: demo/journal/suite_journal.jsonl)"
+    )
+    parser.add_argument(
+        "--queue", metavar="PATH",
+        help="Run through a shared SQLite work queue instead of in this process"
+    )
+    parser.add_argument(
+        "--worker", action="store_true",
+        help="With --queue, run as a worker that claims and runs queued demos"
+    )
+    parser.add_argument(
+        "--local-workers", type=int, default=0, metavar="N",
+        help="With --queue, start N worker processes on this machine (default: 0)"
+    )
+    parser.add_argument(
+        "--run-id", metavar="ID",
+        help="With --worker, only run jobs of this coordinator run (default: the newest run with pending jobs)"
+    )
+    parser.add_argument(
+        "--queue-timeout", type=float, metavar="SECONDS",
+        help="With --queue, stop waiting for workers after this long (default: sum of the demo deadlines)"
+    )
+    parser.add_argument(
+        "--worker-wait", type=float, default=DEFAULT_WORKER_WAIT, metavar="SECONDS",
+        help=f"With --queue, give up if no worker has claimed a job after this long (default: {DEFAULT_WORKER_WAIT})"
+    )
+    parser.add_argument(
+        "--idle-timeout", type=float, default=60.0, metavar="SECONDS",
+        help="With --worker, exit after the queue has been empty this long (default: 60)"
+    )
+    parser.add_argument(
+        "--demo-timeout", type=float, metavar="SECONDS",
+        help="Deadline for each demo, 0 for none (default: from duration history, else "
+             f"{DEFAULT_DEMO_DEADLINE}s)"
+    )
+    parser.add_argument(
+        "--no-step-cache", action="store_true",
+        help="Run every step instead of reusing cached probe results"
+    )
+    parser.add_argument(
+        "--clear-step-cache", action="store_true",
+        help="Delete cached step results before running"
+    )
+    parser.add_argument(
+        "--act-cache", action="store_true",
+        help="Answer extractions repeated on unchanged pages from the act result cache"
+    )
+    parser.add_argument(
+        "--clear-act-cache", action="store_true",
+        help="Delete cached act results before running"
+    )
+    args = parser.parse_args(argv)
+    if args.worker and not args.queue:
+        parser.error("--worker requires --queue")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.recycle_after < 1:
+        parser.error("--recycle-after must be at least 1")
+    return args
 
 
 def main():
     """Main function to run the demo suite."""
+    args = parse_args()
+    
+    if args.worker:
+        print(f"Nova Act Demo Worker ({args.queue})")
+        print("="*50)
+        completed = run_queue_worker(args.queue, idle_timeout=args.idle_timeout, run_id=args.run_id)
+        print(f"\n🔧 Worker finished after running {completed} demo(s)")
+        sys.exit(0)
+    
     print("Enhanced Nova Act Demo Suite Runner")
     print("="*50)
     
+    if args.clear_step_cache:
+        removed = StepCache().invalidate()
+        print(f"🧹 Removed {removed} cached step result(s)")
+    if args.clear_act_cache:
+        removed = ActCache().invalidate()
+        print(f"🧹 Removed {removed} cached act result(s)")
+    
+    config_overrides = {}
+    if args.no_step_cache:
+        config_overrides["use_step_cache"] = False
+    if args.act_cache:
+        config_overrides["use_act_cache"] = True
+    if args.demo_timeout is not None:
+        config_overrides["deadline_seconds"] = args.demo_timeout
+    
     # Create orchestrator
-    orchestrator = DemoSuiteOrchestrator()
+    orchestrator = DemoSuiteOrchestrator(journal_path=args.journal, config_overrides=config_overrides)
     
     # Validate environment
     if not orchestrator.validate_environment():
         sys.exit(1)
     
     # Run all demos
-    results = orchestrator.run_all_demos()
+    if args.queue:
+        results = orchestrator.run_distributed(
+            args.queue,
+            selected_demos=args.demos or None,
+            local_workers=args.local_workers,
+            timeout=args.queue_timeout,
+            worker_wait=args.worker_wait
+        )
+    else:
+        results = orchestrator.run_all_demos(
+            selected_demos=args.demos or None,
+            jobs=args.jobs,
+            isolation=args.isolation,
+            recycle_after=args.recycle_after,
+            resume=args.resume
+        )
     
     # Generate and display report
     report = orchestrator.generate_comprehensive_report()
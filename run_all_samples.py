@@ -6,10 +6,18 @@ Script to run all sample demos based on official README
 
 import os
 import sys
-import subprocess
+import signal
+import asyncio
+import argparse
 import time
 from datetime import datetime
 
+from demo_framework.rate_limiter import get_rate_limiter
+from demo_framework.duration_history import DurationHistory
+
+SAMPLE_LOG_DIR = "demo/logs/samples"
+KILL_GRACE_SECONDS = 5
+
 def check_api_key():
     """Check API key"""
     api_key = os.getenv('NOVA_ACT_API_KEY')
@@ -23,6 +31,184 @@ def check_api_key():
     print(f"✅ API Key: {api_key[:8]}...")
     return True
 
+async def _stream_output(stream, prefix, log_file, echo=True):
+    """Copy a child's output line by line into its log file and the console."""
+    while True:
+        line = await stream.readline()
+        if not line:
+            break
+        text = line.decode("utf-8", errors="replace").rstrip("\n")
+        log_file.write(f"{prefix} {text}\n")
+        log_file.flush()
+        if echo:
+            print(f"{prefix} {text}", flush=True)
+
+async def _terminate_process_group(process, own_group=True):
+    """
+    Stop a sample and, if it runs in its own process group, every process
+    it started (e.g. browsers).
+    
+    Args:
+        process: Sample process
+        own_group: The sample was started in a new session (see run_sample_async)
+    """
+    if process.returncode is not None:
+        return
+    
+    use_group = own_group and hasattr(os, "killpg")
+    try:
+        if use_group:
+            os.killpg(process.pid, signal.SIGTERM)
+        else:
+            process.terminate()
+        await asyncio.wait_for(process.wait(), timeout=KILL_GRACE_SECONDS)
+    except asyncio.TimeoutError:
+        if use_group:
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+        await process.wait()
+    except ProcessLookupError:
+        pass
+
+async def run_sample_async(sample, semaphore=None, log_dir=SAMPLE_LOG_DIR, echo=True):
+    """
+    Run a sample in its own process group, streaming output to a log file.
+    
+    Interactive samples stay in the terminal's foreground process group
+    instead, so they can read passwords from the terminal and get Ctrl-C;
+    on timeout only the sample process itself is killed.
+    
+    Args:
+        sample: Sample metadata dict with "file", "name" and "timeout"
+        semaphore: Optional asyncio.Semaphore bounding concurrent samples
+        log_dir: Directory for per-sample log files
+        echo: Also print prefixed output lines to the console
+        
+    Returns:
+        dict: {"success", "duration", "returncode", "timed_out", "log_file"}
+    """
+    semaphore = semaphore or asyncio.Semaphore(1)
+    
+    async with semaphore:
+        os.makedirs(log_dir, exist_ok=True)
+        stem = os.path.splitext(os.path.basename(sample["file"]))[0]
+        log_path = os.path.join(log_dir, f"{stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+        timeout = sample.get("timeout", 120)
+        
+        # Pace sample start-up through the shared API key bucket instead of a fixed rest
+        await asyncio.get_running_loop().run_in_executor(
+            None, get_rate_limiter().acquire, None, os.getenv('NOVA_ACT_API_KEY')
+        )
+        
+        print(f"🚀 Starting {sample['name']} (timeout {timeout}s) → {log_path}")
+        start = time.time()
+        timed_out = False
+        
+        interactive = bool(sample.get("interactive"))
+        with open(log_path, "w", encoding="utf-8") as log_file:
+            if interactive:
+                # Prompts are not newline-terminated, so interactive samples
+                # keep the terminal instead of being streamed line by line
+                log_file.write(f"[{stem}] Interactive sample - output shown on the terminal\n")
+                pipes = {}
+            else:
+                pipes = {
+                    "stdin": asyncio.subprocess.DEVNULL,
+                    "stdout": asyncio.subprocess.PIPE,
+                    "stderr": asyncio.subprocess.PIPE,
+                }
+            
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, "-u", sample["file"],
+                start_new_session=not interactive,
+                **pipes
+            )
+            readers = []
+            if process.stdout:
+                readers.append(asyncio.create_task(_stream_output(process.stdout, f"[{stem}]", log_file, echo)))
+            if process.stderr:
+                readers.append(asyncio.create_task(_stream_output(process.stderr, f"[{stem}:err]", log_file, echo)))
+            
+            try:
+                await asyncio.wait_for(process.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                timed_out = True
+                await _terminate_process_group(process, own_group=not interactive)
+            except asyncio.CancelledError:
+                await _terminate_process_group(process, own_group=not interactive)
+                raise
+            finally:
+                await asyncio.gather(*readers, return_exceptions=True)
+            
+            duration = time.time() - start
+            if timed_out:
+                log_file.write(f"[{stem}] ⏰ Killed after timeout (>{timeout}s)\n")
+        
+        success = not timed_out and process.returncode == 0
+        if timed_out:
+            killed = "process killed" if interactive else "process group killed"
+            print(f"⏰ {sample['name']} timeout (>{timeout}s) - {killed}")
+        elif success:
+            print(f"✅ {sample['name']} successful! ({duration:.1f}s)")
+        else:
+            print(f"❌ {sample['name']} failed with exit code {process.returncode} - see {log_path}")
+        
+        return {
+            "success": success,
+            "duration": duration,
+            "returncode": process.returncode,
+            "timed_out": timed_out,
+            "log_file": log_path
+        }
+
+def apply_duration_history(samples, history):
+    """
+    Replace static sample timeouts with ones derived from recorded durations.
+    
+    Interactive samples wait on the user, so their history is not used.
+    """
+    for sample in samples:
+        if sample.get("interactive"):
+            continue
+        sample["static_timeout"] = sample.get("static_timeout", sample["timeout"])
+        sample["timeout"] = history.timeout(sample["file"], sample["static_timeout"])
+        sample["estimated_duration"] = history.estimate(sample["file"], sample["static_timeout"])
+
+async def run_samples_async(samples, jobs=4, history=None):
+    """
+    Run samples concurrently, at most `jobs` at a time.
+    
+    Non-interactive samples start longest-first by estimated duration.
+    Interactive samples share the terminal's stdin, so they run one at a
+    time after the non-interactive batch has finished.
+    
+    Returns:
+        list: Result dicts in the same order as `samples`
+    """
+    semaphore = asyncio.Semaphore(jobs)
+    batch = sorted(
+        (s for s in samples if not s.get("interactive")),
+        key=lambda s: s.get("estimated_duration", s.get("timeout", 0)),
+        reverse=True
+    )
+    interactive = [s for s in samples if s.get("interactive")]
+    
+    outcomes = {}
+    batch_results = await asyncio.gather(
+        *(run_sample_async(sample, semaphore) for sample in batch)
+    )
+    for sample, outcome in zip(batch, batch_results):
+        outcomes[sample["file"]] = outcome
+        if history and outcome["success"]:
+            history.record_duration(sample["file"], outcome["duration"])
+    
+    for sample in interactive:
+        print(f"\n🎮 {sample['name']} is interactive - running in the foreground")
+        outcomes[sample["file"]] = await run_sample_async(sample)
+    
+    return [outcomes[sample["file"]] for sample in samples]
+
 def run_sample(sample_file, sample_name, timeout=120):
     """Run a sample with timeout"""
     print(f"\n{'='*60}")
@@ -31,27 +217,33 @@ def run_sample(sample_file, sample_name, timeout=120):
     print(f"⏱️ Timeout: {timeout}s")
     
     try:
-        result = subprocess.run([sys.executable, sample_file], 
-                              capture_output=True, text=True, timeout=timeout)
-        
-        if result.returncode == 0:
-            print(result.stdout)
-            print(f"✅ {sample_name} successful!")
-            return True
-        else:
-            print(f"❌ {sample_name} failed:")
-            print(result.stderr)
-            return False
-            
-    except subprocess.TimeoutExpired:
-        print(f"⏰ {sample_name} timeout (>{timeout}s)")
-        print("💡 This sample may need more time")
-        return False
+        outcome = asyncio.run(run_sample_async(
+            {"file": sample_file, "name": sample_name, "timeout": timeout, "interactive": True}
+        ))
+        return outcome["success"]
     except Exception as e:
         print(f"❌ Error running {sample_name}: {e}")
         return False
 
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Run all official Nova Act samples")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=4,
+        help="Maximum number of non-interactive samples running at once (default: 4)"
+    )
+    parser.add_argument(
+        "-y", "--yes", action="store_true",
+        help="Skip the confirmation prompt"
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
 def main():
+    args = parse_args()
+    
     print("🎯 Nova Act - Official Sample Demos")
     print("=" * 60)
     print("📚 Based on official README: https://github.com/aws/nova-act")
@@ -92,7 +284,8 @@ def main():
             "description": "Persistent browser state with user_data_dir",
             "timeout": 240,
             "difficulty": "⭐⭐⭐",
-            "features": ["user_data_dir", "Session persistence", "BOOL_SCHEMA"]
+            "features": ["user_data_dir", "Session persistence", "BOOL_SCHEMA"],
+            "interactive": True
         },
         {
             "file": "sample_05_sensitive_data.py",
@@ -100,7 +293,8 @@ def main():
             "description": "Handle passwords and sensitive information safely",
             "timeout": 180,
             "difficulty": "⭐⭐",
-            "features": ["getpass", "Playwright keyboard", "CAPTCHA handling"]
+            "features": ["getpass", "Playwright keyboard", "CAPTCHA handling"],
+            "interactive": True
         },
         {
             "file": "sample_06_file_operations.py",
@@ -124,10 +318,15 @@ def main():
             "description": "Interactive control and debugging",
             "timeout": 300,
             "difficulty": "⭐⭐",
-            "features": ["Interactive session", "Step-by-step", "Debugging"]
+            "features": ["Interactive session", "Step-by-step", "Debugging"],
+            "interactive": True
         }
     ]
     
+    # Timeouts and start order from durations of previous successful runs
+    history = DurationHistory("demo/history/sample_durations.json")
+    apply_duration_history(samples, history)
+    
     # Statistics
     total_count = len(samples)
     
@@ -145,50 +344,39 @@ def main():
     print("• Results may vary depending on when you run them")
     
     # Confirm run
-    response = input(f"\n❓ Do you want to run all {total_count} samples? (y/N): ")
-    if response.lower() != 'y':
-        print("❌ Cancelled running samples")
-        return
+    if not args.yes:
+        response = input(f"\n❓ Do you want to run all {total_count} samples? (y/N): ")
+        if response.lower() != 'y':
+            print("❌ Cancelled running samples")
+            return
     
-    print(f"\n⏱️ Starting samples...")
+    print(f"\n⏱️ Starting samples ({args.jobs} at a time, logs in {SAMPLE_LOG_DIR})...")
     start_time = time.time()
     
-    # Run each sample
-    success_count = 0
+    # Run samples concurrently, streaming output to per-sample logs
+    runnable = [sample for sample in samples if os.path.exists(sample["file"])]
+    for sample in samples:
+        if sample not in runnable:
+            print(f"❌ File not found: {sample['file']}")
+    
+    outcomes = dict(zip(
+        (sample["file"] for sample in runnable),
+        asyncio.run(run_samples_async(runnable, jobs=args.jobs, history=history))
+    ))
+    
     results = []
+    for sample in samples:
+        outcome = outcomes.get(sample["file"], {"success": False, "duration": 0})
+        results.append({
+            "name": sample["name"],
+            "success": outcome["success"],
+            "duration": outcome["duration"],
+            "difficulty": sample["difficulty"],
+            "features": sample["features"],
+            "log_file": outcome.get("log_file")
+        })
     
-    for i, sample in enumerate(samples, 1):
-        if os.path.exists(sample["file"]):
-            print(f"\n📊 Progress: {i}/{total_count}")
-            
-            sample_start = time.time()
-            success = run_sample(sample["file"], sample["name"], sample["timeout"])
-            sample_duration = time.time() - sample_start
-            
-            results.append({
-                "name": sample["name"],
-                "success": success,
-                "duration": sample_duration,
-                "difficulty": sample["difficulty"],
-                "features": sample["features"]
-            })
-            
-            if success:
-                success_count += 1
-            
-            # Rest between samples
-            if i < total_count:
-                print("⏸️ Resting 5 seconds before next sample...")
-                time.sleep(5)
-        else:
-            print(f"❌ File not found: {sample['file']}")
-            results.append({
-                "name": sample["name"],
-                "success": False,
-                "duration": 0,
-                "difficulty": sample["difficulty"],
-                "features": sample["features"]
-            })
+    success_count = sum(1 for result in results if result["success"])
     
     # Summary
     end_time = time.time()
@@ -211,6 +399,8 @@ def main():
         print(f"{status} {result['name']} {result['difficulty']}")
         print(f"   ⏱️ Duration: {duration_str}")
         print(f"   🔧 Features: {', '.join(result['features'][:2])}...")
+        if result.get("log_file"):
+            print(f"   📄 Log: {result['log_file']}")
     
     # Analyze results
     if success_count == total_count:
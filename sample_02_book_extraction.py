@@ -7,6 +7,7 @@ Demo structured information extraction from Wikipedia
 import os
 from pydantic import BaseModel
 from nova_act import NovaAct
+from demo_framework import ActCache
 
 class Book(BaseModel):
     title: str
@@ -15,6 +16,9 @@ class Book(BaseModel):
 class BookList(BaseModel):
     books: list[Book]
 
+# Opt in with NOVA_ACT_CACHE=1 to answer reruns on an unchanged page from disk
+act_cache = ActCache() if os.getenv("NOVA_ACT_CACHE") == "1" else None
+
 def get_books(year: int) -> BookList | None:
     """
     Get NYT bestseller books by year
@@ -28,10 +32,12 @@ def get_books(year: int) -> BookList | None:
             print(f"📖 Extracting books from year {year}...")
             
             # Use schema for structured data extraction
-            result = nova.act(
-                "Return the books in the Fiction list",
-                schema=BookList.model_json_schema()
-            )
+            prompt = "Return the books in the Fiction list"
+            schema = BookList.model_json_schema()
+            if act_cache:
+                result = act_cache.act(nova, prompt, schema=schema)
+            else:
+                result = nova.act(prompt, schema=schema)
             
             if not result.matches_schema:
                 print(f"❌ Data doesn't match schema for year {year}")
@@ -73,6 +79,7 @@ def main():
     print("   • Using Pydantic BaseModel")
     print("   • Schema validation with matches_schema")
     print("   • Structured data extraction")
+    print("   • Optional caching of extraction results (NOVA_ACT_CACHE=1)")
 
 if __name__ == "__main__":
     main()
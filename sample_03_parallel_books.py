@@ -7,7 +7,8 @@ Demo running multiple NovaAct instances in parallel
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pydantic import BaseModel
-from nova_act import NovaAct, ActError
+from nova_act import ActError
+from demo_framework import ActCache, AdaptiveLimiter, MemoryWatchdog, SessionPool
 
 class Book(BaseModel):
     title: str
@@ -16,18 +17,19 @@ class Book(BaseModel):
 class BookList(BaseModel):
     books: list[Book]
 
-def get_books(year: int) -> BookList | None:
+def get_books(limiter: AdaptiveLimiter, pool: SessionPool, year: int) -> BookList | None:
     """
     Get NYT bestseller books by year
     """
     try:
-        with NovaAct(
-            starting_page=f"https://en.wikipedia.org/wiki/List_of_The_New_York_Times_number-one_books_of_{year}#Fiction",
-            headless=True
-        ) as nova:
+        # Wait for the limiter to allow another browser, then borrow a warm
+        # headless one instead of starting a new one
+        with limiter.slot(), pool.session(
+            f"https://en.wikipedia.org/wiki/List_of_The_New_York_Times_number-one_books_of_{year}#Fiction"
+        ) as session:
             print(f"📖 Worker processing year {year}...")
             
-            result = nova.act(
+            result = session.act(
                 "Return the books in the Fiction list",
                 schema=BookList.model_json_schema()
             )
@@ -64,15 +66,33 @@ def main():
     all_books = []
     
     print(f"\n📋 Will collect books from {len(years)} years: {years}")
-    print("⚡ Using ThreadPoolExecutor with max_workers=3")
     
-    # Set max workers = maximum browser sessions
-    with ThreadPoolExecutor(max_workers=3) as executor:
+    # Start with 2 browsers at once and adapt: one more after a round of quick
+    # successes, half as many when a site throttles or times out
+    limiter = AdaptiveLimiter(
+        initial=2,
+        maximum=6,
+        on_change=lambda limit: print(f"🎚️ Concurrency limit now {limit}")
+    )
+    print(f"⚡ Using ThreadPoolExecutor with an adaptive limit of 2-{limiter.maximum} workers")
+    
+    # Opt in with NOVA_ACT_CACHE=1 to answer reruns on unchanged pages from disk
+    act_cache = ActCache() if os.getenv("NOVA_ACT_CACHE") == "1" else None
+    
+    # Size workers and sessions for the highest limit; the limiter decides how many run.
+    # Sessions are replaced between tasks after 10 tasks, 50 actions or 1.5 GB of memory
+    with MemoryWatchdog(limit_mb=1500) as watchdog, \
+            SessionPool(
+                size=limiter.maximum, max_uses=10, max_acts=50, watchdog=watchdog,
+                act=act_cache.act if act_cache else None,
+                on_recycle=lambda event: print(f"♻️ Recycled a browser session ({event['reason']})")
+            ) as pool, \
+            ThreadPoolExecutor(max_workers=limiter.maximum) as executor:
         print("\n🚀 Starting parallel processing...")
         
         # Submit all tasks
         future_to_year = {
-            executor.submit(get_books, year): year 
+            executor.submit(get_books, limiter, pool, year): year 
             for year in years
         }
         
@@ -94,6 +114,8 @@ def main():
     print("=" * 40)
     print(f"📚 Total books collected: {len(all_books)}")
     print(f"📅 From {len(years)} years: {years}")
+    print(f"🎚️ Peak concurrency: {limiter.peak_limit} browsers")
+    print(f"♻️ Browser sessions recycled: {len(pool.recycles)}")
     
     if all_books:
         print(f"\n📖 Sample books:")
@@ -105,7 +127,8 @@ def main():
     
     print(f"\n💡 This example demonstrates:")
     print("   • ThreadPoolExecutor for parallel processing")
-    print("   • Multiple NovaAct instances")
+    print("   • Warm NovaAct sessions reused across tasks (SessionPool)")
+    print("   • Adaptive (AIMD) concurrency instead of a fixed worker count")
     print("   • Error handling with ActError")
     print("   • Browser use map-reduce pattern")
 
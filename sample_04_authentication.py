@@ -7,6 +7,7 @@ Demo using user_data_dir to store sessions
 import os
 import tempfile
 from nova_act import NovaAct, BOOL_SCHEMA
+from demo_framework import ProfileTemplate
 
 def setup_authenticated_session():
     """Setup session with authentication"""
@@ -90,13 +91,17 @@ def demo_parallel_with_cloning(user_data_dir: str):
     
     from concurrent.futures import ThreadPoolExecutor
     
+    # The logged-in profile is the template; each worker gets a clone that
+    # hardlinks its unchanging files instead of a full copy
+    template = ProfileTemplate(user_data_dir)
+    
     def worker_task(worker_id: int):
         """Task for each worker"""
         try:
-            with NovaAct(
+            with template.cloned() as worker_data_dir, NovaAct(
                 starting_page="https://amazon.com/",
-                user_data_dir=user_data_dir,
-                clone_user_data_dir=True,  # Clone for parallel processing
+                user_data_dir=worker_data_dir,
+                clone_user_data_dir=False,  # Already a private clone
                 headless=True
             ) as nova:
                 print(f"🔄 Worker {worker_id} checking login...")
@@ -121,6 +126,10 @@ def demo_parallel_with_cloning(user_data_dir: str):
     print("📊 Parallel processing results:")
     for result in results:
         print(f"   • {result}")
+    
+    stats = template.stats
+    print(f"💾 Profile clones: {stats['linked']} files hardlinked, {stats['copied']} copied "
+          f"({stats['copied_bytes'] / 1024:.0f} KiB), {stats['skipped']} skipped")
 
 def main():
     """Demo authentication and persistent sessions"""
@@ -160,7 +169,7 @@ def main():
     print(f"\n💡 This example demonstrates:")
     print("   • user_data_dir for persistent sessions")
     print("   • clone_user_data_dir=False to preserve session")
-    print("   • clone_user_data_dir=True for parallel processing")
+    print("   • ProfileTemplate hardlinked clones for parallel processing")
     print("   • BOOL_SCHEMA for yes/no responses")
     print("   • Authentication state management")
     